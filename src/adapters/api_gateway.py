@@ -15,6 +15,7 @@ from urllib.parse import parse_qs, urlparse
 
 from .middleware import MiddlewarePipeline, MiddlewareContext, RequestContext, ResponseContext
 from ..domain.responses.api_response import ApiResponse, ResponseBuilder
+from ..domain.models.base import set_request_time, reset_request_time
 
 
 @dataclass
@@ -307,6 +308,9 @@ class ApiGateway:
             response=response
         )
         
+        # 整个请求内的实体共享请求时间戳
+        clock_token = set_request_time(request.timestamp)
+        
         try:
             # 查找匹配的路由
             route = self._find_route(path, method)
@@ -359,6 +363,8 @@ class ApiGateway:
             ).to_dict()
             
             return response
+        finally:
+            reset_request_time(clock_token)
     
     def _find_route(self, path: str, method: str) -> Optional[Route]:
         """查找匹配的路由
@@ -13,7 +13,7 @@
 """
 
 from typing import Any, Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from abc import ABC, abstractmethod
 
 from ..services.base import CommandHandler, CommandResult
@@ -270,12 +270,12 @@ class CharacterCommandHandler(CommandHandler):
             self._event_bus.publish(CharacterCreatedEvent(
                 character_name=character.name,
                 character_data={
-                    "abilities": character.abilities.__dict__,
+                    "abilities": asdict(character.abilities),
                     "hp": character.hp,
                     "max_hp": character.max_hp,
                     "position": character.position.to_tuple() if character.position else None,
-                    "proficient_skills": character.proficient_skills,
-                    "proficient_saves": character.proficient_saves
+                    "proficient_skills": list(character.proficient_skills),
+                    "proficient_saves": list(character.proficient_saves)
                 }
             ))
             
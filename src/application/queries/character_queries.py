@@ -13,7 +13,7 @@
 """
 
 from typing import Any, Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from abc import ABC, abstractmethod
 
 from ..services.base import QueryHandler, QueryResult
@@ -202,11 +202,11 @@ class CharacterQueryHandler(QueryHandler):
                 name=character.name,
                 hp=character.hp,
                 max_hp=character.max_hp,
-                abilities=character.abilities.__dict__,
+                abilities=asdict(character.abilities),
                 position=character.position.to_tuple() if character.position else None,
                 is_alive=character.is_alive,
-                proficient_skills=character.proficient_skills.copy(),
-                proficient_saves=character.proficient_saves.copy()
+                proficient_skills=list(character.proficient_skills),
+                proficient_saves=list(character.proficient_saves)
             )
             
             self._logger.info(f"Character retrieved: {query.character_name}")
@@ -444,11 +444,11 @@ class CharacterQueryHandler(QueryHandler):
                     name=character.name,
                     hp=character.hp,
                     max_hp=character.max_hp,
-                    abilities=character.abilities.__dict__,
+                    abilities=asdict(character.abilities),
                     position=character.position.to_tuple() if character.position else None,
                     is_alive=character.is_alive,
-                    proficient_skills=character.proficient_skills.copy(),
-                    proficient_saves=character.proficient_saves.copy()
+                    proficient_skills=list(character.proficient_skills),
+                    proficient_saves=list(character.proficient_saves)
                 )
                 character_infos.append(character_info)
             
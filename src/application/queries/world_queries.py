@@ -368,7 +368,7 @@ class WorldQueryHandler(QueryHandler):
                 has_acted=turn_state.has_acted,
                 movement_remaining=turn_state.movement_remaining,
                 reaction_available=turn_state.reaction_available,
-                turn_state=turn_state.__dict__
+                turn_state=turn_state.to_dict()
             )
             
             self._logger.info(f"Turn state retrieved: {target_character}")
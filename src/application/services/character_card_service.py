@@ -508,8 +508,8 @@ class CharacterCardService:
                     },
                     'hp': character.hp,
                     'max_hp': character.max_hp,
-                    'proficient_skills': character.proficient_skills,
-                    'proficient_saves': character.proficient_saves,
+                    'proficient_skills': list(character.proficient_skills),
+                    'proficient_saves': list(character.proficient_saves),
                     'inventory': character.inventory,
                 }
                 filename = f"{character.name}.png.json"
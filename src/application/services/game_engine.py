@@ -317,7 +317,7 @@ class GameEngineService(ApplicationService):
             "max_rounds": self._max_rounds,
             "require_hostiles": self._require_hostiles,
             "world_state": self._world.snapshot(),
-            "combat_state": self._world.combat.snapshot() if self._world.combat else None,
+            "combat_state": self._world.combat.snapshot(deep=True) if self._world.combat else None,
             "participants": self._get_active_participants()
         }
     
@@ -5,6 +5,7 @@
 遵循SOLID原则，特别是单一职责原则(SRP)和依赖倒置原则(DIP)。
 """
 
+import re
 import time
 from typing import List, Dict, Any, Optional, Tuple, Union
 from datetime import datetime
@@ -24,6 +25,9 @@ from .token_counter_service import TokenCounterService
 from .base import ApplicationService
 
 
+_VARIABLE_PATTERN = re.compile(r'\{([^}]+)\}')
+
+
 class PromptAssemblyService(ApplicationService):
     """提示组装服务
     
@@ -602,9 +606,7 @@ class PromptAssemblyService(ApplicationService):
         Returns:
             List[str]: 变量列表
         """
-        import re
-        pattern = r'\{([^}]+)\}'
-        return re.findall(pattern, text)
+        return _VARIABLE_PATTERN.findall(text)
     
     def _find_used_variables(self, text: str, variables: Dict[str, str]) -> Dict[str, str]:
         """查找文本中使用的变量
@@ -20,6 +20,7 @@ from .lorebook_dtos import (
     LorebookCreateDto,
     LorebookUpdateDto,
     LorebookEntryDto,
+    LorebookEntriesSoA,
     LorebookEntryCreateDto,
     LorebookEntryUpdateDto,
     LorebookImportDto,
@@ -62,6 +63,7 @@ __all__ = [
     "LorebookCreateDto",
     "LorebookUpdateDto",
     "LorebookEntryDto",
+    "LorebookEntriesSoA",
     "LorebookEntryCreateDto",
     "LorebookEntryUpdateDto",
     "LorebookImportDto",
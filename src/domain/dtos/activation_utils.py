@@ -0,0 +1,143 @@
+"""
+传说书激活预筛选工具
+
+该模块为激活流程提供候选条目的预筛选，将所有条目的关键词一次性打包为
+扁平的字面量片段，再用C层实现的子串查找生成候选掩码，只有命中的条目
+才需要进入逐个关键词（包括正则）的完整匹配。
+"""
+
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+from .lorebook_dtos import LorebookEntryDto
+
+
+# 通配符模式中除*以外仍按正则生效的元字符
+_REGEX_METACHARS = frozenset('.^$+?{}[]\\|()')
+
+
+@dataclass(frozen=True)
+class PackedKeywords:
+    """打包后的关键词数据
+
+    第i个条目的关键词片段位于 needles[offsets[i]:offsets[i + 1]]；
+    passthrough[i] 为True的条目无法预筛选，总是作为候选。
+    """
+    needles: Tuple[str, ...]
+    case_sensitive: Tuple[bool, ...]
+    offsets: Tuple[int, ...]
+    passthrough: Tuple[bool, ...]
+
+    def __len__(self) -> int:
+        return len(self.passthrough)
+
+
+def _literal_needle(pattern: str, keyword_type: str) -> str:
+    """提取关键词匹配所必需的字面量片段
+
+    精确与部分匹配要求模式本身出现在文本中；通配符匹配至少要求最长的
+    非通配片段出现在文本中。通配符模式会被转换为正则后整体匹配，含有
+    其他正则元字符时（如"dra.on*"，或"a|b*c"中的分支）字面量片段不再是
+    必要条件，此时放弃预筛选，避免漏判。
+
+    Args:
+        pattern: 关键词模式
+        keyword_type: 关键词类型
+
+    Returns:
+        str: 字面量片段，无法提取时返回空字符串
+    """
+    if keyword_type == "wildcard":
+        if not _REGEX_METACHARS.isdisjoint(pattern):
+            return ""
+        return max(pattern.split('*'), key=len)
+    return pattern
+
+
+def pack_keywords(entries: Sequence[LorebookEntryDto]) -> PackedKeywords:
+    """将条目的激活关键词打包为扁平结构
+
+    Args:
+        entries: 传说书条目DTO列表
+
+    Returns:
+        PackedKeywords: 打包后的关键词数据
+    """
+    needles: List[str] = []
+    case_sensitive: List[bool] = []
+    offsets: List[int] = [0]
+    passthrough: List[bool] = []
+
+    for entry in entries:
+        rule = entry.activation_rule
+        passes = rule.type == "always"
+
+        if rule.type in ("keyword", "regex"):
+            for keyword in rule.keywords:
+                needle = "" if keyword.type == "regex" else _literal_needle(keyword.pattern, keyword.type)
+                if not needle:
+                    # 正则或纯通配符无法提取字面量，交由完整匹配处理
+                    passes = True
+                    break
+                needles.append(needle if keyword.case_sensitive else needle.lower())
+                case_sensitive.append(keyword.case_sensitive)
+
+        offsets.append(len(needles))
+        passthrough.append(passes)
+
+    return PackedKeywords(
+        needles=tuple(needles),
+        case_sensitive=tuple(case_sensitive),
+        offsets=tuple(offsets),
+        passthrough=tuple(passthrough)
+    )
+
+
+def scan(text: str, packed: PackedKeywords) -> List[bool]:
+    """生成候选条目掩码
+
+    掩码为False的条目一定不会被关键词激活；为True的条目仍需完整匹配。
+
+    Args:
+        text: 激活文本
+        packed: 打包后的关键词数据
+
+    Returns:
+        List[bool]: 与条目一一对应的候选掩码
+    """
+    lowered = text.lower()
+    needles = packed.needles
+    case_sensitive = packed.case_sensitive
+    offsets = packed.offsets
+
+    mask: List[bool] = []
+    append = mask.append
+    for i, passes in enumerate(packed.passthrough):
+        if not passes:
+            for j in range(offsets[i], offsets[i + 1]):
+                if needles[j] in (text if case_sensitive[j] else lowered):
+                    passes = True
+                    break
+        append(passes)
+
+    return mask
+
+
+def prefilter_entries(
+    text: str,
+    entries: Sequence[LorebookEntryDto],
+    packed: PackedKeywords = None
+) -> List[LorebookEntryDto]:
+    """筛选可能被激活的候选条目
+
+    Args:
+        text: 激活文本
+        entries: 传说书条目DTO列表
+        packed: 预先打包的关键词数据，为None时即时打包
+
+    Returns:
+        List[LorebookEntryDto]: 候选条目列表
+    """
+    if packed is None:
+        packed = pack_keywords(entries)
+    return [entry for entry, hit in zip(entries, scan(text, packed)) if hit]
@@ -10,6 +10,10 @@ from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 
+# 支持导入的格式
+_SUPPORTED_IMPORT_FORMATS = frozenset({"json", "png_base64"})
+
+
 @dataclass
 class CharacterCardDto:
     """角色卡数据传输对象
@@ -54,11 +58,11 @@ class CharacterCardDto:
             name=character_card.name,
             description=character_card.card_info.description,
             first_message=character_card.card_info.first_message,
-            example_messages=character_card.card_info.example_messages,
+            example_messages=list(character_card.card_info.example_messages),
             scenario=character_card.card_info.scenario,
             personality_summary=character_card.card_info.personality_summary,
             creator_notes=character_card.card_info.creator_notes,
-            tags=character_card.card_info.tags,
+            tags=list(character_card.card_info.tags),
             abilities={
                 'strength': character_card.abilities.strength,
                 'dexterity': character_card.abilities.dexterity,
@@ -80,9 +84,9 @@ class CharacterCardDto:
                 'x': character_card.position.x,
                 'y': character_card.position.y,
             } if character_card.position else None,
-            proficient_skills=character_card.proficient_skills,
-            proficient_saves=character_card.proficient_saves,
-            conditions=[c.value for c in character_card.conditions],
+            proficient_skills=list(character_card.proficient_skills),
+            proficient_saves=list(character_card.proficient_saves),
+            conditions=character_card.condition_names,
             inventory=character_card.inventory,
             png_metadata={
                 'name': character_card.png_metadata.name,
@@ -307,7 +311,7 @@ class CharacterCardImportDto:
         if not self.data:
             errors.append("导入数据不能为空")
         
-        if self.format not in ["json", "png_base64"]:
+        if self.format not in _SUPPORTED_IMPORT_FORMATS:
             errors.append("不支持的导入格式")
         
         if self.format == "json":
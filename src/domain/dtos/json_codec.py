@@ -0,0 +1,156 @@
+"""
+DTO的JSON编解码
+
+该模块为数据传输对象提供直接序列化为JSON字节的能力。dataclass只展开为
+一层字段字典，嵌套对象、datetime与枚举交给orjson原生处理，省去to_dict
+逐层构建中间字典与格式化时间；未安装orjson时回退到标准库json，输出
+格式保持一致。
+"""
+
+import dataclasses
+import json
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 仅在缺少可选依赖时触发
+    orjson = None
+
+
+@lru_cache(maxsize=4096)
+def _isoformat(value: datetime, tzinfo: Any) -> str:
+    """以(时间, 时区)为键缓存isoformat结果"""
+    return value.isoformat()
+
+
+def format_datetime(value: datetime) -> str:
+    """格式化并缓存ISO格式时间字符串
+    
+    同一时间戳在多次to_dict中只格式化一次。不同时区的相等时间哈希
+    相同，因此时区也作为缓存键的一部分。
+    
+    Args:
+        value: 时间
+        
+    Returns:
+        str: ISO格式时间字符串
+    """
+    return _isoformat(value, value.tzinfo)
+
+
+@lru_cache(maxsize=None)
+def _dataclass_layout(cls: type) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+    """获取并缓存dataclass的字段名与值为None时省略的字段
+
+    Args:
+        cls: dataclass类
+
+    Returns:
+        Tuple[Tuple[str, ...], FrozenSet[str]]: (字段名, 省略的字段)
+    """
+    names = tuple(f.name for f in dataclasses.fields(cls))
+    return names, frozenset(getattr(cls, '_JSON_OMIT_NONE', ()))
+
+
+def _dataclass_fields(obj: Any) -> Dict[str, Any]:
+    """将dataclass实例展开为一层字段字典
+
+    字段值原样保留，由序列化器继续处理；_JSON_OMIT_NONE中的字段值为
+    None时省略，与to_dict只在有值时输出时间字段的形状一致。
+
+    Args:
+        obj: dataclass实例
+
+    Returns:
+        Dict[str, Any]: 字段字典
+    """
+    names, omit_none = _dataclass_layout(type(obj))
+    result = {}
+    for name in names:
+        value = getattr(obj, name)
+        if value is None and name in omit_none:
+            continue
+        result[name] = value
+    return result
+
+
+def _default(obj: Any) -> Any:
+    """序列化orjson/json无法原生处理的对象
+
+    Args:
+        obj: 待序列化对象
+
+    Returns:
+        Any: 可序列化的表示
+
+    Raises:
+        TypeError: 对象类型不受支持时抛出
+    """
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return _dataclass_fields(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """序列化为JSON字节
+
+    dataclass按字段输出，_JSON_OMIT_NONE中值为None的字段省略，
+    datetime使用ISO格式，枚举输出其值。
+
+    Args:
+        obj: 待序列化对象，通常为DTO实例
+
+    Returns:
+        bytes: UTF-8编码的JSON
+    """
+    if orjson is not None:
+        # dataclass交由_default展开，以便省略值为None的字段
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_PASSTHROUGH_DATACLASS)
+    return json.dumps(
+        obj, default=_default, ensure_ascii=False, separators=(',', ':')
+    ).encode('utf-8')
+
+
+def loads(data: bytes) -> Any:
+    """解析JSON字节
+
+    Args:
+        data: JSON字节或字符串
+
+    Returns:
+        Any: 解析结果
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class JsonSerializableMixin:
+    """为DTO提供to_json_bytes的混入类
+
+    子类在_JSON_OMIT_NONE中列出值为None时不输出的字段，使JSON字节与
+    to_dict的形状一致。
+    """
+
+    __slots__ = ()
+
+    _JSON_OMIT_NONE: Tuple[str, ...] = ()
+
+    def to_json_bytes(self) -> bytes:
+        """直接序列化为JSON字节
+
+        跳过to_dict的中间字典，适用于批量导出与HTTP响应。
+
+        Returns:
+            bytes: UTF-8编码的JSON
+        """
+        return dumps(self)
@@ -5,13 +5,129 @@
 特别是单一职责原则(SRP)，每个DTO都有明确的职责。
 """
 
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+import re
+import sys
+from array import array
+from dataclasses import FrozenInstanceError, dataclass, field, fields
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Pattern, Sequence, Union
 from datetime import datetime
 
+from .json_codec import JsonSerializableMixin, format_datetime as _format_datetime
+
+
+@lru_cache(maxsize=4096)
+def _compile_regex(pattern: str, case_sensitive: bool) -> Pattern:
+    """编译并缓存正则表达式
+
+    批量导入时同一关键词会被反复校验，缓存可避免重复解析正则。
+
+    Args:
+        pattern: 正则表达式
+        case_sensitive: 是否区分大小写
+
+    Returns:
+        Pattern: 编译后的正则表达式
+
+    Raises:
+        re.error: 正则表达式无效时抛出
+    """
+    return re.compile(pattern, 0 if case_sensitive else re.IGNORECASE)
+
+
+def _intern(value: Any) -> Any:
+    """驻留字符串
+
+    大型传说书中标签、类型、版本号等短字符串会重复成千上万次，
+    驻留后同值字符串共享同一对象，比较退化为指针判断。
+
+    Args:
+        value: 待驻留的值，非字符串原样返回
+
+    Returns:
+        Any: 驻留后的值
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def _intern_all(values: List[Any]) -> List[Any]:
+    """驻留字符串列表中的每一项
+
+    Args:
+        values: 字符串列表
+
+    Returns:
+        List[Any]: 驻留后的新列表
+    """
+    return [_intern(v) for v in values]
+
+
+def _compile_from_dict(cls, defaults: Dict[str, Any], converters: Optional[Dict[str, Any]] = None):
+    """为扁平DTO生成特化的from_dict
+    
+    根据dataclass字段一次性生成逐字段取值的源码并编译，生成的函数没有
+    循环和反射，默认值与转换函数作为常量绑定在其全局命名空间中。
+    默认值会在多次调用间共享，因此必须是不可变对象。
+    
+    Args:
+        cls: DTO类
+        defaults: 各字段在字典缺失时的默认值
+        converters: 可选的字段转换函数
+        
+    Returns:
+        classmethod: 生成的from_dict类方法
+    """
+    converters = converters or {}
+    namespace: Dict[str, Any] = {}
+    arguments = []
+    for f in fields(cls):
+        default = defaults[f.name]
+        if isinstance(default, (list, dict, set)):
+            raise TypeError(f"{cls.__name__}.{f.name} 的默认值必须是不可变对象")
+        namespace[f'_default_{f.name}'] = default
+        expression = f"get({f.name!r}, _default_{f.name})"
+        if f.name in converters:
+            namespace[f'_convert_{f.name}'] = converters[f.name]
+            expression = f"_convert_{f.name}({expression})"
+        arguments.append(f"{f.name}={expression}")
+    
+    source = (
+        "def from_dict(cls, data):\n"
+        "    get = data.get\n"
+        f"    return cls({', '.join(arguments)})\n"
+    )
+    exec(source, namespace)
+    from_dict = namespace['from_dict']
+    from_dict.__qualname__ = f"{cls.__name__}.from_dict"
+    from_dict.__doc__ = f"""从字典创建DTO
+    
+    Args:
+        data: 字典数据
+        
+    Returns:
+        {cls.__name__}: DTO实例
+    """
+    return classmethod(from_dict)
+
+
+@lru_cache(maxsize=8192)
+def _parse_datetime(value: str) -> datetime:
+    """解析并缓存ISO格式时间字符串
+
+    导出的传说书中大量条目共享相同的时间戳，ISO字符串到datetime的映射
+    是确定的且datetime不可变，因此缓存无需失效处理。
+
+    Args:
+        value: ISO格式时间字符串
+
+    Returns:
+        datetime: 解析后的时间
+    """
+    return datetime.fromisoformat(value)
+
 
 @dataclass
-class KeywordPatternDto:
+class KeywordPatternDto(JsonSerializableMixin):
     """关键词模式数据传输对象
     
     用于传输关键词匹配模式信息，遵循单一职责原则，
@@ -35,26 +151,22 @@ class KeywordPatternDto:
             'weight': self.weight
         }
     
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'KeywordPatternDto':
-        """从字典创建DTO
-        
-        Args:
-            data: 字典数据
-            
-        Returns:
-            KeywordPatternDto: 关键词模式DTO实例
-        """
-        return cls(
-            pattern=data.get('pattern', ''),
-            type=data.get('type', 'exact'),
-            case_sensitive=data.get('case_sensitive', False),
-            weight=data.get('weight', 1.0)
-        )
+
+
+# 字段固定且默认值均为不可变对象，from_dict在导入时生成为直线代码
+KeywordPatternDto.from_dict = _compile_from_dict(
+    KeywordPatternDto,
+    defaults={'pattern': '', 'type': 'exact', 'case_sensitive': False, 'weight': 1.0},
+    converters={'type': _intern}
+)
+
+
+# 支持导入的格式
+_SUPPORTED_IMPORT_FORMATS = frozenset({"json", "lorebook"})
 
 
 @dataclass
-class ActivationRuleDto:
+class ActivationRuleDto(JsonSerializableMixin):
     """激活规则数据传输对象
     
     用于传输条目激活规则信息，遵循单一职责原则，
@@ -74,7 +186,7 @@ class ActivationRuleDto:
         """
         return {
             'type': self.type,
-            'keywords': [keyword.to_dict() for keyword in self.keywords],
+            'keywords': list(map(KeywordPatternDto.to_dict, self.keywords)),
             'priority': self.priority,
             'max_activations': self.max_activations,
             'cooldown_seconds': self.cooldown_seconds
@@ -94,7 +206,7 @@ class ActivationRuleDto:
         keywords = [KeywordPatternDto.from_dict(k) for k in keywords_data]
         
         return cls(
-            type=data.get('type', 'keyword'),
+            type=_intern(data.get('type', 'keyword')),
             keywords=keywords,
             priority=data.get('priority', 0),
             max_activations=data.get('max_activations'),
@@ -102,8 +214,94 @@ class ActivationRuleDto:
         )
 
 
+class _FrozenActivationRuleDto(ActivationRuleDto):
+    """共享的默认激活规则
+    
+    条目DTO未显式指定激活规则时共享同一个实例，避免每次构造都分配
+    新的规则对象和关键词列表。实例不可修改，关键词为空元组；
+    与字段相同的ActivationRuleDto视为相等。
+    """
+    
+    __hash__ = object.__hash__
+    
+    def __init__(self, **changes: Any):
+        for f in fields(ActivationRuleDto):
+            default = () if f.name == 'keywords' else f.default
+            object.__setattr__(self, f.name, changes.get(f.name, default))
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"默认激活规则不可修改: {name}")
+    
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"默认激活规则不可修改: {name}")
+    
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ActivationRuleDto):
+            return NotImplemented
+        return (
+            self.type == other.type and
+            list(self.keywords) == list(other.keywords) and
+            self.priority == other.priority and
+            self.max_activations == other.max_activations and
+            self.cooldown_seconds == other.cooldown_seconds
+        )
+
+
+_DEFAULT_ACTIVATION_RULE = _FrozenActivationRuleDto()
+
+
+def _keyword_from_domain(keyword) -> KeywordPatternDto:
+    """将关键词模式领域对象转换为DTO
+    
+    Args:
+        keyword: 关键词模式领域对象
+        
+    Returns:
+        KeywordPatternDto: 关键词模式DTO实例
+    """
+    return KeywordPatternDto(
+        pattern=keyword.pattern,
+        type=keyword.type.value,
+        case_sensitive=keyword.case_sensitive,
+        weight=keyword.weight
+    )
+
+
+def _iter_activation_rule_errors(rule: ActivationRuleDto) -> Iterator[str]:
+    """逐个产出激活规则的验证错误
+    
+    创建与更新条目请求共用的校验逻辑，调用方只需判断是否有效时
+    可在第一个错误处停止。
+    
+    Args:
+        rule: 激活规则DTO
+        
+    Yields:
+        str: 验证错误信息
+    """
+    keywords = rule.keywords
+    if rule.type in ("keyword", "regex") and not keywords:
+        yield "关键词或正则激活类型必须指定关键词"
+    
+    max_activations = rule.max_activations
+    if max_activations is not None and max_activations <= 0:
+        yield "最大激活次数必须大于0"
+    
+    cooldown_seconds = rule.cooldown_seconds
+    if cooldown_seconds is not None and cooldown_seconds < 0:
+        yield "冷却时间不能小于0"
+    
+    # 验证关键词
+    for keyword in keywords:
+        if keyword.type == "regex":
+            try:
+                _compile_regex(keyword.pattern, keyword.case_sensitive)
+            except re.error:
+                yield f"无效的正则表达式: {keyword.pattern}"
+
+
 @dataclass
-class LorebookEntryDto:
+class LorebookEntryDto(JsonSerializableMixin):
     """传说书条目数据传输对象
     
     用于传输传说书条目信息，遵循单一职责原则，
@@ -113,7 +311,7 @@ class LorebookEntryDto:
     title: str
     content: str
     keywords: List[KeywordPatternDto] = field(default_factory=list)
-    activation_rule: ActivationRuleDto = field(default_factory=ActivationRuleDto)
+    activation_rule: ActivationRuleDto = _DEFAULT_ACTIVATION_RULE
     tags: List[str] = field(default_factory=list)
     is_active: bool = True
     activation_count: int = 0
@@ -122,6 +320,9 @@ class LorebookEntryDto:
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     
+    # 与to_dict一致，时间字段为None时不输出
+    _JSON_OMIT_NONE = ('last_activated_at', 'created_at', 'updated_at')
+    
     @classmethod
     def from_domain(cls, lorebook_entry) -> 'LorebookEntryDto':
         """从领域对象创建DTO
@@ -133,22 +334,21 @@ class LorebookEntryDto:
             LorebookEntryDto: 传说书条目DTO实例
         """
         # 转换关键词
-        keywords = [
-            KeywordPatternDto(
-                pattern=keyword.pattern,
-                type=keyword.type.value,
-                case_sensitive=keyword.case_sensitive,
-                weight=keyword.weight
-            ) for keyword in lorebook_entry.keywords
-        ]
-        
-        # 转换激活规则
+        keywords = list(map(_keyword_from_domain, lorebook_entry.keywords))
+        
+        # 转换激活规则，其关键词来自规则自身，与条目关键词一致时共享列表
+        domain_rule = lorebook_entry.activation_rule
+        if domain_rule.keywords is lorebook_entry.keywords or domain_rule.keywords == lorebook_entry.keywords:
+            rule_keywords = keywords
+        else:
+            rule_keywords = list(map(_keyword_from_domain, domain_rule.keywords))
+        
         activation_rule = ActivationRuleDto(
-            type=lorebook_entry.activation_rule.type.value,
-            keywords=keywords,
-            priority=lorebook_entry.activation_rule.priority,
-            max_activations=lorebook_entry.activation_rule.max_activations,
-            cooldown_seconds=lorebook_entry.activation_rule.cooldown_seconds
+            type=domain_rule.type.value,
+            keywords=rule_keywords,
+            priority=domain_rule.priority,
+            max_activations=domain_rule.max_activations,
+            cooldown_seconds=domain_rule.cooldown_seconds
         )
         
         return cls(
@@ -176,7 +376,7 @@ class LorebookEntryDto:
             'id': self.id,
             'title': self.title,
             'content': self.content,
-            'keywords': [keyword.to_dict() for keyword in self.keywords],
+            'keywords': list(map(KeywordPatternDto.to_dict, self.keywords)),
             'activation_rule': self.activation_rule.to_dict(),
             'tags': self.tags,
             'is_active': self.is_active,
@@ -185,11 +385,11 @@ class LorebookEntryDto:
         }
         
         if self.last_activated_at:
-            result['last_activated_at'] = self.last_activated_at.isoformat()
+            result['last_activated_at'] = _format_datetime(self.last_activated_at)
         if self.created_at:
-            result['created_at'] = self.created_at.isoformat()
+            result['created_at'] = _format_datetime(self.created_at)
         if self.updated_at:
-            result['updated_at'] = self.updated_at.isoformat()
+            result['updated_at'] = _format_datetime(self.updated_at)
         
         return result
     
@@ -212,15 +412,15 @@ class LorebookEntryDto:
         # 处理时间字段
         last_activated_at = None
         if data.get('last_activated_at'):
-            last_activated_at = datetime.fromisoformat(data['last_activated_at'])
+            last_activated_at = _parse_datetime(data['last_activated_at'])
         
         created_at = None
         if data.get('created_at'):
-            created_at = datetime.fromisoformat(data['created_at'])
+            created_at = _parse_datetime(data['created_at'])
         
         updated_at = None
         if data.get('updated_at'):
-            updated_at = datetime.fromisoformat(data['updated_at'])
+            updated_at = _parse_datetime(data['updated_at'])
         
         return cls(
             id=data.get('id', ''),
@@ -228,7 +428,7 @@ class LorebookEntryDto:
             content=data.get('content', ''),
             keywords=keywords,
             activation_rule=activation_rule,
-            tags=data.get('tags', []),
+            tags=_intern_all(data.get('tags', [])),
             is_active=data.get('is_active', True),
             activation_count=data.get('activation_count', 0),
             last_activated_at=last_activated_at,
@@ -239,7 +439,65 @@ class LorebookEntryDto:
 
 
 @dataclass
-class LorebookDto:
+class LorebookEntriesSoA:
+    """传说书条目列式视图
+    
+    将条目的标量字段按列存放在紧凑数组中，列表、统计等只访问少数字段的
+    查询无需遍历完整的条目对象；文本等大字段保留在并行的列表中。
+    """
+    ids: List[str] = field(default_factory=list)
+    titles: List[str] = field(default_factory=list)
+    is_active: array = field(default_factory=lambda: array('b'))
+    activation_count: array = field(default_factory=lambda: array('q'))
+    last_activated_at: List[Optional[datetime]] = field(default_factory=list)
+    
+    @classmethod
+    def from_entries(cls, entries: List[LorebookEntryDto]) -> 'LorebookEntriesSoA':
+        """从条目列表构建列式视图
+        
+        Args:
+            entries: 传说书条目DTO列表
+            
+        Returns:
+            LorebookEntriesSoA: 列式视图
+        """
+        return cls(
+            ids=[e.id for e in entries],
+            titles=[e.title for e in entries],
+            is_active=array('b', [e.is_active for e in entries]),
+            activation_count=array('q', [e.activation_count for e in entries]),
+            last_activated_at=[e.last_activated_at for e in entries]
+        )
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    @property
+    def active_count(self) -> int:
+        """活跃条目数量"""
+        return sum(self.is_active)
+    
+    @property
+    def total_activations(self) -> int:
+        """总激活次数"""
+        return sum(self.activation_count)
+    
+    @property
+    def average_activations(self) -> float:
+        """平均激活次数"""
+        return self.total_activations / len(self) if self.ids else 0.0
+    
+    def active_ids(self) -> List[str]:
+        """获取活跃条目ID列表
+        
+        Returns:
+            List[str]: 活跃条目ID列表
+        """
+        return [entry_id for entry_id, active in zip(self.ids, self.is_active) if active]
+
+
+@dataclass
+class LorebookDto(JsonSerializableMixin):
     """传说书数据传输对象
     
     用于传输传说书信息，遵循单一职责原则，
@@ -255,6 +513,9 @@ class LorebookDto:
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     
+    # 与to_dict一致，时间字段为None时不输出
+    _JSON_OMIT_NONE = ('created_at', 'updated_at')
+    
     @classmethod
     def from_domain(cls, lorebook) -> 'LorebookDto':
         """从领域对象创建DTO
@@ -292,16 +553,33 @@ class LorebookDto:
             'version': self.version,
             'tags': self.tags,
             'metadata': self.metadata,
-            'entries': [entry.to_dict() for entry in self.entries]
+            'entries': list(map(LorebookEntryDto.to_dict, self.entries))
         }
         
         if self.created_at:
-            result['created_at'] = self.created_at.isoformat()
+            result['created_at'] = _format_datetime(self.created_at)
         if self.updated_at:
-            result['updated_at'] = self.updated_at.isoformat()
+            result['updated_at'] = _format_datetime(self.updated_at)
         
         return result
     
+    def as_soa(self) -> LorebookEntriesSoA:
+        """获取条目的列式视图
+        
+        Returns:
+            LorebookEntriesSoA: 条目列式视图
+        """
+        return LorebookEntriesSoA.from_entries(self.entries)
+    
+    def to_packed_keywords(self):
+        """打包条目关键词，供激活预筛选使用
+        
+        Returns:
+            PackedKeywords: 打包后的关键词数据
+        """
+        from .activation_utils import pack_keywords
+        return pack_keywords(self.entries)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'LorebookDto':
         """从字典创建DTO
@@ -312,33 +590,98 @@ class LorebookDto:
         Returns:
             LorebookDto: 传说书DTO实例
         """
-        entries_data = data.get('entries', [])
-        entries = [LorebookEntryDto.from_dict(entry) for entry in entries_data]
+        return cls.from_dict_bulk(data)
+    
+    @classmethod
+    def from_dict_bulk(cls, data: Dict[str, Any]) -> 'LorebookDto':
+        """单次遍历从字典创建DTO
         
-        # 处理时间字段
-        created_at = None
-        if data.get('created_at'):
-            created_at = datetime.fromisoformat(data['created_at'])
+        将传说书、条目、关键词三层的解析内联到一个循环中，避免大型传说书
+        加载时逐层的classmethod分派和重复的属性查找。条目与其激活规则的
+        关键词数据相同时共享同一个关键词列表。
         
-        updated_at = None
-        if data.get('updated_at'):
-            updated_at = datetime.fromisoformat(data['updated_at'])
+        Args:
+            data: 字典数据
+            
+        Returns:
+            LorebookDto: 传说书DTO实例
+        """
+        parse_dt = _parse_datetime
+        intern = _intern
+        intern_all = _intern_all
+        keyword_cls = KeywordPatternDto
+        rule_cls = ActivationRuleDto
+        entry_cls = LorebookEntryDto
+        
+        def build_keywords(keywords_data):
+            return [
+                keyword_cls(
+                    pattern=k.get('pattern', ''),
+                    type=intern(k.get('type', 'exact')),
+                    case_sensitive=k.get('case_sensitive', False),
+                    weight=k.get('weight', 1.0)
+                ) for k in keywords_data
+            ]
+        
+        entries = []
+        append_entry = entries.append
+        for e in data.get('entries', ()):
+            get = e.get
+            keywords_data = get('keywords', [])
+            keywords = build_keywords(keywords_data)
+            
+            rule_data = get('activation_rule', {})
+            rule_keywords_data = rule_data.get('keywords', [])
+            if rule_keywords_data == keywords_data:
+                rule_keywords = keywords
+            else:
+                rule_keywords = build_keywords(rule_keywords_data)
+            
+            activation_rule = rule_cls(
+                type=intern(rule_data.get('type', 'keyword')),
+                keywords=rule_keywords,
+                priority=rule_data.get('priority', 0),
+                max_activations=rule_data.get('max_activations'),
+                cooldown_seconds=rule_data.get('cooldown_seconds')
+            )
+            
+            last_activated_at = get('last_activated_at')
+            created_at = get('created_at')
+            updated_at = get('updated_at')
+            
+            append_entry(entry_cls(
+                id=get('id', ''),
+                title=get('title', ''),
+                content=get('content', ''),
+                keywords=keywords,
+                activation_rule=activation_rule,
+                tags=intern_all(get('tags', [])),
+                is_active=get('is_active', True),
+                activation_count=get('activation_count', 0),
+                last_activated_at=parse_dt(last_activated_at) if last_activated_at else None,
+                metadata=get('metadata', {}),
+                created_at=parse_dt(created_at) if created_at else None,
+                updated_at=parse_dt(updated_at) if updated_at else None
+            ))
+        
+        created_at = data.get('created_at')
+        updated_at = data.get('updated_at')
         
         return cls(
             id=data.get('id', ''),
             name=data.get('name', ''),
             description=data.get('description', ''),
-            version=data.get('version', '1.0.0'),
-            tags=data.get('tags', []),
+            version=intern(data.get('version', '1.0.0')),
+            tags=intern_all(data.get('tags', [])),
             metadata=data.get('metadata', {}),
             entries=entries,
-            created_at=created_at,
-            updated_at=updated_at
+            created_at=parse_dt(created_at) if created_at else None,
+            updated_at=parse_dt(updated_at) if updated_at else None
         )
 
 
 @dataclass
-class LorebookListDto:
+class LorebookListDto(JsonSerializableMixin):
     """传说书列表响应对象
     
     用于传输传说书列表信息，遵循单一职责原则，
@@ -357,7 +700,7 @@ class LorebookListDto:
             Dict[str, Any]: 字典表示
         """
         return {
-            'lorebooks': [lorebook.to_dict() for lorebook in self.lorebooks],
+            'lorebooks': list(map(LorebookDto.to_dict, self.lorebooks)),
             'total_count': self.total_count,
             'page': self.page,
             'page_size': self.page_size,
@@ -370,12 +713,13 @@ class LorebookCreateDto:
     """创建传说书请求对象
     
     用于传输创建传说书的请求数据，遵循单一职责原则，
-    专门负责创建请求数据的传输。
+    专门负责创建请求数据的传输。请求对象只读，序列字段默认使用
+    共享的空元组，调用方不应原地修改。
     """
     name: str
     description: str = ""
     version: str = "1.0.0"
-    tags: List[str] = field(default_factory=list)
+    tags: Sequence[str] = ()
     metadata: Dict[str, Any] = field(default_factory=dict)
     
     def validate(self) -> List[str]:
@@ -430,13 +774,15 @@ class LorebookEntryCreateDto:
     """创建传说书条目请求对象
     
     用于传输创建传说书条目的请求数据，遵循单一职责原则，
-    专门负责创建条目请求数据的传输。
+    专门负责创建条目请求数据的传输。序列字段默认使用共享的空元组，
+    调用方不应原地修改；未指定激活规则时先共享默认规则，首次读取
+    activation_rule时才换成独立的可变实例。
     """
     title: str
     content: str
-    keywords: List[KeywordPatternDto] = field(default_factory=list)
-    activation_rule: ActivationRuleDto = field(default_factory=ActivationRuleDto)
-    tags: List[str] = field(default_factory=list)
+    keywords: Sequence[KeywordPatternDto] = ()
+    activation_rule: ActivationRuleDto = _DEFAULT_ACTIVATION_RULE
+    tags: Sequence[str] = ()
     metadata: Dict[str, Any] = field(default_factory=dict)
     
     def validate(self) -> List[str]:
@@ -445,35 +791,52 @@ class LorebookEntryCreateDto:
         Returns:
             List[str]: 验证错误列表，空列表表示验证通过
         """
-        errors = []
-        
-        if not self.title or not self.title.strip():
-            errors.append("条目标题不能为空")
-        
-        if not self.content or not self.content.strip():
-            errors.append("条目内容不能为空")
-        
-        # 验证激活规则
-        if self.activation_rule.type in ["keyword", "regex"] and not self.activation_rule.keywords:
-            errors.append("关键词或正则激活类型必须指定关键词")
+        return list(self._iter_errors())
+    
+    def is_valid(self) -> bool:
+        """检查请求数据是否有效，遇到第一个错误即返回
         
-        if self.activation_rule.max_activations is not None and self.activation_rule.max_activations <= 0:
-            errors.append("最大激活次数必须大于0")
+        Returns:
+            bool: 是否验证通过
+        """
+        return next(self._iter_errors(), None) is None
+    
+    def _iter_errors(self) -> Iterator[str]:
+        """逐个产出验证错误
         
-        if self.activation_rule.cooldown_seconds is not None and self.activation_rule.cooldown_seconds < 0:
-            errors.append("冷却时间不能小于0")
+        Yields:
+            str: 验证错误信息
+        """
+        title = self.title
+        if not (title and title.strip()):
+            yield "条目标题不能为空"
         
-        # 验证关键词
-        for keyword in self.activation_rule.keywords:
-            if keyword.type == "regex":
-                try:
-                    import re
-                    flags = 0 if keyword.case_sensitive else re.IGNORECASE
-                    re.compile(keyword.pattern, flags)
-                except re.error:
-                    errors.append(f"无效的正则表达式: {keyword.pattern}")
+        content = self.content
+        if not (content and content.strip()):
+            yield "条目内容不能为空"
         
-        return errors
+        # 验证激活规则，直接读取存储的规则，校验不触发默认规则的复制
+        yield from _iter_activation_rule_errors(self._activation_rule)
+
+
+def _get_create_activation_rule(self: LorebookEntryCreateDto) -> ActivationRuleDto:
+    rule = self._activation_rule
+    if rule is _DEFAULT_ACTIVATION_RULE:
+        # 写时复制：交出引用前换成独立实例，调用方可以原地修改规则与关键词
+        rule = self._activation_rule = ActivationRuleDto()
+    return rule
+
+
+def _set_create_activation_rule(self: LorebookEntryCreateDto, value: ActivationRuleDto) -> None:
+    self._activation_rule = value
+
+
+# 在dataclass生成__init__之后安装，构造时的赋值经由setter存入_activation_rule
+LorebookEntryCreateDto.activation_rule = property(
+    _get_create_activation_rule,
+    _set_create_activation_rule,
+    doc="激活规则，默认规则在首次读取时复制为可变实例"
+)
 
 
 @dataclass
@@ -497,36 +860,33 @@ class LorebookEntryUpdateDto:
         Returns:
             List[str]: 验证错误列表，空列表表示验证通过
         """
-        errors = []
+        return list(self._iter_errors())
+    
+    def is_valid(self) -> bool:
+        """检查请求数据是否有效，遇到第一个错误即返回
         
-        if self.title is not None and not self.title.strip():
-            errors.append("条目标题不能为空")
+        Returns:
+            bool: 是否验证通过
+        """
+        return next(self._iter_errors(), None) is None
+    
+    def _iter_errors(self) -> Iterator[str]:
+        """逐个产出验证错误
         
-        if self.content is not None and not self.content.strip():
-            errors.append("条目内容不能为空")
+        Yields:
+            str: 验证错误信息
+        """
+        title = self.title
+        if title is not None and not title.strip():
+            yield "条目标题不能为空"
+        
+        content = self.content
+        if content is not None and not content.strip():
+            yield "条目内容不能为空"
         
         # 验证激活规则
         if self.activation_rule:
-            if self.activation_rule.type in ["keyword", "regex"] and not self.activation_rule.keywords:
-                errors.append("关键词或正则激活类型必须指定关键词")
-            
-            if self.activation_rule.max_activations is not None and self.activation_rule.max_activations <= 0:
-                errors.append("最大激活次数必须大于0")
-            
-            if self.activation_rule.cooldown_seconds is not None and self.activation_rule.cooldown_seconds < 0:
-                errors.append("冷却时间不能小于0")
-            
-            # 验证关键词
-            for keyword in self.activation_rule.keywords:
-                if keyword.type == "regex":
-                    try:
-                        import re
-                        flags = 0 if keyword.case_sensitive else re.IGNORECASE
-                        re.compile(keyword.pattern, flags)
-                    except re.error:
-                        errors.append(f"无效的正则表达式: {keyword.pattern}")
-        
-        return errors
+            yield from _iter_activation_rule_errors(self.activation_rule)
 
 
 @dataclass
@@ -550,7 +910,7 @@ class LorebookImportDto:
         if not self.data:
             errors.append("导入数据不能为空")
         
-        if self.format not in ["json", "lorebook"]:
+        if self.format not in _SUPPORTED_IMPORT_FORMATS:
             errors.append("不支持的导入格式")
         
         if self.format == "json":
@@ -561,7 +921,7 @@ class LorebookImportDto:
 
 
 @dataclass
-class LorebookExportDto:
+class LorebookExportDto(JsonSerializableMixin):
     """导出传说书响应对象
     
     用于传输导出传说书的响应数据，遵循单一职责原则，
@@ -613,7 +973,7 @@ class LorebookActivationDto:
 
 
 @dataclass
-class LorebookActivationResultDto:
+class LorebookActivationResultDto(JsonSerializableMixin):
     """传说书激活结果对象
     
     用于传输传说书激活结果，遵循单一职责原则，
@@ -631,7 +991,7 @@ class LorebookActivationResultDto:
             Dict[str, Any]: 字典表示
         """
         return {
-            'activated_entries': [entry.to_dict() for entry in self.activated_entries],
+            'activated_entries': list(map(LorebookEntryDto.to_dict, self.activated_entries)),
             'total_candidates': self.total_candidates,
             'activation_text': self.activation_text,
             'context': self.context
@@ -639,7 +999,7 @@ class LorebookActivationResultDto:
 
 
 @dataclass
-class LorebookStatisticsDto:
+class LorebookStatisticsDto(JsonSerializableMixin):
     """传说书统计信息对象
     
     用于传输传说书统计信息，遵循单一职责原则，
@@ -652,6 +1012,37 @@ class LorebookStatisticsDto:
     tags: List[str]
     version: str
     
+    @classmethod
+    def from_entries(
+        cls,
+        entries: Union[List[LorebookEntryDto], LorebookEntriesSoA],
+        tags: Optional[List[str]] = None,
+        version: str = "1.0.0"
+    ) -> 'LorebookStatisticsDto':
+        """从条目列表计算统计信息
+        
+        条目先整理为列式视图，计数与求和直接在紧凑数组上完成，
+        不再逐条构建中间字典。
+        
+        Args:
+            entries: 传说书条目列表或其列式视图
+            tags: 传说书标签
+            version: 传说书版本
+            
+        Returns:
+            LorebookStatisticsDto: 统计信息DTO
+        """
+        soa = entries if isinstance(entries, LorebookEntriesSoA) else LorebookEntriesSoA.from_entries(entries)
+        
+        return cls(
+            total_entries=len(soa),
+            active_entries=soa.active_count,
+            total_activations=soa.total_activations,
+            average_activations=soa.average_activations,
+            tags=list(tags) if tags else [],
+            version=version
+        )
+    
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典
         
@@ -0,0 +1,240 @@
+"""
+传说书msgspec结构体
+
+该模块为传说书DTO提供msgspec.Struct镜像，用于高吞吐的API入口与出口：
+入口直接将JSON字节解码为类型化结构体，再浅拷贝为DTO，跳过逐层的
+from_dict；出口将DTO转换为结构体后由msgspec编码。
+
+msgspec为可选依赖（pip install .[perf]），本模块不在dtos包中自动导入，
+按需显式导入即可；未安装时模块仍可导入，编解码函数抛出ImportError。
+普通代码路径继续使用DTO的from_dict/to_dict。
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - 仅在缺少可选依赖时触发
+    msgspec = None
+
+from .lorebook_dtos import (
+    ActivationRuleDto,
+    KeywordPatternDto,
+    LorebookDto,
+    LorebookEntryDto,
+)
+
+
+if msgspec is not None:
+    class KeywordPatternMsg(msgspec.Struct):
+        """关键词模式结构体"""
+        pattern: str = ""
+        type: str = "exact"
+        case_sensitive: bool = False
+        weight: float = 1.0
+
+
+    class ActivationRuleMsg(msgspec.Struct):
+        """激活规则结构体"""
+        type: str = "keyword"
+        keywords: List[KeywordPatternMsg] = msgspec.field(default_factory=list)
+        priority: int = 0
+        max_activations: Optional[int] = None
+        cooldown_seconds: Optional[int] = None
+
+
+    class LorebookEntryMsg(msgspec.Struct):
+        """传说书条目结构体"""
+        id: str = ""
+        title: str = ""
+        content: str = ""
+        keywords: List[KeywordPatternMsg] = msgspec.field(default_factory=list)
+        activation_rule: ActivationRuleMsg = msgspec.field(default_factory=ActivationRuleMsg)
+        tags: List[str] = msgspec.field(default_factory=list)
+        is_active: bool = True
+        activation_count: int = 0
+        last_activated_at: Optional[datetime] = None
+        metadata: Dict[str, Any] = msgspec.field(default_factory=dict)
+        created_at: Optional[datetime] = None
+        updated_at: Optional[datetime] = None
+
+
+    class LorebookMsg(msgspec.Struct):
+        """传说书结构体"""
+        id: str = ""
+        name: str = ""
+        description: str = ""
+        version: str = "1.0.0"
+        tags: List[str] = msgspec.field(default_factory=list)
+        metadata: Dict[str, Any] = msgspec.field(default_factory=dict)
+        entries: List[LorebookEntryMsg] = msgspec.field(default_factory=list)
+        created_at: Optional[datetime] = None
+        updated_at: Optional[datetime] = None
+
+
+    _decoder = msgspec.json.Decoder(LorebookMsg)
+    _encoder = msgspec.json.Encoder()
+
+
+def _require_msgspec() -> None:
+    """确认msgspec可用
+
+    Raises:
+        ImportError: 未安装msgspec时抛出
+    """
+    if msgspec is None:
+        raise ImportError("lorebook_structs需要可选依赖msgspec，请执行 pip install .[perf]")
+
+
+def _keywords_to_dto(keywords: List[KeywordPatternMsg]) -> List[KeywordPatternDto]:
+    return [
+        KeywordPatternDto(
+            pattern=k.pattern,
+            type=k.type,
+            case_sensitive=k.case_sensitive,
+            weight=k.weight
+        ) for k in keywords
+    ]
+
+
+def _keywords_from_dto(keywords: List[KeywordPatternDto]) -> List[KeywordPatternMsg]:
+    return [
+        KeywordPatternMsg(
+            pattern=k.pattern,
+            type=k.type,
+            case_sensitive=k.case_sensitive,
+            weight=k.weight
+        ) for k in keywords
+    ]
+
+
+def to_dto(message: LorebookMsg) -> LorebookDto:
+    """将传说书结构体转换为DTO
+
+    Args:
+        message: 传说书结构体
+
+    Returns:
+        LorebookDto: 传说书DTO实例
+    """
+    entries = []
+    for e in message.entries:
+        rule = e.activation_rule
+        entries.append(LorebookEntryDto(
+            id=e.id,
+            title=e.title,
+            content=e.content,
+            keywords=_keywords_to_dto(e.keywords),
+            activation_rule=ActivationRuleDto(
+                type=rule.type,
+                keywords=_keywords_to_dto(rule.keywords),
+                priority=rule.priority,
+                max_activations=rule.max_activations,
+                cooldown_seconds=rule.cooldown_seconds
+            ),
+            tags=e.tags,
+            is_active=e.is_active,
+            activation_count=e.activation_count,
+            last_activated_at=e.last_activated_at,
+            metadata=e.metadata,
+            created_at=e.created_at,
+            updated_at=e.updated_at
+        ))
+
+    return LorebookDto(
+        id=message.id,
+        name=message.name,
+        description=message.description,
+        version=message.version,
+        tags=message.tags,
+        metadata=message.metadata,
+        entries=entries,
+        created_at=message.created_at,
+        updated_at=message.updated_at
+    )
+
+
+def from_dto(lorebook: LorebookDto) -> LorebookMsg:
+    """将传说书DTO转换为结构体
+
+    Args:
+        lorebook: 传说书DTO实例
+
+    Returns:
+        LorebookMsg: 传说书结构体
+
+    Raises:
+        ImportError: 未安装msgspec时抛出
+    """
+    _require_msgspec()
+    entries = []
+    for e in lorebook.entries:
+        rule = e.activation_rule
+        entries.append(LorebookEntryMsg(
+            id=e.id,
+            title=e.title,
+            content=e.content,
+            keywords=_keywords_from_dto(e.keywords),
+            activation_rule=ActivationRuleMsg(
+                type=rule.type,
+                keywords=_keywords_from_dto(rule.keywords),
+                priority=rule.priority,
+                max_activations=rule.max_activations,
+                cooldown_seconds=rule.cooldown_seconds
+            ),
+            tags=list(e.tags),
+            is_active=e.is_active,
+            activation_count=e.activation_count,
+            last_activated_at=e.last_activated_at,
+            metadata=e.metadata,
+            created_at=e.created_at,
+            updated_at=e.updated_at
+        ))
+
+    return LorebookMsg(
+        id=lorebook.id,
+        name=lorebook.name,
+        description=lorebook.description,
+        version=lorebook.version,
+        tags=list(lorebook.tags),
+        metadata=lorebook.metadata,
+        entries=entries,
+        created_at=lorebook.created_at,
+        updated_at=lorebook.updated_at
+    )
+
+
+def decode_lorebook(raw: bytes) -> LorebookDto:
+    """将JSON字节解码为传说书DTO
+
+    Args:
+        raw: JSON字节
+
+    Returns:
+        LorebookDto: 传说书DTO实例
+
+    Raises:
+        ImportError: 未安装msgspec时抛出
+        msgspec.ValidationError: 数据与结构体定义不符时抛出
+    """
+    _require_msgspec()
+    return to_dto(_decoder.decode(raw))
+
+
+def encode_lorebook(lorebook: LorebookDto) -> bytes:
+    """将传说书DTO编码为JSON字节
+
+    Args:
+        lorebook: 传说书DTO实例
+
+    Returns:
+        bytes: UTF-8编码的JSON
+
+    Raises:
+        ImportError: 未安装msgspec时抛出
+    """
+    _require_msgspec()
+    return _encoder.encode(from_dto(lorebook))
@@ -10,6 +10,7 @@ from typing import Any, Dict, List, Optional
 from datetime import datetime
 from enum import Enum
 
+from .json_codec import JsonSerializableMixin, format_datetime
 from ..models.prompt import (
     PromptSectionType, TruncationStrategy, LLMProvider,
     PromptSection, PromptContext, PromptTemplate
@@ -24,8 +25,67 @@ class PromptFormat(Enum):
     XML = "xml"
 
 
-@dataclass
-class PromptTemplateDto:
+# 支持导入的格式
+_SUPPORTED_IMPORT_FORMATS = frozenset({PromptFormat.JSON, PromptFormat.TEXT})
+
+
+def _is_blank(value: Optional[str]) -> bool:
+    """检查字符串是否为空或仅包含空白
+    
+    str.isspace不会像strip那样分配新字符串，两者的空白字符定义一致。
+    
+    Args:
+        value: 待检查的字符串
+        
+    Returns:
+        bool: 是否为空白
+    """
+    return not value or value.isspace()
+
+
+# 合法的段落类型，包含枚举值与枚举成员本身，与PromptSectionType(...)的接受范围一致
+_VALID_SECTION_TYPES = frozenset(PromptSectionType) | frozenset(t.value for t in PromptSectionType)
+
+
+def _is_valid_section_type(section_type: Any) -> bool:
+    """检查段落类型是否合法
+    
+    以集合成员测试代替PromptSectionType(...)调用和异常处理。
+    
+    Args:
+        section_type: 段落类型
+        
+    Returns:
+        bool: 是否合法
+    """
+    try:
+        return section_type in _VALID_SECTION_TYPES
+    except TypeError:
+        # 不可哈希的值不可能是合法类型
+        return False
+
+
+def _section_to_dict(section: PromptSection) -> Dict[str, Any]:
+    """将提示段落领域对象转换为字典
+    
+    Args:
+        section: 提示段落领域对象
+        
+    Returns:
+        Dict[str, Any]: 字典表示
+    """
+    return {
+        'content': section.content,
+        # _value_为枚举成员的实例属性，绕开value描述符的调用开销
+        'section_type': section.section_type._value_,
+        'priority': section.priority,
+        'token_count': section.token_count,
+        'metadata': section.metadata
+    }
+
+
+@dataclass(slots=True)
+class PromptTemplateDto(JsonSerializableMixin):
     """提示模板数据传输对象
     
     用于传输提示模板的基本信息，遵循单一职责原则，
@@ -42,6 +102,9 @@ class PromptTemplateDto:
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     
+    # 与to_dict一致，时间字段为None时不输出
+    _JSON_OMIT_NONE = ('created_at', 'updated_at')
+    
     @classmethod
     def from_domain(cls, template: PromptTemplate) -> 'PromptTemplateDto':
         """从领域对象创建DTO
@@ -52,21 +115,11 @@ class PromptTemplateDto:
         Returns:
             PromptTemplateDto: 提示模板DTO实例
         """
-        sections_data = []
-        for section in template.sections:
-            sections_data.append({
-                'content': section.content,
-                'section_type': section.section_type.value,
-                'priority': section.priority,
-                'token_count': section.token_count,
-                'metadata': section.metadata
-            })
-        
         return cls(
             id=str(template.id),
             name=template.name,
             description=template.description,
-            sections=sections_data,
+            sections=list(map(_section_to_dict, template.sections)),
             variables=list(template.variables),
             metadata=template.metadata,
             version=template.version,
@@ -93,15 +146,15 @@ class PromptTemplateDto:
         }
         
         if self.created_at:
-            result['created_at'] = self.created_at.isoformat()
+            result['created_at'] = format_datetime(self.created_at)
         if self.updated_at:
-            result['updated_at'] = self.updated_at.isoformat()
+            result['updated_at'] = format_datetime(self.updated_at)
         
         return result
 
 
-@dataclass
-class PromptTemplateListDto:
+@dataclass(frozen=True, slots=True)
+class PromptTemplateListDto(JsonSerializableMixin):
     """提示模板列表响应对象
     
     用于传输提示模板列表信息，遵循单一职责原则，
@@ -120,7 +173,7 @@ class PromptTemplateListDto:
             Dict[str, Any]: 字典表示
         """
         return {
-            'templates': [t.to_dict() for t in self.templates],
+            'templates': list(map(PromptTemplateDto.to_dict, self.templates)),
             'total_count': self.total_count,
             'page': self.page,
             'page_size': self.page_size,
@@ -128,8 +181,8 @@ class PromptTemplateListDto:
         }
 
 
-@dataclass
-class PromptSectionDto:
+@dataclass(frozen=True, slots=True)
+class PromptSectionDto(JsonSerializableMixin):
     """提示段落数据传输对象
     
     用于传输提示段落信息，遵循单一职责原则，
@@ -167,15 +220,15 @@ class PromptSectionDto:
         """
         return {
             'content': self.content,
-            'section_type': self.section_type.value,
+            'section_type': self.section_type._value_,
             'priority': self.priority,
             'token_count': self.token_count,
             'metadata': self.metadata,
         }
 
 
-@dataclass
-class PromptContextDto:
+@dataclass(slots=True)
+class PromptContextDto(JsonSerializableMixin):
     """提示上下文数据传输对象
     
     用于传输提示上下文信息，遵循单一职责原则，
@@ -224,9 +277,39 @@ class PromptContextDto:
             'variables': self.variables,
             'metadata': self.metadata,
         }
+    
+    def validate(self) -> List[str]:
+        """验证上下文数据
+        
+        Returns:
+            List[str]: 验证错误列表，空列表表示验证通过
+        """
+        errors: List[str] = []
+        chat_history = self.chat_history
+        
+        # 常见情况下所有消息都合法，先做一次不产生错误信息的快速检查
+        if not chat_history or all(
+            isinstance(message, dict) and 'role' in message and 'content' in message
+            for message in chat_history
+        ):
+            return errors
+        
+        # 验证聊天历史格式
+        for i, message in enumerate(chat_history):
+            if not isinstance(message, dict):
+                errors.append(f"聊天历史消息 {i} 必须是字典格式")
+                continue
+            
+            if 'role' not in message:
+                errors.append(f"聊天历史消息 {i} 缺少role字段")
+            
+            if 'content' not in message:
+                errors.append(f"聊天历史消息 {i} 缺少content字段")
+        
+        return errors
 
 
-@dataclass
+@dataclass(slots=True)
 class PromptBuildDto:
     """提示构建请求对象
     
@@ -246,7 +329,7 @@ class PromptBuildDto:
         """
         errors = []
         
-        if not self.template_id or not self.template_id.strip():
+        if _is_blank(self.template_id):
             errors.append("模板ID不能为空")
         
         # 验证上下文
@@ -266,8 +349,8 @@ class PromptBuildDto:
         return errors
 
 
-@dataclass
-class PromptPreviewDto:
+@dataclass(slots=True)
+class PromptPreviewDto(JsonSerializableMixin):
     """提示预览响应对象
     
     用于传输提示预览的响应数据，遵循单一职责原则，
@@ -290,7 +373,7 @@ class PromptPreviewDto:
         return {
             'prompt': self.prompt,
             'token_count': self.token_count,
-            'sections': [s.to_dict() for s in self.sections],
+            'sections': list(map(PromptSectionDto.to_dict, self.sections)),
             'variables_used': self.variables_used,
             'missing_variables': self.missing_variables,
             'truncation_applied': self.truncation_applied,
@@ -298,8 +381,8 @@ class PromptPreviewDto:
         }
 
 
-@dataclass
-class PromptStatisticsDto:
+@dataclass(slots=True)
+class PromptStatisticsDto(JsonSerializableMixin):
     """提示统计信息对象
     
     用于传输提示统计信息，遵循单一职责原则，
@@ -317,6 +400,9 @@ class PromptStatisticsDto:
     created_at: Optional[datetime] = None
     last_used: Optional[datetime] = None
     
+    # 与to_dict一致，时间字段为None时不输出
+    _JSON_OMIT_NONE = ('created_at', 'last_used')
+    
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典
         
@@ -336,14 +422,14 @@ class PromptStatisticsDto:
         }
         
         if self.created_at:
-            result['created_at'] = self.created_at.isoformat()
+            result['created_at'] = format_datetime(self.created_at)
         if self.last_used:
-            result['last_used'] = self.last_used.isoformat()
+            result['last_used'] = format_datetime(self.last_used)
         
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class PromptTemplateCreateDto:
     """创建提示模板请求对象
     
@@ -364,18 +450,16 @@ class PromptTemplateCreateDto:
         """
         errors = []
         
-        if not self.name or not self.name.strip():
+        if _is_blank(self.name):
             errors.append("模板名称不能为空")
         
         # 验证段落
         for i, section_data in enumerate(self.sections):
-            if not section_data.get('content', '').strip():
+            if _is_blank(section_data.get('content', '')):
                 errors.append(f"段落 {i} 内容不能为空")
             
             section_type = section_data.get('section_type', 'custom')
-            try:
-                PromptSectionType(section_type)
-            except ValueError:
+            if not _is_valid_section_type(section_type):
                 errors.append(f"段落 {i} 类型无效: {section_type}")
             
             priority = section_data.get('priority', 0)
@@ -383,13 +467,13 @@ class PromptTemplateCreateDto:
                 errors.append(f"段落 {i} 优先级必须是整数")
         
         # 验证版本
-        if not self.version or not self.version.strip():
+        if _is_blank(self.version):
             errors.append("版本不能为空")
         
         return errors
 
 
-@dataclass
+@dataclass(slots=True)
 class PromptTemplateUpdateDto:
     """更新提示模板请求对象
     
@@ -412,19 +496,17 @@ class PromptTemplateUpdateDto:
         errors = []
         
         # 验证名称
-        if self.name is not None and not self.name.strip():
+        if self.name is not None and _is_blank(self.name):
             errors.append("模板名称不能为空")
         
         # 验证段落
         if self.sections is not None:
             for i, section_data in enumerate(self.sections):
-                if not section_data.get('content', '').strip():
+                if _is_blank(section_data.get('content', '')):
                     errors.append(f"段落 {i} 内容不能为空")
                 
                 section_type = section_data.get('section_type', 'custom')
-                try:
-                    PromptSectionType(section_type)
-                except ValueError:
+                if not _is_valid_section_type(section_type):
                     errors.append(f"段落 {i} 类型无效: {section_type}")
                 
                 priority = section_data.get('priority', 0)
@@ -432,13 +514,13 @@ class PromptTemplateUpdateDto:
                     errors.append(f"段落 {i} 优先级必须是整数")
         
         # 验证版本
-        if self.version is not None and not self.version.strip():
+        if self.version is not None and _is_blank(self.version):
             errors.append("版本不能为空")
         
         return errors
 
 
-@dataclass
+@dataclass(slots=True)
 class PromptTokenCountDto:
     """Token计数请求对象
     
@@ -457,17 +539,17 @@ class PromptTokenCountDto:
         """
         errors = []
         
-        if not self.text.strip():
+        if _is_blank(self.text):
             errors.append("文本内容不能为空")
         
-        if not self.model_name or not self.model_name.strip():
+        if _is_blank(self.model_name):
             errors.append("模型名称不能为空")
         
         return errors
 
 
-@dataclass
-class PromptTokenCountResponseDto:
+@dataclass(frozen=True, slots=True)
+class PromptTokenCountResponseDto(JsonSerializableMixin):
     """Token计数响应对象
     
     用于传输Token计数的响应数据，遵循单一职责原则，
@@ -494,8 +576,8 @@ class PromptTokenCountResponseDto:
         }
 
 
-@dataclass
-class PromptExportDto:
+@dataclass(frozen=True, slots=True)
+class PromptExportDto(JsonSerializableMixin):
     """导出提示模板响应对象
     
     用于传输导出提示模板的响应数据，遵循单一职责原则，
@@ -518,7 +600,7 @@ class PromptExportDto:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PromptImportDto:
     """导入提示模板请求对象
     
@@ -540,7 +622,7 @@ class PromptImportDto:
         if not self.data:
             errors.append("导入数据不能为空")
         
-        if self.format not in [PromptFormat.JSON, PromptFormat.TEXT]:
+        if self.format not in _SUPPORTED_IMPORT_FORMATS:
             errors.append("不支持的导入格式")
         
         if self.format == PromptFormat.JSON:
@@ -548,32 +630,3 @@ class PromptImportDto:
                 errors.append("模板名称不能为空")
         
         return errors
-
-
-# 为PromptContextDto添加validate方法
-def _prompt_context_dto_validate(self) -> List[str]:
-    """验证上下文数据
-    
-    Returns:
-        List[str]: 验证错误列表，空列表表示验证通过
-    """
-    errors = []
-    
-    # 验证聊天历史格式
-    if self.chat_history:
-        for i, message in enumerate(self.chat_history):
-            if not isinstance(message, dict):
-                errors.append(f"聊天历史消息 {i} 必须是字典格式")
-                continue
-            
-            if 'role' not in message:
-                errors.append(f"聊天历史消息 {i} 缺少role字段")
-            
-            if 'content' not in message:
-                errors.append(f"聊天历史消息 {i} 缺少content字段")
-    
-    return errors
-
-
-# 动态添加方法到类
-PromptContextDto.validate = _prompt_context_dto_validate
\ No newline at end of file
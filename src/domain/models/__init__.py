@@ -14,7 +14,7 @@
 from .base import BaseEntity, ValueObject, AggregateRoot, EntityId
 from .characters import Character, Ability, Condition, Abilities, CharacterStats, Position
 from .combat import Combat, RangeBand, CoverLevel, CombatState, TurnState, InitiativeScore
-from .items import Item, ItemType, ItemRarity, WeaponType, DamageType, ArmorType, ItemStats, ItemProperties, Inventory
+from .items import Item, ItemType, ItemRarity, WeaponType, DamageType, ArmorType, ItemStats, ItemProperties, Inventory, make_item_stats, make_item_properties
 from .relations import Relation, RelationType, RelationStrength, RelationKey, RelationshipNetwork
 from .objectives import Objective, ObjectiveStatus, ObjectivePriority, ObjectiveType, ObjectiveCondition, ObjectiveReward, ObjectiveTracker
 from .world import World, Location, Scene, GameTime, Weather, LocationType, TimeOfDay
@@ -52,6 +52,8 @@ __all__ = [
     'ItemStats',
     'ItemProperties',
     'Inventory',
+    'make_item_stats',
+    'make_item_properties',
     
     # 关系模型
     'Relation',
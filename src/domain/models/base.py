@@ -11,10 +11,12 @@
 4. EntityId - 实体ID值对象
 """
 
-from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set, TypeVar, Generic
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, TypeVar, Generic
+from contextvars import ContextVar, Token
 from datetime import datetime
+import sys
+import time
 import uuid
 from enum import Enum
 
@@ -22,6 +24,37 @@ from ...core.interfaces import DomainEvent
 from ...core.exceptions import ValidationException, BusinessRuleException
 
 
+# 请求级时钟：请求入口处设置一次，请求内构造的所有实体共享同一时间戳
+_NOW: ContextVar[Optional[datetime]] = ContextVar('now', default=None)
+
+
+def _utcnow() -> datetime:
+    """获取当前时间，优先返回请求级缓存的时间"""
+    now = _NOW.get()
+    return now if now is not None else datetime.now()
+
+
+def set_request_time(now: Optional[datetime] = None) -> Token:
+    """设置当前上下文的请求时间
+    
+    Args:
+        now: 请求时间，为None时使用当前时间
+        
+    Returns:
+        Token: 用于恢复之前状态的令牌
+    """
+    return _NOW.set(now if now is not None else datetime.now())
+
+
+def reset_request_time(token: Token) -> None:
+    """恢复设置请求时间之前的状态
+    
+    Args:
+        token: set_request_time返回的令牌
+    """
+    _NOW.reset(token)
+
+
 class GenericDomainEvent(DomainEvent):
     """通用领域事件"""
     
@@ -46,15 +79,22 @@ class EntityId:
     
     封装实体的唯一标识符，确保ID的一致性和类型安全。
     遵循单一职责原则，专门负责实体标识的管理。
+    实体会频繁放入集合和字典，因此哈希值在构造时预先计算；ID字符串经过
+    驻留，同一ID的不同实例比较时可直接命中指针相等。驻留字符串在无引用后
+    仍会被回收，不会随实体数量无限增长。
     """
     
+    __slots__ = ('_value', '_hash')
+    
     def __init__(self, value: Optional[str] = None):
         """初始化实体ID
         
         Args:
             value: ID值，如果为None则自动生成UUID
         """
-        self._value = value or str(uuid.uuid4())
+        value = value or str(uuid.uuid4())
+        self._value = sys.intern(value) if type(value) is str else value
+        self._hash = hash(self._value)
     
     @property
     def value(self) -> str:
@@ -67,26 +107,35 @@ class EntityId:
     
     def __eq__(self, other) -> bool:
         """相等性比较"""
+        if self is other:
+            return True
         if not isinstance(other, EntityId):
             return False
         return self._value == other._value
     
     def __hash__(self) -> int:
         """哈希值"""
-        return hash(self._value)
+        return self._hash
     
     def __repr__(self) -> str:
         """对象表示"""
         return f"{self.__class__.__name__}('{self._value}')"
+    
+    def __reduce__(self):
+        """序列化时只保留ID值，哈希值在反序列化时重新计算（字符串哈希按进程随机化）"""
+        return (self.__class__, (self._value,))
 
 
-class ValueObject(ABC):
+class ValueObject:
     """值对象基类
     
     所有值对象的抽象基类，通过值相等性进行比较。
     遵循单一职责原则，专门负责值对象的通用行为。
     """
     
+    # 空槽位，使声明了__slots__的子类实例不再携带__dict__
+    __slots__ = ()
+    
     def __eq__(self, other) -> bool:
         """相等性比较"""
         if not isinstance(other, self.__class__):
@@ -97,14 +146,13 @@ class ValueObject(ABC):
         """哈希值"""
         return hash(tuple(self._get_equality_components()))
     
-    @abstractmethod
     def _get_equality_components(self) -> tuple:
         """获取相等性比较的组件
         
         Returns:
             tuple: 用于相等性比较的组件元组
         """
-        pass
+        raise NotImplementedError
     
     def __repr__(self) -> str:
         """对象表示"""
@@ -113,7 +161,7 @@ class ValueObject(ABC):
         return f"{class_name}({', '.join(repr(c) for c in components)})"
 
 
-class BaseEntity(ABC):
+class BaseEntity:
     """实体基类
     
     所有领域实体的抽象基类，提供实体的通用功能。
@@ -127,10 +175,12 @@ class BaseEntity(ABC):
             id: 实体ID，如果为None则自动生成
         """
         self._id = id or EntityId()
-        self._created_at = datetime.now()
-        self._updated_at = datetime.now()
+        now = _utcnow()
+        self._created_at = now
+        self._updated_at = now
         self._version = 1
-        self._domain_events: List[DomainEvent] = []
+        # 大多数实体从不产生事件，事件列表在首次添加时才创建
+        self._domain_events: Optional[List[DomainEvent]] = None
     
     @property
     def id(self) -> EntityId:
@@ -153,39 +203,50 @@ class BaseEntity(ABC):
         return self._version
     
     @property
-    def domain_events(self) -> List[DomainEvent]:
-        """获取领域事件列表"""
-        return self._domain_events.copy()
+    def domain_events(self) -> Tuple[DomainEvent, ...]:
+        """获取领域事件列表（只读快照）"""
+        if self._domain_events is None:
+            return ()
+        return tuple(self._domain_events)
     
-    def add_domain_event(self, event_or_name, data=None) -> None:
+    def add_domain_event(self, event: DomainEvent) -> None:
         """添加领域事件
         
         Args:
-            event_or_name: 领域事件对象或事件名称
-            data: 事件数据（当event_or_name为事件名称时使用）
+            event: 领域事件对象
         """
-        if isinstance(event_or_name, DomainEvent):
-            # 传递的是事件对象
-            self._domain_events.append(event_or_name)
+        if self._domain_events is None:
+            self._domain_events = [event]
         else:
-            # 传递的是事件名称和数据，创建一个通用事件对象
-            event = GenericDomainEvent(event_or_name, data or {})
             self._domain_events.append(event)
     
+    def raise_event(self, event_type: str, data: Optional[Dict[str, Any]] = None) -> None:
+        """以事件类型和数据创建通用领域事件并添加
+        
+        Args:
+            event_type: 事件类型
+            data: 事件数据
+        """
+        self.add_domain_event(GenericDomainEvent(event_type, data or {}))
+    
     def clear_domain_events(self) -> None:
         """清除领域事件"""
-        self._domain_events.clear()
+        if self._domain_events is not None:
+            self._domain_events.clear()
     
     def _mark_as_updated(self) -> None:
         """标记为已更新"""
-        self._updated_at = datetime.now()
+        self._updated_at = _utcnow()
         self._version += 1
     
     def __eq__(self, other) -> bool:
         """相等性比较"""
+        if self is other:
+            return True
         if not isinstance(other, BaseEntity):
             return False
-        return self._id == other._id
+        # 直接比较ID字符串，跳过EntityId.__eq__的调用
+        return self._id._value == other._id._value
     
     def __hash__(self) -> int:
         """哈希值"""
@@ -195,23 +256,21 @@ class BaseEntity(ABC):
         """对象表示"""
         return f"{self.__class__.__name__}(id={self._id})"
     
-    @abstractmethod
     def validate(self) -> None:
         """验证实体状态
         
         Raises:
             ValidationException: 验证失败时抛出
         """
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def _get_business_rules(self) -> List['BusinessRule']:
         """获取业务规则列表
         
         Returns:
             List[BusinessRule]: 业务规则列表
         """
-        pass
+        raise NotImplementedError
     
     def check_business_rules(self) -> None:
         """检查业务规则
@@ -268,6 +327,10 @@ class AggregateRoot(BaseEntity):
     遵循单一职责原则，专门负责聚合的通用行为管理。
     """
     
+    # 有订阅者的事件类型，由事件基础设施通过set_event_subscribers声明；
+    # 为None时视为所有事件都有订阅者
+    _event_subscribers: Optional[frozenset] = None
+    
     def __init__(self, id: Optional[EntityId] = None):
         """初始化聚合根
         
@@ -275,12 +338,36 @@ class AggregateRoot(BaseEntity):
             id: 聚合根ID
         """
         super().__init__(id)
-        self._child_entities: Set[BaseEntity] = set()
+        # 以ID值为键，查找与去重直接使用字符串哈希
+        self._child_entities: Dict[str, BaseEntity] = {}
+    
+    @classmethod
+    def set_event_subscribers(cls, event_types: Optional[Iterable[str]]) -> None:
+        """声明有订阅者的事件类型
+        
+        声明后，高频事件在没有订阅者时可跳过载荷构建与事件记录。
+        
+        Args:
+            event_types: 事件类型集合，为None时恢复为记录所有事件
+        """
+        cls._event_subscribers = None if event_types is None else frozenset(event_types)
+    
+    def has_subscribers(self, event_type: str) -> bool:
+        """检查事件类型是否有订阅者
+        
+        Args:
+            event_type: 事件类型
+            
+        Returns:
+            bool: 未声明订阅信息或该事件类型有订阅者时返回True
+        """
+        subscribers = self._event_subscribers
+        return subscribers is None or event_type in subscribers
     
     @property
     def child_entities(self) -> Set[BaseEntity]:
         """获取子实体集合"""
-        return self._child_entities.copy()
+        return set(self._child_entities.values())
     
     def add_child_entity(self, entity: BaseEntity) -> None:
         """添加子实体
@@ -288,7 +375,7 @@ class AggregateRoot(BaseEntity):
         Args:
             entity: 子实体
         """
-        self._child_entities.add(entity)
+        self._child_entities[entity.id.value] = entity
     
     def remove_child_entity(self, entity: BaseEntity) -> None:
         """移除子实体
@@ -296,7 +383,7 @@ class AggregateRoot(BaseEntity):
         Args:
             entity: 子实体
         """
-        self._child_entities.discard(entity)
+        self._child_entities.pop(entity.id.value, None)
     
     def get_all_domain_events(self) -> List[DomainEvent]:
         """获取所有领域事件（包括子实体的）
@@ -304,11 +391,12 @@ class AggregateRoot(BaseEntity):
         Returns:
             List[DomainEvent]: 所有领域事件列表
         """
-        events = self._domain_events.copy()
+        events = list(self._domain_events or ())
         
-        # 收集子实体的领域事件
-        for child in self._child_entities:
-            events.extend(child.domain_events)
+        # 收集子实体的领域事件，直接读取内部列表避免逐个复制快照
+        for child in self._child_entities.values():
+            if child._domain_events:
+                events += child._domain_events
         
         return events
     
@@ -317,7 +405,7 @@ class AggregateRoot(BaseEntity):
         self.clear_domain_events()
         
         # 清除子实体的领域事件
-        for child in self._child_entities:
+        for child in self._child_entities.values():
             child.clear_domain_events()
     
     def validate_aggregate(self) -> None:
@@ -332,18 +420,20 @@ class AggregateRoot(BaseEntity):
         self.validate()
         
         # 验证所有子实体
-        for child in self._child_entities:
+        for child in self._child_entities.values():
             child.validate()
 
 
-class BusinessRule(ABC):
+class BusinessRule:
     """业务规则基类
     
     所有业务规则的抽象基类，定义业务规则的通用接口。
     遵循单一职责原则，专门负责业务规则的抽象定义。
     """
     
-    @abstractmethod
+    # 空槽位，使声明了__slots__的无状态规则子类实例不再携带__dict__
+    __slots__ = ()
+    
     def is_satisfied_by(self, entity: BaseEntity) -> bool:
         """检查实体是否满足业务规则
         
@@ -353,16 +443,15 @@ class BusinessRule(ABC):
         Returns:
             bool: 是否满足规则
         """
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def get_error_message(self) -> str:
         """获取错误消息
         
         Returns:
             str: 错误消息
         """
-        pass
+        raise NotImplementedError
     
     def get_description(self) -> str:
         """获取规则描述
@@ -384,7 +473,7 @@ class EntityState(Enum):
     ARCHIVED = "archived"
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditInfo:
     """审计信息值对象
     
@@ -398,10 +487,12 @@ class AuditInfo:
     
     def __post_init__(self):
         """初始化后处理"""
-        if self.created_at is None:
-            self.created_at = datetime.now()
-        if self.updated_at is None:
-            self.updated_at = datetime.now()
+        if self.created_at is None or self.updated_at is None:
+            now = _utcnow()
+            if self.created_at is None:
+                self.created_at = now
+            if self.updated_at is None:
+                self.updated_at = now
     
     def mark_updated(self, updated_by: Optional[str] = None) -> None:
         """标记为已更新
@@ -409,7 +500,7 @@ class AuditInfo:
         Args:
             updated_by: 更新者
         """
-        self.updated_at = datetime.now()
+        self.updated_at = _utcnow()
         if updated_by:
             self.updated_by = updated_by
 
@@ -467,7 +558,7 @@ class SoftDeletableEntity(BaseEntity):
             return
         
         self._state = EntityState.DELETED
-        self._deleted_at = datetime.now()
+        self._deleted_at = _utcnow()
         self._deleted_by = deleted_by
         self._mark_as_updated()
     
@@ -512,7 +603,9 @@ class TimestampedEntity(BaseEntity):
             id: 实体ID
         """
         super().__init__(id)
-        self._last_activity_at = datetime.now()
+        self._last_activity_at = _utcnow()
+        # 单调时钟读数，仅用于计算非活跃时长
+        self._last_activity_monotonic = time.monotonic()
     
     @property
     def last_activity_at(self) -> datetime:
@@ -521,7 +614,8 @@ class TimestampedEntity(BaseEntity):
     
     def update_last_activity(self) -> None:
         """更新最后活动时间"""
-        self._last_activity_at = datetime.now()
+        self._last_activity_at = _utcnow()
+        self._last_activity_monotonic = time.monotonic()
         self._mark_as_updated()
     
     def is_inactive_for(self, duration_seconds: int) -> bool:
@@ -533,5 +627,4 @@ class TimestampedEntity(BaseEntity):
         Returns:
             bool: 是否非活跃
         """
-        elapsed = (datetime.now() - self._last_activity_at).total_seconds()
-        return elapsed > duration_seconds
\ No newline at end of file
+        return (time.monotonic() - self._last_activity_monotonic) > duration_seconds
\ No newline at end of file
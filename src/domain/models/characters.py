@@ -2,15 +2,29 @@
 角色领域模型
 包含角色的属性、状态和行为规则
 """
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set
-from enum import Enum
+from dataclasses import MISSING, FrozenInstanceError, dataclass, field, fields
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple, Union
+from enum import Enum, IntFlag
 import json
 import base64
+import sys
 from datetime import datetime
 
-from .base import Entity, ValueObject, AggregateRoot
+from .base import Entity, ValueObject, AggregateRoot, BaseEntity
 from ...core.interfaces import DomainEvent
+from ...core.exceptions import ValidationException
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 仅在缺少可选依赖时触发
+    orjson = None
+
+
+def _dumps(obj: Any) -> bytes:
+    """序列化为UTF-8编码的JSON字节，安装了orjson时优先使用"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
 
 
 class CharacterDomainEvent(DomainEvent):
@@ -29,6 +43,33 @@ class CharacterDomainEvent(DomainEvent):
         return self._data
 
 
+_UNSET = object()
+
+
+class LazyDomainEvent(CharacterDomainEvent):
+    """延迟构建载荷的角色领域事件
+    
+    载荷由工厂函数在首次读取data时生成并缓存；没有订阅者读取时不会
+    分配载荷字典。工厂函数应通过默认参数绑定发生时的值，避免读取到
+    之后被修改的状态。
+    """
+    
+    __slots__ = ('_factory',)
+    
+    def __init__(self, event_type: str, factory: Callable[[], Dict[str, Any]]):
+        DomainEvent.__init__(self)
+        self._event_type = event_type
+        self._factory = factory
+        self._data = _UNSET
+    
+    @property
+    def data(self) -> Dict[str, Any]:
+        if self._data is _UNSET:
+            self._data = self._factory()
+            self._factory = None
+        return self._data
+
+
 class Ability(Enum):
     """能力属性枚举"""
     STRENGTH = "STR"
@@ -39,17 +80,250 @@ class Ability(Enum):
     CHARISMA = "CHA"
 
 
-class Condition(Enum):
-    """状态条件枚举"""
-    HIDDEN = "hidden"
-    PRONE = "prone"
-    GRAPPLED = "grappled"
-    RESTRAINED = "restrained"
-    DODGE = "dodge"
+class Condition(IntFlag):
+    """状态条件枚举
+    
+    每个条件占一个二进制位，角色的全部条件合并为一个整数位掩码，
+    检查条件只需一次按位与。掩码保存为普通int并与成员的_value_运算，
+    避免IntFlag运算符每次构造新的枚举实例。序列化使用name_value给出的
+    字符串值。
+    """
+    HIDDEN = 1
+    PRONE = 2
+    GRAPPLED = 4
+    RESTRAINED = 8
+    DODGE = 16
+
+    @property
+    def name_value(self) -> str:
+        """序列化使用的字符串值，如prone"""
+        return self.name.lower()
+
+    @classmethod
+    def _missing_(cls, value):
+        # 兼容以字符串值构造，如Condition("prone")
+        if isinstance(value, str):
+            member = cls.__members__.get(value.upper())
+            if member is not None:
+                return member
+        return super()._missing_(value)
+
+
+# 位掩码到条件集合的映射，全部组合共2^5个
+_MASK_TO_CONDITIONS = tuple(
+    frozenset(c for c in Condition if mask & c) for mask in range(1 << len(Condition))
+)
+
+# 位掩码到条件字符串值的映射，按位从低到高排列，用于序列化
+_MASK_TO_NAMES = tuple(
+    tuple(c.name_value for c in Condition if mask & c._value_) for mask in range(1 << len(Condition))
+)
+
+
+def _get_conditions(self) -> FrozenSet[Condition]:
+    """获取当前状态条件集合（只读快照）"""
+    return _MASK_TO_CONDITIONS[self._cond_mask]
+
+
+def _conditions_mask(conditions: Iterable[Union[Condition, str]]) -> int:
+    """将条件集合合并为位掩码，条件可为枚举或字符串值"""
+    mask = 0
+    for condition in conditions:
+        mask |= Condition(condition)._value_
+    return mask
+
+
+def _set_conditions(self, conditions: Iterable[Union[Condition, str]]) -> None:
+    """以条件集合设置状态条件位掩码"""
+    self._cond_mask = _conditions_mask(conditions)
+
+
+_conditions_property = property(_get_conditions, _set_conditions)
+
+
+def _get_proficient_skills(self) -> Tuple[str, ...]:
+    """获取熟练技能（不可变元组）"""
+    return self._proficient_skills
+
+
+def _set_proficient_skills(self, skills: Iterable[str]) -> None:
+    """设置熟练技能，并使小写技能集合缓存失效"""
+    self._proficient_skills = tuple(skills)
+    self._proficient_skills_lc = None
+
+
+def _get_proficient_saves(self) -> Tuple[str, ...]:
+    """获取熟练豁免（不可变元组）"""
+    return self._proficient_saves
+
+
+def _set_proficient_saves(self, saves: Iterable[str]) -> None:
+    """设置熟练豁免，并使豁免集合缓存失效"""
+    self._proficient_saves = tuple(saves)
+    self._proficient_saves_set = None
+
+
+# 熟练项以元组存储，只能整体替换，替换时经由setter清空查询缓存
+_proficient_skills_property = property(_get_proficient_skills, _set_proficient_skills)
+_proficient_saves_property = property(_get_proficient_saves, _set_proficient_saves)
+
+
+# 能力到Abilities字段名的映射
+_ABILITY_FIELDS: Dict[Ability, str] = {
+    Ability.STRENGTH: "strength",
+    Ability.DEXTERITY: "dexterity",
+    Ability.CONSTITUTION: "constitution",
+    Ability.INTELLIGENCE: "intelligence",
+    Ability.WISDOM: "wisdom",
+    Ability.CHARISMA: "charisma",
+}
+
+
+# 技能到能力的映射，键为小写技能名
+_SKILL_TO_ABILITY: Dict[str, Ability] = {
+    "acrobatics": Ability.DEXTERITY,
+    "animal handling": Ability.WISDOM,
+    "arcana": Ability.INTELLIGENCE,
+    "athletics": Ability.STRENGTH,
+    "deception": Ability.CHARISMA,
+    "history": Ability.INTELLIGENCE,
+    "insight": Ability.WISDOM,
+    "intimidation": Ability.CHARISMA,
+    "investigation": Ability.INTELLIGENCE,
+    "medicine": Ability.WISDOM,
+    "nature": Ability.INTELLIGENCE,
+    "perception": Ability.WISDOM,
+    "performance": Ability.CHARISMA,
+    "persuasion": Ability.CHARISMA,
+    "religion": Ability.INTELLIGENCE,
+    "sleight of hand": Ability.DEXTERITY,
+    "stealth": Ability.DEXTERITY,
+    "survival": Ability.WISDOM,
+}
+
+
+def _frozen_twin(cls):
+    """生成值对象的只读孪生类
+
+    热路径上的值对象以普通dataclass构造，字段直接赋值，免去frozen dataclass
+    逐字段调用object.__setattr__的开销；__post_init__末尾将实例的__class__
+    切换为孪生类，此后的赋值与删除都会抛出FrozenInstanceError。孪生类沿用
+    原类名，repr、pickle与dataclasses.replace的行为与frozen dataclass一致。
+
+    Args:
+        cls: 带__slots__的可变dataclass值对象类
+
+    Returns:
+        type: 只读孪生类
+    """
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __new__(twin, *args, **kwargs):
+        # dataclasses.replace等按实例类型构造新对象，交由原类完成初始化
+        return cls(*args, **kwargs)
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __reduce__(self):
+        return (cls, tuple(getattr(self, f.name) for f in fields(cls)))
+
+    return type(cls.__name__, (cls,), {
+        '__slots__': (),
+        '__module__': cls.__module__,
+        '__qualname__': cls.__qualname__,
+        '__setattr__': __setattr__,
+        '__delattr__': __delattr__,
+        '__new__': __new__,
+        '__init__': __init__,
+        '__reduce__': __reduce__,
+    })
+
+
+def _compile_init(cls, params: Sequence[str], body: Sequence[str],
+                  namespace: Optional[Dict[str, Any]] = None, doc: Optional[str] = None):
+    """以源码模板生成专用的__init__
+
+    与attrs的做法相同，由参数列表与逐行赋值语句拼出函数源码再exec，
+    生成的构造函数只包含直接的属性赋值，没有通用构造逻辑的分支与间接调用。
+
+    Args:
+        cls: 所属类，用于设置函数的__qualname__
+        params: 参数列表源码，不含self
+        body: 函数体语句，每项一行
+        namespace: 函数体引用的额外名称，其余名称从本模块全局查找
+        doc: 生成函数的文档字符串
+
+    Returns:
+        function: 生成的__init__
+    """
+    source = "def __init__(self, {}):\n{}".format(
+        ", ".join(params), "\n".join("    " + line for line in body)
+    )
+    scope = dict(globals())
+    if namespace:
+        scope.update(namespace)
+    exec(compile(source, f"<generated {cls.__qualname__}.__init__>", "exec"), scope)
+    init = scope['__init__']
+    init.__qualname__ = f"{cls.__qualname__}.__init__"
+    init.__doc__ = doc
+    return init
+
+
+def _to_epoch_ms(value: datetime) -> int:
+    """将时间转换为毫秒级时间戳"""
+    return int(value.timestamp() * 1000)
+
+
+def _parse_timestamp(value: Any) -> datetime:
+    """解析导出的时间戳，兼容毫秒级整数与ISO格式字符串
+    
+    Args:
+        value: 毫秒级时间戳或ISO格式字符串
+        
+    Returns:
+        datetime: 解析后的时间
+    """
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value / 1000)
+    return datetime.fromisoformat(value)
+
+
+class _HashedValueObject(ValueObject):
+    """构造时预先计算哈希值的值对象基类
+
+    _hash与_as_dict槽位不是dataclass字段，不出现在repr、asdict与fields中；
+    子类在__post_init__中写入_hash，__hash__直接返回。
+    """
+
+    __slots__ = ('_hash', '_as_dict')
+
+    def __hash__(self) -> int:
+        """哈希值"""
+        return self._hash
 
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典
 
-@dataclass(frozen=True)
-class Abilities(ValueObject):
+        实例不可变，字段字典在首次调用时构建并缓存，之后返回其浅拷贝。
+
+        Returns:
+            Dict[str, Any]: 字段名到值的字典
+        """
+        try:
+            cached = self._as_dict
+        except AttributeError:
+            cached = {f.name: getattr(self, f.name) for f in fields(self)}
+            object.__setattr__(self, '_as_dict', cached)
+        return cached.copy()
+
+
+@dataclass(slots=True)
+class Abilities(_HashedValueObject):
     """角色能力值"""
     strength: int = 10
     dexterity: int = 10
@@ -58,6 +332,14 @@ class Abilities(ValueObject):
     wisdom: int = 10
     charisma: int = 10
 
+    def __post_init__(self):
+        """预先计算哈希值，并切换为只读孪生类"""
+        self._hash = hash(self._get_equality_components())
+        self.__class__ = _FrozenAbilities
+
+    # 显式声明，避免dataclass因eq=True将__hash__置为None
+    __hash__ = _HashedValueObject.__hash__
+
     def _get_equality_components(self) -> tuple:
         """获取相等性比较的组件"""
         return (
@@ -71,32 +353,19 @@ class Abilities(ValueObject):
 
     def get_modifier(self, ability: Ability) -> int:
         """获取能力修正值"""
-        ability_map = {
-            Ability.STRENGTH: self.strength,
-            Ability.DEXTERITY: self.dexterity,
-            Ability.CONSTITUTION: self.constitution,
-            Ability.INTELLIGENCE: self.intelligence,
-            Ability.WISDOM: self.wisdom,
-            Ability.CHARISMA: self.charisma,
-        }
-        score = ability_map.get(ability, 10)
-        return (score - 10) // 2
+        return (self.get_score(ability) - 10) // 2
 
     def get_score(self, ability: Ability) -> int:
         """获取能力值"""
-        ability_map = {
-            Ability.STRENGTH: self.strength,
-            Ability.DEXTERITY: self.dexterity,
-            Ability.CONSTITUTION: self.constitution,
-            Ability.INTELLIGENCE: self.intelligence,
-            Ability.WISDOM: self.wisdom,
-            Ability.CHARISMA: self.charisma,
-        }
-        return ability_map.get(ability, 10)
+        name = _ABILITY_FIELDS.get(ability)
+        return getattr(self, name) if name is not None else 10
+
+
+_FrozenAbilities = _frozen_twin(Abilities)
 
 
-@dataclass(frozen=True)
-class CharacterStats(ValueObject):
+@dataclass(slots=True)
+class CharacterStats(_HashedValueObject):
     """角色统计数据"""
     level: int = 1
     armor_class: int = 10
@@ -104,6 +373,14 @@ class CharacterStats(ValueObject):
     speed_steps: int = 6
     reach_steps: int = 1
 
+    def __post_init__(self):
+        """预先计算哈希值，并切换为只读孪生类"""
+        self._hash = hash(self._get_equality_components())
+        self.__class__ = _FrozenCharacterStats
+
+    # 显式声明，避免dataclass因eq=True将__hash__置为None
+    __hash__ = _HashedValueObject.__hash__
+
     def _get_equality_components(self) -> tuple:
         """获取相等性比较的组件"""
         return (
@@ -115,12 +392,23 @@ class CharacterStats(ValueObject):
         )
 
 
-@dataclass(frozen=True)
-class Position(ValueObject):
+_FrozenCharacterStats = _frozen_twin(CharacterStats)
+
+
+@dataclass(slots=True)
+class Position(_HashedValueObject):
     """位置坐标"""
     x: int
     y: int
 
+    def __post_init__(self):
+        """预先计算哈希值，并切换为只读孪生类"""
+        self._hash = hash(self._get_equality_components())
+        self.__class__ = _FrozenPosition
+
+    # 显式声明，避免dataclass因eq=True将__hash__置为None
+    __hash__ = _HashedValueObject.__hash__
+
     def _get_equality_components(self) -> tuple:
         """获取相等性比较的组件"""
         return (self.x, self.y)
@@ -129,28 +417,47 @@ class Position(ValueObject):
         """计算到另一个位置的曼哈顿距离"""
         return abs(self.x - other.x) + abs(self.y - other.y)
 
+    def distance_to_many(self, xs: Sequence[int], ys: Sequence[int]) -> List[int]:
+        """批量计算到多个坐标的曼哈顿距离
+
+        坐标以两个并列序列传入（列表或array('i')均可），在一次遍历中完成，
+        省去逐个构造Position与调用distance_to的开销。
+
+        Args:
+            xs: 横坐标序列
+            ys: 纵坐标序列，长度与xs一致
+
+        Returns:
+            List[int]: 与输入一一对应的距离列表
+        """
+        px = self.x
+        py = self.y
+        return [abs(px - x) + abs(py - y) for x, y in zip(xs, ys)]
+
+
+_FrozenPosition = _frozen_twin(Position)
 
-@dataclass
+
+@dataclass(init=False)
 class Character(AggregateRoot):
-    """角色聚合根"""
+    """角色聚合根
+    
+    __init__由_compile_init按字段生成，见类定义之后的_character_init。
+    """
     name: str
     abilities: Abilities
     stats: CharacterStats
     hp: int
     max_hp: int
     position: Optional[Position] = None
-    proficient_skills: List[str] = field(default_factory=list)
-    proficient_saves: List[str] = field(default_factory=list)
+    proficient_skills: Tuple[str, ...] = ()
+    proficient_saves: Tuple[str, ...] = ()
     conditions: Set[Condition] = field(default_factory=set)
     inventory: Dict[str, int] = field(default_factory=dict)
 
-    def __post_init__(self):
-        if not self.name:
-            raise ValueError("角色名称不能为空")
-        if self.hp < 0:
-            self.hp = 0
-        if self.hp > self.max_hp:
-            self.hp = self.max_hp
+    def _on_mutation(self) -> None:
+        """状态变更钩子，在每个修改角色状态的方法末尾调用，子类可覆盖"""
+        pass
 
     @property
     def is_alive(self) -> bool:
@@ -160,134 +467,153 @@ class Character(AggregateRoot):
     @property
     def dexterity_modifier(self) -> int:
         """敏捷修正值"""
-        return self.abilities.get_modifier(Ability.DEXTERITY)
+        return (self.abilities.dexterity - 10) // 2
 
     def take_damage(self, amount: int) -> None:
         """受到伤害"""
         if amount < 0:
             return
-        self.hp = max(0, self.hp - amount)
-        if self.hp == 0:
-            self.add_domain_event(CharacterDomainEvent("character_knocked_out", {
-                "character_name": self.name,
-                "damage": amount
+        hp = self.hp - amount
+        if hp <= 0:
+            hp = 0
+        self.hp = hp
+        if hp == 0:
+            self.add_domain_event(LazyDomainEvent("character_knocked_out", lambda n=self.name, a=amount: {
+                "character_name": n,
+                "damage": a
             }))
+        self._on_mutation()
 
     def heal(self, amount: int) -> None:
         """恢复生命值"""
         if amount < 0:
             return
         old_hp = self.hp
-        self.hp = min(self.max_hp, self.hp + amount)
-        if self.hp > old_hp:
-            self.add_domain_event(CharacterDomainEvent("character_healed", {
-                "character_name": self.name,
-                "amount": amount,
-                "old_hp": old_hp,
-                "new_hp": self.hp
+        hp = old_hp + amount
+        max_hp = self.max_hp
+        if hp > max_hp:
+            hp = max_hp
+        self.hp = hp
+        if hp > old_hp:
+            self.add_domain_event(LazyDomainEvent("character_healed", lambda n=self.name, a=amount, o=old_hp, h=hp: {
+                "character_name": n,
+                "amount": a,
+                "old_hp": o,
+                "new_hp": h
             }))
+        self._on_mutation()
 
     def move_to(self, position: Position) -> None:
         """移动到新位置"""
         old_position = self.position
         self.position = position
-        self.add_domain_event(CharacterDomainEvent("character_moved", {
-            "character_name": self.name,
-            "old_position": old_position,
-            "new_position": position
+        self.add_domain_event(LazyDomainEvent("character_moved", lambda n=self.name, op=old_position, p=position: {
+            "character_name": n,
+            "old_position": op,
+            "new_position": p
         }))
+        self._on_mutation()
 
     def add_condition(self, condition: Condition) -> None:
         """添加状态条件"""
-        if condition not in self.conditions:
-            self.conditions.add(condition)
-            self.add_domain_event(CharacterDomainEvent("condition_added", {
-                "character_name": self.name,
-                "condition": condition.value
+        bit = condition._value_
+        if not self._cond_mask & bit:
+            self._cond_mask |= bit
+            self.add_domain_event(LazyDomainEvent("condition_added", lambda n=self.name, c=condition: {
+                "character_name": n,
+                "condition": c.name_value
             }))
+            self._on_mutation()
 
     def remove_condition(self, condition: Condition) -> None:
         """移除状态条件"""
-        if condition in self.conditions:
-            self.conditions.remove(condition)
-            self.add_domain_event(CharacterDomainEvent("condition_removed", {
-                "character_name": self.name,
-                "condition": condition.value
+        bit = condition._value_
+        if self._cond_mask & bit:
+            self._cond_mask &= ~bit
+            self.add_domain_event(LazyDomainEvent("condition_removed", lambda n=self.name, c=condition: {
+                "character_name": n,
+                "condition": c.name_value
             }))
+            self._on_mutation()
 
     def has_condition(self, condition: Condition) -> bool:
         """检查是否有指定状态条件"""
-        return condition in self.conditions
+        return self._cond_mask & condition._value_ != 0
+
+    @property
+    def condition_names(self) -> List[str]:
+        """当前状态条件的字符串值列表，按位从低到高排列"""
+        return list(_MASK_TO_NAMES[self._cond_mask])
 
     def add_item(self, item_name: str, quantity: int = 1) -> None:
         """添加物品到物品栏"""
         if quantity <= 0:
             return
-        current_quantity = self.inventory.get(item_name, 0)
-        self.inventory[item_name] = current_quantity + quantity
-        self.add_domain_event(CharacterDomainEvent("item_added", {
-            "character_name": self.name,
-            "item_name": item_name,
-            "quantity": quantity,
-            "total_quantity": self.inventory[item_name]
+        inventory = self.inventory
+        item_name = sys.intern(item_name)
+        total = inventory.get(item_name, 0) + quantity
+        inventory[item_name] = total
+        self.add_domain_event(LazyDomainEvent("item_added", lambda n=self.name, i=item_name, q=quantity, t=total: {
+            "character_name": n,
+            "item_name": i,
+            "quantity": q,
+            "total_quantity": t
         }))
+        self._on_mutation()
 
     def remove_item(self, item_name: str, quantity: int = 1) -> bool:
         """从物品栏移除物品"""
         if quantity <= 0:
             return False
-        current_quantity = self.inventory.get(item_name, 0)
+        inventory = self.inventory
+        current_quantity = inventory.get(item_name, 0)
         if current_quantity < quantity:
             return False
         
         new_quantity = current_quantity - quantity
         if new_quantity == 0:
-            del self.inventory[item_name]
+            del inventory[item_name]
         else:
-            self.inventory[item_name] = new_quantity
+            inventory[item_name] = new_quantity
         
-        self.add_domain_event(CharacterDomainEvent("item_removed", {
-            "character_name": self.name,
-            "item_name": item_name,
-            "quantity": quantity,
-            "remaining_quantity": new_quantity
+        self.add_domain_event(LazyDomainEvent("item_removed", lambda n=self.name, i=item_name, q=quantity, r=new_quantity: {
+            "character_name": n,
+            "item_name": i,
+            "quantity": q,
+            "remaining_quantity": r
         }))
+        self._on_mutation()
         return True
 
     def is_proficient_in_skill(self, skill: str) -> bool:
         """检查是否熟练指定技能"""
-        return skill.lower() in [s.lower() for s in self.proficient_skills]
+        lowered = self._proficient_skills_lc
+        # 熟练技能被整体替换后由setter清空缓存，此处按需重建
+        if lowered is None:
+            lowered = frozenset(s.lower() for s in self._proficient_skills)
+            self._proficient_skills_lc = lowered
+        return skill.lower() in lowered
+
+    def add_proficiency(self, skill: str) -> None:
+        """添加熟练技能，并同步更新小写技能集合"""
+        if self.is_proficient_in_skill(skill):
+            return
+        self._proficient_skills += (skill,)
+        self._proficient_skills_lc = self._proficient_skills_lc | {skill.lower()}
+        self._on_mutation()
 
     def is_proficient_in_save(self, ability: Ability) -> bool:
         """检查是否熟练指定豁免"""
-        return ability.value in self.proficient_saves
+        saves = self._proficient_saves_set
+        if saves is None:
+            saves = frozenset(self._proficient_saves)
+            self._proficient_saves_set = saves
+        return ability.value in saves
 
     def get_skill_modifier(self, skill: str) -> int:
         """获取技能修正值"""
-        # 技能到能力的映射
-        skill_to_ability = {
-            "acrobatics": Ability.DEXTERITY,
-            "animal handling": Ability.WISDOM,
-            "arcana": Ability.INTELLIGENCE,
-            "athletics": Ability.STRENGTH,
-            "deception": Ability.CHARISMA,
-            "history": Ability.INTELLIGENCE,
-            "insight": Ability.WISDOM,
-            "intimidation": Ability.CHARISMA,
-            "investigation": Ability.INTELLIGENCE,
-            "medicine": Ability.WISDOM,
-            "nature": Ability.INTELLIGENCE,
-            "perception": Ability.WISDOM,
-            "performance": Ability.CHARISMA,
-            "persuasion": Ability.CHARISMA,
-            "religion": Ability.INTELLIGENCE,
-            "sleight of hand": Ability.DEXTERITY,
-            "stealth": Ability.DEXTERITY,
-            "survival": Ability.WISDOM,
-        }
-        
-        ability = skill_to_ability.get(skill.lower())
-        if not ability:
+        ability = _SKILL_TO_ABILITY.get(skill.lower())
+        if ability is None:
             return 0
         
         modifier = self.abilities.get_modifier(ability)
@@ -330,7 +656,72 @@ class Character(AggregateRoot):
         return modifier
 
 
-@dataclass(frozen=True)
+# 状态条件以位掩码存储，对外经由该属性读写
+Character.conditions = _conditions_property
+Character.proficient_skills = _proficient_skills_property
+Character.proficient_saves = _proficient_saves_property
+
+
+def _character_field_lines() -> tuple:
+    """生成Character各字段的赋值语句及其引用的默认值工厂
+    
+    带默认工厂的字段以None作为参数缺省值，传入None时调用工厂创建新对象；
+    状态条件直接合并为位掩码写入。
+    
+    Returns:
+        tuple: (赋值语句列表, 语句引用的名称字典)
+    """
+    lines = []
+    namespace = {}
+    for f in fields(Character):
+        name = f.name
+        if name == 'conditions':
+            lines.append("self._cond_mask = 0 if conditions is None else _conditions_mask(conditions)")
+        elif name in ('proficient_skills', 'proficient_saves'):
+            lines.append(f"self._{name} = () if {name} is None else tuple({name})")
+        elif f.default_factory is not MISSING:
+            namespace[f"_factory_{name}"] = f.default_factory
+            lines.append(f"self.{name} = _factory_{name}() if {name} is None else {name}")
+        else:
+            lines.append(f"self.{name} = {name}")
+    lines.append("self._proficient_skills_lc = None")
+    lines.append("self._proficient_saves_set = None")
+    return lines, namespace
+
+
+def _character_init():
+    """生成Character.__init__：校验名称、初始化聚合根、逐字段赋值并修正生命值"""
+    params = []
+    for f in fields(Character):
+        if f.default is not MISSING:
+            params.append(f"{f.name}={f.default!r}")
+        elif f.default_factory is not MISSING:
+            params.append(f"{f.name}=None")
+        else:
+            params.append(f.name)
+    lines, namespace = _character_field_lines()
+    body = [
+        "if not name:",
+        "    raise ValueError('角色名称不能为空')",
+        "AggregateRoot.__init__(self)",
+        *lines,
+        "if hp < 0:",
+        "    self.hp = 0",
+        "if self.hp > max_hp:",
+        "    self.hp = max_hp",
+    ]
+    return _compile_init(Character, params, body, namespace)
+
+
+Character.__init__ = _character_init()
+
+
+def _truncate(text: str, limit: int) -> str:
+    """截断文本，超出长度时追加省略号"""
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+@dataclass(frozen=True, slots=True)
 class CharacterCardInfo(ValueObject):
     """角色卡信息值对象
     
@@ -339,26 +730,38 @@ class CharacterCardInfo(ValueObject):
     """
     description: str = ""
     first_message: str = ""
-    example_messages: List[str] = field(default_factory=list)
+    example_messages: Tuple[str, ...] = ()
     scenario: str = ""
     personality_summary: str = ""
     creator_notes: str = ""
-    tags: List[str] = field(default_factory=list)
+    tags: Tuple[str, ...] = ()
+    # 事件载荷使用的截断描述，构造时计算一次
+    _short100: str = field(init=False, repr=False, compare=False)
+    _short50: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """将序列字段规整为元组，并预先计算截断描述"""
+        # 已是元组时tuple()直接返回原对象
+        object.__setattr__(self, 'example_messages', tuple(self.example_messages))
+        object.__setattr__(self, 'tags', tuple(self.tags))
+        description = self.description
+        object.__setattr__(self, '_short100', _truncate(description, 100))
+        object.__setattr__(self, '_short50', _truncate(description, 50))
     
     def _get_equality_components(self) -> tuple:
         """获取相等性比较的组件"""
         return (
             self.description,
             self.first_message,
-            tuple(self.example_messages),
+            self.example_messages,
             self.scenario,
             self.personality_summary,
             self.creator_notes,
-            tuple(self.tags)
+            self.tags
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PNGMetadata(ValueObject):
     """PNG图像元数据值对象
     
@@ -399,9 +802,9 @@ class PNGMetadata(ValueObject):
             PNGMetadata: PNG元数据对象
         """
         try:
-            # 解码Base64数据
-            json_data = base64.b64decode(base64_data).decode('utf-8')
-            data = json.loads(json_data)
+            # 解码Base64数据，json可直接解析UTF-8字节，解码结果同时作为原始数据保存
+            raw = base64.b64decode(base64_data)
+            data = json.loads(raw)
             
             return cls(
                 name=data.get('name', ''),
@@ -412,19 +815,19 @@ class PNGMetadata(ValueObject):
                 example_dialogue=data.get('example_dialogue', ''),
                 mes_example=data.get('mes_example', ''),
                 background=data.get('background', ''),
-                data=base64.b64decode(base64_data)
+                data=raw
             )
         except Exception:
             # 如果解析失败，返回空的元数据对象
             return cls()
     
-    def to_base64(self) -> str:
-        """转换为Base64字符串
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典（不含原始数据）
         
         Returns:
-            str: Base64编码的字符串
+            Dict[str, Any]: 元数据字段字典
         """
-        data = {
+        return {
             'name': self.name,
             'description': self.description,
             'personality': self.personality,
@@ -434,64 +837,47 @@ class PNGMetadata(ValueObject):
             'mes_example': self.mes_example,
             'background': self.background
         }
+    
+    def to_base64(self) -> str:
+        """转换为Base64字符串
         
-        json_data = json.dumps(data, ensure_ascii=False)
-        return base64.b64encode(json_data.encode('utf-8')).decode('utf-8')
+        Returns:
+            str: Base64编码的字符串
+        """
+        return base64.b64encode(_dumps(self.to_dict())).decode('ascii')
+
+
+# from_dict从序列化数据中读取的各值对象字段
+_ABILITY_KEYS = ('strength', 'dexterity', 'constitution', 'intelligence', 'wisdom', 'charisma')
+_STATS_KEYS = ('level', 'armor_class', 'proficiency_bonus', 'speed_steps', 'reach_steps')
+_CARD_INFO_KEYS = (
+    'description', 'first_message', 'example_messages', 'scenario',
+    'personality_summary', 'creator_notes', 'tags',
+)
+_PNG_METADATA_KEYS = (
+    'name', 'description', 'personality', 'scenario',
+    'first_mes', 'example_dialogue', 'mes_example', 'background',
+)
 
 
-class CharacterCard(AggregateRoot):
+class CharacterCard(Character):
     """角色卡聚合根
     
     扩展自Character聚合根，添加角色卡特有的功能。
     遵循单一职责原则，专门负责角色卡的管理。
+    角色行为继承自Character，每次状态变更额外更新时间戳与版本。
     """
     
-    def __init__(self, name: str, card_info: CharacterCardInfo,
-                 abilities: Optional[Abilities] = None,
-                 stats: Optional[CharacterStats] = None,
-                 hp: int = 100, max_hp: int = 100,
-                 position: Optional[Position] = None,
-                 png_metadata: Optional[PNGMetadata] = None,
-                 **kwargs):
-        """初始化角色卡
-        
-        Args:
-            name: 角色名称
-            card_info: 角色卡信息
-            abilities: 角色能力值
-            stats: 角色统计数据
-            hp: 当前生命值
-            max_hp: 最大生命值
-            position: 角色位置
-            png_metadata: PNG元数据
-            **kwargs: 其他角色属性
-        """
-        super().__init__()
-        
-        # 基本角色属性
-        self.name = name
-        self.abilities = abilities or Abilities()
-        self.stats = stats or CharacterStats()
-        self.hp = hp
-        self.max_hp = max_hp
-        self.position = position
-        self.proficient_skills = kwargs.get('proficient_skills', [])
-        self.proficient_saves = kwargs.get('proficient_saves', [])
-        self.conditions = set(kwargs.get('conditions', []))
-        self.inventory = kwargs.get('inventory', {})
-        
-        # 角色卡特有属性
-        self.card_info = card_info
-        self.png_metadata = png_metadata or PNGMetadata()
-        
-        # 验证角色卡
-        self.validate()
-        
-        # 添加领域事件
-        self.add_domain_event(CharacterDomainEvent("character_card_created", {
-            "character_name": self.name,
-            "description": self.card_info.description[:100] + "..." if len(self.card_info.description) > 100 else self.card_info.description
-        }))
+    # 角色卡是以ID标识的实体，不使用Character由dataclass生成的按字段比较
+    __eq__ = BaseEntity.__eq__
+    __hash__ = BaseEntity.__hash__
+    __repr__ = BaseEntity.__repr__
+    
+    # __init__由_compile_init生成，见类定义之后的_character_card_init
+    
+    def _on_mutation(self) -> None:
+        """状态变更后更新时间戳与版本"""
+        self._mark_as_updated()
     
     def update_card_info(self, card_info: CharacterCardInfo) -> None:
         """更新角色卡信息
@@ -506,8 +892,8 @@ class CharacterCard(AggregateRoot):
         # 添加领域事件
         self.add_domain_event(CharacterDomainEvent("character_card_updated", {
             "character_name": self.name,
-            "old_description": old_info.description[:50] + "..." if len(old_info.description) > 50 else old_info.description,
-            "new_description": card_info.description[:50] + "..." if len(card_info.description) > 50 else card_info.description
+            "old_description": old_info._short50,
+            "new_description": card_info._short50
         }))
     
     def update_png_metadata(self, png_metadata: PNGMetadata) -> None:
@@ -525,59 +911,39 @@ class CharacterCard(AggregateRoot):
             "has_data": png_metadata.data is not None
         }))
     
-    def export_to_dict(self) -> Dict[str, Any]:
+    def export_to_dict(self, epoch_timestamps: bool = False) -> Dict[str, Any]:
         """导出为字典格式
         
+        Args:
+            epoch_timestamps: 为True时时间戳导出为毫秒级整数，适用于批量导出
+                与内部存储；默认导出ISO格式字符串以兼容已有的导出文件
+        
         Returns:
             Dict[str, Any]: 角色卡数据的字典表示
         """
+        format_time = _to_epoch_ms if epoch_timestamps else datetime.isoformat
         return {
             'id': str(self.id),
             'name': self.name,
             'description': self.card_info.description,
             'first_message': self.card_info.first_message,
-            'example_messages': self.card_info.example_messages,
+            'example_messages': list(self.card_info.example_messages),
             'scenario': self.card_info.scenario,
             'personality_summary': self.card_info.personality_summary,
             'creator_notes': self.card_info.creator_notes,
-            'tags': self.card_info.tags,
-            'abilities': {
-                'strength': self.abilities.strength,
-                'dexterity': self.abilities.dexterity,
-                'constitution': self.abilities.constitution,
-                'intelligence': self.abilities.intelligence,
-                'wisdom': self.abilities.wisdom,
-                'charisma': self.abilities.charisma,
-            },
-            'stats': {
-                'level': self.stats.level,
-                'armor_class': self.stats.armor_class,
-                'proficiency_bonus': self.stats.proficiency_bonus,
-                'speed_steps': self.stats.speed_steps,
-                'reach_steps': self.stats.reach_steps,
-            },
+            'tags': list(self.card_info.tags),
+            'abilities': self.abilities.to_dict(),
+            'stats': self.stats.to_dict(),
             'hp': self.hp,
             'max_hp': self.max_hp,
-            'position': {
-                'x': self.position.x,
-                'y': self.position.y,
-            } if self.position else None,
-            'proficient_skills': self.proficient_skills,
-            'proficient_saves': self.proficient_saves,
-            'conditions': [c.value for c in self.conditions],
+            'position': self.position.to_dict() if self.position else None,
+            'proficient_skills': list(self.proficient_skills),
+            'proficient_saves': list(self.proficient_saves),
+            'conditions': self.condition_names,
             'inventory': self.inventory,
-            'png_metadata': {
-                'name': self.png_metadata.name,
-                'description': self.png_metadata.description,
-                'personality': self.png_metadata.personality,
-                'scenario': self.png_metadata.scenario,
-                'first_mes': self.png_metadata.first_mes,
-                'example_dialogue': self.png_metadata.example_dialogue,
-                'mes_example': self.png_metadata.mes_example,
-                'background': self.png_metadata.background,
-            },
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'png_metadata': self.png_metadata.to_dict(),
+            'created_at': format_time(self.created_at) if self.created_at else None,
+            'updated_at': format_time(self.updated_at) if self.updated_at else None,
         }
     
     @classmethod
@@ -590,56 +956,23 @@ class CharacterCard(AggregateRoot):
         Returns:
             CharacterCard: 角色卡实例
         """
-        # 创建能力值对象
+        # 缺失的键直接使用各值对象的字段默认值
         abilities_data = data.get('abilities', {})
-        abilities = Abilities(
-            strength=abilities_data.get('strength', 10),
-            dexterity=abilities_data.get('dexterity', 10),
-            constitution=abilities_data.get('constitution', 10),
-            intelligence=abilities_data.get('intelligence', 10),
-            wisdom=abilities_data.get('wisdom', 10),
-            charisma=abilities_data.get('charisma', 10),
-        )
+        abilities = Abilities(**{k: abilities_data[k] for k in _ABILITY_KEYS if k in abilities_data})
         
-        # 创建统计数据对象
         stats_data = data.get('stats', {})
-        stats = CharacterStats(
-            level=stats_data.get('level', 1),
-            armor_class=stats_data.get('armor_class', 10),
-            proficiency_bonus=stats_data.get('proficiency_bonus', 2),
-            speed_steps=stats_data.get('speed_steps', 6),
-            reach_steps=stats_data.get('reach_steps', 1),
-        )
+        stats = CharacterStats(**{k: stats_data[k] for k in _STATS_KEYS if k in stats_data})
         
-        # 创建位置对象
         position_data = data.get('position')
         position = None
         if position_data:
             position = Position(x=position_data['x'], y=position_data['y'])
         
-        # 创建角色卡信息对象
-        card_info = CharacterCardInfo(
-            description=data.get('description', ''),
-            first_message=data.get('first_message', ''),
-            example_messages=data.get('example_messages', []),
-            scenario=data.get('scenario', ''),
-            personality_summary=data.get('personality_summary', ''),
-            creator_notes=data.get('creator_notes', ''),
-            tags=data.get('tags', []),
-        )
+        # 角色卡信息字段位于顶层
+        card_info = CharacterCardInfo(**{k: data[k] for k in _CARD_INFO_KEYS if k in data})
         
-        # 创建PNG元数据对象
         png_data = data.get('png_metadata', {})
-        png_metadata = PNGMetadata(
-            name=png_data.get('name', ''),
-            description=png_data.get('description', ''),
-            personality=png_data.get('personality', ''),
-            scenario=png_data.get('scenario', ''),
-            first_mes=png_data.get('first_mes', ''),
-            example_dialogue=png_data.get('example_dialogue', ''),
-            mes_example=png_data.get('mes_example', ''),
-            background=png_data.get('background', ''),
-        )
+        png_metadata = PNGMetadata(**{k: png_data[k] for k in _PNG_METADATA_KEYS if k in png_data})
         
         # 创建角色卡
         character_card = cls(
@@ -653,7 +986,7 @@ class CharacterCard(AggregateRoot):
             png_metadata=png_metadata,
             proficient_skills=data.get('proficient_skills', []),
             proficient_saves=data.get('proficient_saves', []),
-            inventory=data.get('inventory', {}),
+            inventory={sys.intern(k): v for k, v in data.get('inventory', {}).items()},
         )
         
         # 设置条件和时间戳
@@ -665,195 +998,58 @@ class CharacterCard(AggregateRoot):
         
         # 设置时间戳（通过内部属性设置）
         if data.get('created_at'):
-            character_card._created_at = datetime.fromisoformat(data['created_at'])
+            character_card._created_at = _parse_timestamp(data['created_at'])
         if data.get('updated_at'):
-            character_card._updated_at = datetime.fromisoformat(data['updated_at'])
+            character_card._updated_at = _parse_timestamp(data['updated_at'])
         
         return character_card
+
+
+def _character_card_init():
+    """生成CharacterCard.__init__
     
-    def validate(self) -> None:
-        """验证角色卡状态
-        
-        Raises:
-            ValidationException: 验证失败时抛出
-        """
-        from ...core.exceptions import ValidationException
-        
-        if not self.name or not self.name.strip():
-            raise ValidationException("角色名称不能为空")
-        
-        if self.max_hp <= 0:
-            raise ValidationException("最大生命值必须大于0")
-        
-        if self.hp < 0:
-            raise ValidationException("当前生命值不能小于0")
-        
-        if self.hp > self.max_hp:
-            raise ValidationException("当前生命值不能大于最大生命值")
-    
-    def _get_business_rules(self) -> List['BusinessRule']:
-        """获取业务规则列表
+    角色属性的赋值语句与Character共用；角色卡由validate统一校验，
+    不做Character的名称检查与生命值修正。
+    """
+    params = [
+        "name", "card_info", "abilities=None", "stats=None",
+        "hp=100", "max_hp=100", "position=None", "png_metadata=None",
+        "proficient_skills=None", "proficient_saves=None",
+        "conditions=None", "inventory=None",
+    ]
+    lines, namespace = _character_field_lines()
+    body = [
+        "AggregateRoot.__init__(self)",
+        "if abilities is None:",
+        "    abilities = Abilities()",
+        "if stats is None:",
+        "    stats = CharacterStats()",
+        *lines,
+        "self.card_info = card_info",
+        "self.png_metadata = PNGMetadata() if png_metadata is None else png_metadata",
+        "self.validate()",
+        "self.add_domain_event(CharacterDomainEvent('character_card_created', {",
+        "    'character_name': name,",
+        "    'description': card_info._short100,",
+        "}))",
+    ]
+    doc = """初始化角色卡
         
-        Returns:
-            List[BusinessRule]: 业务规则列表
+        Args:
+            name: 角色名称
+            card_info: 角色卡信息
+            abilities: 角色能力值，为None时使用默认值
+            stats: 角色统计数据，为None时使用默认值
+            hp: 当前生命值
+            max_hp: 最大生命值
+            position: 角色位置
+            png_metadata: PNG元数据，为None时使用默认值
+            proficient_skills: 熟练技能列表
+            proficient_saves: 熟练豁免列表
+            conditions: 状态条件，可为枚举或字符串值
+            inventory: 物品栏
         """
-        return []
-    
-    # 继承Character类的其他方法
-    @property
-    def is_alive(self) -> bool:
-        """检查角色是否存活"""
-        return self.hp > 0
-    
-    @property
-    def dexterity_modifier(self) -> int:
-        """敏捷修正值"""
-        return self.abilities.get_modifier(Ability.DEXTERITY)
-    
-    def take_damage(self, amount: int) -> None:
-        """受到伤害"""
-        if amount < 0:
-            return
-        self.hp = max(0, self.hp - amount)
-        if self.hp == 0:
-            self.add_domain_event(CharacterDomainEvent("character_knocked_out", {
-                "character_name": self.name,
-                "damage": amount
-            }))
-        self._mark_as_updated()
-    
-    def heal(self, amount: int) -> None:
-        """恢复生命值"""
-        if amount < 0:
-            return
-        old_hp = self.hp
-        self.hp = min(self.max_hp, self.hp + amount)
-        if self.hp > old_hp:
-            self.add_domain_event(CharacterDomainEvent("character_healed", {
-                "character_name": self.name,
-                "amount": amount,
-                "old_hp": old_hp,
-                "new_hp": self.hp
-            }))
-        self._mark_as_updated()
-    
-    def move_to(self, position: Position) -> None:
-        """移动到新位置"""
-        old_position = self.position
-        self.position = position
-        self.add_domain_event(CharacterDomainEvent("character_moved", {
-            "character_name": self.name,
-            "old_position": old_position,
-            "new_position": position
-        }))
-        self._mark_as_updated()
-    
-    def add_condition(self, condition: Condition) -> None:
-        """添加状态条件"""
-        if condition not in self.conditions:
-            self.conditions.add(condition)
-            self.add_domain_event(CharacterDomainEvent("condition_added", {
-                "character_name": self.name,
-                "condition": condition.value
-            }))
-            self._mark_as_updated()
-    
-    def remove_condition(self, condition: Condition) -> None:
-        """移除状态条件"""
-        if condition in self.conditions:
-            self.conditions.remove(condition)
-            self.add_domain_event(CharacterDomainEvent("condition_removed", {
-                "character_name": self.name,
-                "condition": condition.value
-            }))
-            self._mark_as_updated()
-    
-    def has_condition(self, condition: Condition) -> bool:
-        """检查是否有指定状态条件"""
-        return condition in self.conditions
-    
-    def add_item(self, item_name: str, quantity: int = 1) -> None:
-        """添加物品到物品栏"""
-        if quantity <= 0:
-            return
-        current_quantity = self.inventory.get(item_name, 0)
-        self.inventory[item_name] = current_quantity + quantity
-        self.add_domain_event(CharacterDomainEvent("item_added", {
-            "character_name": self.name,
-            "item_name": item_name,
-            "quantity": quantity,
-            "total_quantity": self.inventory[item_name]
-        }))
-        self._mark_as_updated()
-    
-    def remove_item(self, item_name: str, quantity: int = 1) -> bool:
-        """从物品栏移除物品"""
-        if quantity <= 0:
-            return False
-        current_quantity = self.inventory.get(item_name, 0)
-        if current_quantity < quantity:
-            return False
-        
-        new_quantity = current_quantity - quantity
-        if new_quantity == 0:
-            del self.inventory[item_name]
-        else:
-            self.inventory[item_name] = new_quantity
-        
-        self.add_domain_event(CharacterDomainEvent("item_removed", {
-            "character_name": self.name,
-            "item_name": item_name,
-            "quantity": quantity,
-            "remaining_quantity": new_quantity
-        }))
-        self._mark_as_updated()
-        return True
-    
-    def is_proficient_in_skill(self, skill: str) -> bool:
-        """检查是否熟练指定技能"""
-        return skill.lower() in [s.lower() for s in self.proficient_skills]
-    
-    def is_proficient_in_save(self, ability: Ability) -> bool:
-        """检查是否熟练指定豁免"""
-        return ability.value in self.proficient_saves
-    
-    def get_skill_modifier(self, skill: str) -> int:
-        """获取技能修正值"""
-        # 技能到能力的映射
-        skill_to_ability = {
-            "acrobatics": Ability.DEXTERITY,
-            "animal handling": Ability.WISDOM,
-            "arcana": Ability.INTELLIGENCE,
-            "athletics": Ability.STRENGTH,
-            "deception": Ability.CHARISMA,
-            "history": Ability.INTELLIGENCE,
-            "insight": Ability.WISDOM,
-            "intimidation": Ability.CHARISMA,
-            "investigation": Ability.INTELLIGENCE,
-            "medicine": Ability.WISDOM,
-            "nature": Ability.INTELLIGENCE,
-            "perception": Ability.WISDOM,
-            "performance": Ability.CHARISMA,
-            "persuasion": Ability.CHARISMA,
-            "religion": Ability.INTELLIGENCE,
-            "sleight of hand": Ability.DEXTERITY,
-            "stealth": Ability.DEXTERITY,
-            "survival": Ability.WISDOM,
-        }
-        
-        ability = skill_to_ability.get(skill.lower())
-        if not ability:
-            return 0
-        
-        modifier = self.abilities.get_modifier(ability)
-        if self.is_proficient_in_skill(skill):
-            modifier += self.stats.proficiency_bonus
-        
-        return modifier
-    
-    def get_save_modifier(self, ability: Ability) -> int:
-        """获取豁免修正值"""
-        modifier = self.abilities.get_modifier(ability)
-        if self.is_proficient_in_save(ability):
-            modifier += self.stats.proficiency_bonus
-        return modifier
\ No newline at end of file
+    return _compile_init(CharacterCard, params, body, namespace, doc)
+
+
+CharacterCard.__init__ = _character_card_init()
@@ -2,11 +2,14 @@
 战斗领域模型
 包含战斗的属性、状态和行为规则
 """
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field
 from typing import Dict, List, Optional, Set, Tuple, Any
 from enum import Enum
+from types import MappingProxyType
+import bisect
+import random
 
-from .base import Entity, ValueObject, AggregateRoot
+from .base import Entity, ValueObject, AggregateRoot, BusinessRule
 from .characters import Character, Position
 
 
@@ -26,6 +29,22 @@ class CoverLevel(Enum):
     TOTAL = "total"
 
 
+# 枚举值查找表，快照序列化时以字典查找代替.value描述符访问
+_RANGE_BAND_VALUES: Dict[RangeBand, str] = {band: band.value for band in RangeBand}
+_COVER_VALUES: Dict[CoverLevel, str] = {level: level.value for level in CoverLevel}
+
+# d20的全部点数
+_D20_FACES = range(1, 21)
+
+# 掩体等级对应的(攻击检定加值, 是否完全遮挡)
+_COVER_BONUS_TABLE: Dict[CoverLevel, Tuple[int, bool]] = {
+    CoverLevel.NONE: (0, False),
+    CoverLevel.HALF: (2, False),
+    CoverLevel.THREE_QUARTERS: (5, False),
+    CoverLevel.TOTAL: (0, True),
+}
+
+
 class CombatState(Enum):
     """战斗状态枚举"""
     NOT_STARTED = "not_started"
@@ -34,20 +53,87 @@ class CombatState(Enum):
     ENDED = "ended"
 
 
-@dataclass(frozen=True)
+# TurnState布尔字段在_flags中的位
+_ACTION_USED = 1
+_BONUS_USED = 2
+_REACTION_AVAILABLE = 4
+_DISENGAGE = 8
+_DODGE = 16
+
+_TURN_STATE_FIELDS = (
+    'action_used', 'bonus_used', 'reaction_available', 'move_left',
+    'disengage', 'dodge', 'help_target', 'ready',
+)
+
+
+def _flag_property(bit: int, doc: str) -> property:
+    """生成读写_flags中指定位的布尔属性"""
+    def fget(self) -> bool:
+        return self._flags & bit != 0
+    
+    def fset(self, value: bool) -> None:
+        if value:
+            self._flags |= bit
+        else:
+            self._flags &= ~bit
+    
+    return property(fget, fset, doc=doc)
+
+
 class TurnState(ValueObject):
-    """回合状态值对象"""
-    action_used: bool = False
-    bonus_used: bool = False
-    reaction_available: bool = True
-    move_left: int = 6
-    disengage: bool = False
-    dodge: bool = False
-    help_target: Optional[str] = None
-    ready: Optional[Dict[str, any]] = None
-
-
-@dataclass(frozen=True)
+    """回合状态值对象
+    
+    动作与移动在回合内频繁消耗，回合状态就地更新，不再每次复制新实例；
+    需要快照时使用to_dict。五个布尔字段合并存放在整数_flags中，通过
+    同名属性读写，实例只占用四个槽位。
+    """
+    
+    __slots__ = ('_flags', 'move_left', 'help_target', 'ready')
+    
+    # 可变对象不可哈希
+    __hash__ = None
+    
+    action_used = _flag_property(_ACTION_USED, "本回合是否已使用动作")
+    bonus_used = _flag_property(_BONUS_USED, "本回合是否已使用附赠动作")
+    reaction_available = _flag_property(_REACTION_AVAILABLE, "是否仍可使用反应")
+    disengage = _flag_property(_DISENGAGE, "是否处于撤离状态")
+    dodge = _flag_property(_DODGE, "是否处于闪避状态")
+    
+    def __init__(self, action_used: bool = False, bonus_used: bool = False,
+                 reaction_available: bool = True, move_left: int = 6,
+                 disengage: bool = False, dodge: bool = False,
+                 help_target: Optional[str] = None,
+                 ready: Optional[Dict[str, any]] = None):
+        self._flags = (
+            (_ACTION_USED if action_used else 0)
+            | (_BONUS_USED if bonus_used else 0)
+            | (_REACTION_AVAILABLE if reaction_available else 0)
+            | (_DISENGAGE if disengage else 0)
+            | (_DODGE if dodge else 0)
+        )
+        self.move_left = move_left
+        self.help_target = help_target
+        self.ready = ready
+    
+    def _get_equality_components(self) -> tuple:
+        """获取相等性比较的组件"""
+        return (self._flags, self.move_left, self.help_target, self.ready)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典
+        
+        Returns:
+            Dict[str, Any]: 以字段名为键的回合状态
+        """
+        return {name: getattr(self, name) for name in _TURN_STATE_FIELDS}
+    
+    def __repr__(self) -> str:
+        """对象表示"""
+        fields_repr = ', '.join(f"{name}={getattr(self, name)!r}" for name in _TURN_STATE_FIELDS)
+        return f"TurnState({fields_repr})"
+
+
+@dataclass(frozen=True, slots=True)
 class InitiativeScore(ValueObject):
     """先攻值对象"""
     character_name: str
@@ -63,7 +149,7 @@ class InitiativeScore(ValueObject):
         return self.character_name < other.character_name
 
 
-@dataclass
+@dataclass(slots=True)
 class Combat(AggregateRoot):
     """战斗聚合根"""
     location: str
@@ -74,25 +160,50 @@ class Combat(AggregateRoot):
     turn_idx: int = 0
     state: CombatState = CombatState.NOT_STARTED
     turn_states: Dict[str, TurnState] = field(default_factory=dict)
-    range_bands: Dict[Tuple[str, str], RangeBand] = field(default_factory=dict)
-    cover: Dict[str, CoverLevel] = field(default_factory=dict)
+    # 构造参数，初始的距离带与掩体，复制进私有存储后只能通过set_*修改
+    range_bands: InitVar[Optional[Dict[Tuple[str, str], RangeBand]]] = None
+    cover: InitVar[Optional[Dict[str, CoverLevel]]] = None
     triggers: List[Dict[str, any]] = field(default_factory=list)
-
-    def __post_init__(self):
+    _range_bands: Dict[Tuple[str, str], RangeBand] = field(default_factory=dict, init=False)
+    _cover: Dict[str, CoverLevel] = field(default_factory=dict, init=False)
+    # 当前行动角色，仅在开始、推进与结束战斗时更新，读取即为普通属性访问
+    current_actor: Optional[str] = field(default=None, init=False, compare=False)
+    # 快照中字符串化的距离带与掩体映射(普通字典)，距离带与掩体只能经由
+    # set_*/clear_*修改，由这些方法使缓存失效，不参与序列化
+    _snapshot_cache: Optional[Tuple[Dict[str, str], Dict[str, str]]] = field(
+        default=None, init=False, repr=False, compare=False)
+    # 与initiative_order一一对应的(-先攻值, -敏捷修正, 名称)有序列表，用于二分插入
+    _initiative_index: List[Tuple[int, int, str]] = field(default_factory=list, init=False, repr=False, compare=False)
+
+    def __post_init__(self, range_bands: Optional[Dict[Tuple[str, str], RangeBand]],
+                      cover: Optional[Dict[str, CoverLevel]]):
         """初始化后处理"""
         if not self.location:
             raise ValueError("战斗地点不能为空")
+        # dataclass生成的__init__不会调用基类构造，在此补齐ID、时间戳与事件容器
+        AggregateRoot.__init__(self)
+        if range_bands:
+            self._range_bands.update(range_bands)
+        if cover:
+            self._cover.update(cover)
         if self.state == CombatState.NOT_STARTED and self.participants:
             self.state = CombatState.ACTIVE
-
-    @property
-    def current_actor(self) -> Optional[str]:
-        """获取当前行动角色"""
-        if not self.is_active or not self.initiative_order:
-            return None
-        if self.turn_idx < 0 or self.turn_idx >= len(self.initiative_order):
-            return None
-        return self.initiative_order[self.turn_idx]
+        self._sync_current_actor()
+
+    def __getstate__(self):
+        """序列化状态，快照缓存不参与pickle与deepcopy"""
+        state, slots = object.__getstate__(self)
+        slots = dict(slots)
+        slots['_snapshot_cache'] = None
+        return state, slots
+
+    def _sync_current_actor(self) -> None:
+        """按战斗状态、先攻顺序与回合索引重新计算当前行动角色"""
+        if (self.state != CombatState.ACTIVE
+                or not 0 <= self.turn_idx < len(self.initiative_order)):
+            self.current_actor = None
+        else:
+            self.current_actor = self.initiative_order[self.turn_idx]
 
     @property
     def is_active(self) -> bool:
@@ -107,48 +218,138 @@ class Combat(AggregateRoot):
         self.participants = list(participants)
         self.roll_initiative()
         self.state = CombatState.ACTIVE
+        self._sync_current_actor()
         self._reset_turn_tokens_for_current_actor()
         
-        self.add_domain_event("combat_started", {
-            "location": self.location,
-            "participants": self.participants,
-            "initiative_order": self.initiative_order
-        })
+        if self.has_subscribers("combat_started"):
+            self.raise_event("combat_started", {
+                "location": self.location,
+                "participants": self.participants,
+                "initiative_order": self.initiative_order
+            })
 
     def roll_initiative(self) -> None:
         """掷先攻"""
-        import random
-        
-        scores = {}
-        for name in self.participants:
-            # 这里应该从角色模型获取敏捷修正值
-            # 暂时使用随机值
-            dexterity_mod = 0  # TODO: 从角色获取
-            score = random.randint(1, 20) + dexterity_mod
-            scores[name] = score
+        # 一次生成全部d20掷骰结果
+        # TODO: 从角色获取敏捷修正值，加到掷骰结果上并作为同分时的次级排序键
+        rolls = random.choices(_D20_FACES, k=len(self.participants))
+        scores = dict(zip(self.participants, rolls))
         
-        # 按先攻值排序
+        # 按先攻值降序排序，同分按名称升序，与InitiativeScore的顺序一致
         self.initiative_scores = scores
-        self.initiative_order = sorted(
-            self.participants,
-            key=lambda name: (
-                scores[name],
-                0  # TODO: 从角色获取敏捷修正值
-            ),
-            reverse=True
-        )
+        self._initiative_index = sorted((-score, 0, name) for name, score in scores.items())
+        self.initiative_order = [entry[2] for entry in self._initiative_index]
         
-        self.add_domain_event("initiative_rolled", {
+        # 重掷后先攻顺序改变，当前行动者保持不变，只重新定位其回合索引
+        if self.current_actor in scores:
+            self.turn_idx = self.initiative_order.index(self.current_actor)
+        else:
+            self._sync_current_actor()
+        
+        self.raise_event("initiative_rolled", {
             "scores": scores,
             "order": self.initiative_order
         })
 
+    def add_participant_mid_combat(self, name: str, score: int, dexterity_modifier: int = 0) -> None:
+        """战斗中途加入参与者
+        
+        按先攻值二分插入先攻顺序，不重新排序；插入位置在当前行动者之前时
+        回合索引随之后移，当前行动者保持不变。
+        
+        Args:
+            name: 角色名称
+            score: 先攻值
+            dexterity_modifier: 敏捷修正值，先攻值相同时用于排序
+        """
+        if name in self.initiative_scores:
+            raise ValueError(f"角色已在先攻顺序中: {name}")
+        
+        index = self._initiative_index
+        if len(index) != len(self.initiative_order):
+            # 先攻顺序未经roll_initiative生成时，按先攻值补建有序索引；
+            # 重排后按名称找回当前行动者的位置，保证回合不被转交
+            index = sorted((-self.initiative_scores.get(n, 0), 0, n) for n in self.initiative_order)
+            self._initiative_index = index
+            self.initiative_order = [entry[2] for entry in index]
+            if self.current_actor is not None:
+                self.turn_idx = self.initiative_order.index(self.current_actor)
+        
+        entry = (-score, -dexterity_modifier, name)
+        pos = bisect.bisect_left(index, entry)
+        index.insert(pos, entry)
+        self.initiative_order.insert(pos, name)
+        self.initiative_scores[name] = score
+        self.participants.append(name)
+        
+        if self.current_actor is not None and pos <= self.turn_idx:
+            self.turn_idx += 1
+        
+        if self.has_subscribers("participant_joined"):
+            self.raise_event("participant_joined", {
+                "character": name,
+                "score": score,
+                "initiative_order": self.initiative_order
+            })
+
+    def remove_participant(self, name: str) -> None:
+        """从战斗中移除参与者
+        
+        同步更新参与者、先攻顺序、先攻值与回合状态。移除位置在当前行动者
+        之前时回合索引随之前移；移除的正是当前行动者时，回合交给先攻顺序
+        中的下一位，越过末尾则进入下一轮。
+        
+        Args:
+            name: 角色名称
+            
+        Raises:
+            ValueError: 角色不在战斗中时抛出
+        """
+        if name not in self.participants:
+            raise ValueError(f"角色不在战斗中: {name}")
+        
+        was_current = name == self.current_actor
+        self.participants.remove(name)
+        self.initiative_scores.pop(name, None)
+        self.turn_states.pop(name, None)
+        self.clear_positioning(name)
+        
+        order = self.initiative_order
+        if name in order:
+            pos = order.index(name)
+            index = self._initiative_index
+            if len(index) == len(order):
+                del index[pos]
+            else:
+                # 索引与先攻顺序不一致时清空，下次插入时补建
+                index.clear()
+            del order[pos]
+            
+            if pos < self.turn_idx:
+                self.turn_idx -= 1
+            elif was_current:
+                if not order:
+                    self.turn_idx = 0
+                    self.current_actor = None
+                else:
+                    if pos == len(order):
+                        pos = 0
+                        self.round += 1
+                    self._begin_turn(pos)
+        
+        if self.has_subscribers("participant_left"):
+            self.raise_event("participant_left", {
+                "character": name,
+                "initiative_order": self.initiative_order
+            })
+
     def end_combat(self) -> None:
         """结束战斗"""
         self.state = CombatState.ENDED
+        self.current_actor = None
         self.clear_all_domain_events()
         
-        self.add_domain_event("combat_ended", {
+        self.raise_event("combat_ended", {
             "location": self.location,
             "round": self.round
         })
@@ -161,51 +362,58 @@ class Combat(AggregateRoot):
         if not self.initiative_order:
             return None
         
-        # 寻找下一个存活的角色
-        original_idx = self.turn_idx
         n = len(self.initiative_order)
+        if n == 1:
+            # 单人战斗无需查找，直接进入下一轮
+            self.round += 1
+            return self._begin_turn(0)
         
+        # 寻找下一个存活的角色
+        original_idx = self.turn_idx
         for step in range(1, n + 1):
             idx = (original_idx + step) % n
-            if idx <= original_idx:
-                self.round += 1
-            
-            candidate = self.initiative_order[idx]
             # TODO: 检查角色是否存活
             if True:  # 暂时假设所有角色都存活
-                self.turn_idx = idx
-                self._reset_turn_tokens_for_current_actor()
-                
-                self.add_domain_event("turn_changed", {
-                    "round": self.round,
-                    "actor": candidate,
-                    "turn_idx": self.turn_idx
-                })
-                
-                return candidate
+                if idx <= original_idx:
+                    self.round += 1
+                return self._begin_turn(idx)
         
         # 没有可行动的角色
         return None
 
+    def _begin_turn(self, idx: int) -> str:
+        """将回合交给先攻顺序中指定位置的角色
+        
+        Args:
+            idx: 先攻顺序中的位置
+            
+        Returns:
+            str: 当前行动角色
+        """
+        candidate = self.initiative_order[idx]
+        self.turn_idx = idx
+        self.current_actor = candidate
+        self._reset_turn_tokens_for_current_actor()
+        
+        if self.has_subscribers("turn_changed"):
+            self.raise_event("turn_changed", {
+                "round": self.round,
+                "actor": candidate,
+                "turn_idx": idx
+            })
+        
+        return candidate
+
     def _reset_turn_tokens_for_current_actor(self) -> None:
         """为当前行动者重置回合资源"""
-        if not self.current_actor:
+        actor = self.current_actor
+        if not actor:
             return
         
-        actor = self.current_actor
         # TODO: 从角色获取移动力
         move_speed = 6  # 默认移动力
         
-        self.turn_states[actor] = TurnState(
-            action_used=False,
-            bonus_used=False,
-            reaction_available=True,
-            move_left=move_speed,
-            disengage=False,
-            dodge=False,
-            help_target=None,
-            ready=None
-        )
+        self.turn_states[actor] = TurnState(move_left=move_speed)
 
     def use_action(self, character_name: str, action_type: str = "action") -> bool:
         """使用动作"""
@@ -217,16 +425,13 @@ class Combat(AggregateRoot):
             return False
         
         if action_type == "action" and not turn_state.action_used:
-            new_state = turn_state._replace(action_used=True)
-            self.turn_states[character_name] = new_state
+            turn_state.action_used = True
             return True
         elif action_type == "bonus" and not turn_state.bonus_used:
-            new_state = turn_state._replace(bonus_used=True)
-            self.turn_states[character_name] = new_state
+            turn_state.bonus_used = True
             return True
         elif action_type == "reaction" and turn_state.reaction_available:
-            new_state = turn_state._replace(reaction_available=False)
-            self.turn_states[character_name] = new_state
+            turn_state.reaction_available = False
             return True
         
         return False
@@ -241,54 +446,60 @@ class Combat(AggregateRoot):
             return False
         
         if distance <= turn_state.move_left:
-            new_state = turn_state._replace(
-                move_left=turn_state.move_left - distance
-            )
-            self.turn_states[character_name] = new_state
+            turn_state.move_left -= distance
             return True
         
         return False
 
     def set_range_band(self, char_a: str, char_b: str, band: RangeBand) -> None:
         """设置两个角色间的距离带"""
-        key = tuple(sorted([char_a, char_b]))
-        self.range_bands[key] = band
+        key = (char_a, char_b) if char_a < char_b else (char_b, char_a)
+        self._range_bands[key] = band
+        self._snapshot_cache = None
         
-        self.add_domain_event("range_band_changed", {
-            "character_a": char_a,
-            "character_b": char_b,
-            "range_band": band.value
-        })
+        if self.has_subscribers("range_band_changed"):
+            self.raise_event("range_band_changed", {
+                "character_a": char_a,
+                "character_b": char_b,
+                "range_band": band.value
+            })
 
     def get_range_band(self, char_a: str, char_b: str) -> RangeBand:
         """获取两个角色间的距离带"""
-        key = tuple(sorted([char_a, char_b]))
-        return self.range_bands.get(key, RangeBand.NEAR)
+        key = (char_a, char_b) if char_a < char_b else (char_b, char_a)
+        return self._range_bands.get(key, RangeBand.NEAR)
 
     def set_cover(self, character_name: str, level: CoverLevel) -> None:
         """设置角色的掩体等级"""
-        self.cover[character_name] = level
+        self._cover[character_name] = level
+        self._snapshot_cache = None
         
-        self.add_domain_event("cover_changed", {
-            "character": character_name,
-            "cover_level": level.value
-        })
+        if self.has_subscribers("cover_changed"):
+            self.raise_event("cover_changed", {
+                "character": character_name,
+                "cover_level": level.value
+            })
 
     def get_cover(self, character_name: str) -> CoverLevel:
         """获取角色的掩体等级"""
-        return self.cover.get(character_name, CoverLevel.NONE)
+        return self._cover.get(character_name, CoverLevel.NONE)
 
     def get_cover_bonus(self, character_name: str) -> Tuple[int, bool]:
         """获取掩体加值"""
-        level = self.get_cover(character_name)
-        if level == CoverLevel.HALF:
-            return 2, False
-        elif level == CoverLevel.THREE_QUARTERS:
-            return 5, False
-        elif level == CoverLevel.TOTAL:
-            return 0, True
-        else:
-            return 0, False
+        return _COVER_BONUS_TABLE[self._cover.get(character_name, CoverLevel.NONE)]
+
+    def clear_positioning(self, character_name: str) -> None:
+        """清除角色的掩体及其与其他角色的距离带
+        
+        Args:
+            character_name: 角色名称
+        """
+        range_bands = self._range_bands
+        stale = [key for key in range_bands if character_name in key]
+        for key in stale:
+            del range_bands[key]
+        if self._cover.pop(character_name, None) is not None or stale:
+            self._snapshot_cache = None
 
     def queue_trigger(self, trigger_type: str, payload: Dict[str, any]) -> None:
         """添加触发器到队列"""
@@ -303,25 +514,60 @@ class Combat(AggregateRoot):
         self.triggers.clear()
         return triggers
 
-    def snapshot(self) -> Dict[str, Any]:
+    def snapshot(self, *, deep: bool = False) -> Dict[str, Any]:
         """获取战斗状态快照
         
+        默认返回只读视图：序列为元组，映射为MappingProxyType，其中先攻值
+        直接映射战斗内部的字典，距离带与掩体的字符串化结果在两次修改之间
+        复用。只读视图不能直接交给json/orjson，调用方需要序列化、修改或
+        长期保存快照时应传入deep=True。
+        
+        距离带与掩体只能通过set_range_band/set_cover/clear_positioning修改，
+        缓存在这些方法中失效。
+        
+        Args:
+            deep: 是否返回独立的列表与字典副本
+        
         Returns:
             Dict[str, Any]: 战斗状态快照
         """
+        if deep:
+            return {
+                "location": self.location,
+                "participants": list(self.participants),
+                "initiative_order": list(self.initiative_order),
+                "initiative_scores": dict(self.initiative_scores),
+                "round": self.round,
+                "turn_idx": self.turn_idx,
+                "state": self.state.value,
+                "current_actor": self.current_actor,
+                "is_active": self.is_active,
+                "range_bands": {a + "&" + b: _RANGE_BAND_VALUES[band] for (a, b), band in self._range_bands.items()},
+                "cover": {name: _COVER_VALUES[level] for name, level in self._cover.items()},
+                "triggers": list(self.triggers)
+            }
+        
+        cache = self._snapshot_cache
+        if cache is None:
+            cache = (
+                {a + "&" + b: _RANGE_BAND_VALUES[band] for (a, b), band in self._range_bands.items()},
+                {name: _COVER_VALUES[level] for name, level in self._cover.items()},
+            )
+            self._snapshot_cache = cache
+        
         return {
             "location": self.location,
-            "participants": list(self.participants),
-            "initiative_order": list(self.initiative_order),
-            "initiative_scores": dict(self.initiative_scores),
+            "participants": tuple(self.participants),
+            "initiative_order": tuple(self.initiative_order),
+            "initiative_scores": MappingProxyType(self.initiative_scores),
             "round": self.round,
             "turn_idx": self.turn_idx,
             "state": self.state.value,
             "current_actor": self.current_actor,
-            "is_active": self.is_active,
-            "range_bands": {f"{a}&{b}": band.value for (a, b), band in self.range_bands.items()},
-            "cover": {name: level.value for name, level in self.cover.items()},
-            "triggers": list(self.triggers)
+            "is_active": self.state == CombatState.ACTIVE,
+            "range_bands": MappingProxyType(cache[0]),
+            "cover": MappingProxyType(cache[1]),
+            "triggers": tuple(self.triggers)
         }
 
     def validate(self) -> None:
@@ -332,17 +578,34 @@ class Combat(AggregateRoot):
         if self.state == CombatState.ACTIVE and not self.participants:
             raise ValueError("活跃战斗必须有参与者")
 
-    def _get_business_rules(self) -> List['BusinessRule']:
-        """获取业务规则列表"""
-        return [
-            CombatMustHaveParticipants(),
-            ActiveCombatMustHaveCurrentActor(),
-        ]
+    def _get_business_rules(self) -> Tuple[BusinessRule, ...]:
+        """获取业务规则列表
+        
+        规则无状态，所有战斗共用模块级的规则实例。
+        """
+        return _COMBAT_BUSINESS_RULES
+
+
+def _range_bands_property(self: Combat) -> MappingProxyType:
+    """两两角色间距离带的只读视图，修改使用set_range_band"""
+    return MappingProxyType(self._range_bands)
+
+
+def _cover_property(self: Combat) -> MappingProxyType:
+    """角色掩体等级的只读视图，修改使用set_cover"""
+    return MappingProxyType(self._cover)
+
 
+# dataclass以同名InitVar生成构造参数后再安装只读属性
+Combat.range_bands = property(_range_bands_property)
+Combat.cover = property(_cover_property)
 
-class CombatMustHaveParticipants:
+
+class CombatMustHaveParticipants(BusinessRule):
     """战斗必须有参与者规则"""
     
+    __slots__ = ()
+    
     def is_satisfied_by(self, entity: Combat) -> bool:
         return entity.state != CombatState.ACTIVE or len(entity.participants) > 0
     
@@ -350,11 +613,20 @@ class CombatMustHaveParticipants:
         return "活跃的战斗必须有至少一个参与者"
 
 
-class ActiveCombatMustHaveCurrentActor:
+class ActiveCombatMustHaveCurrentActor(BusinessRule):
     """活跃战斗必须有当前行动者规则"""
     
+    __slots__ = ()
+    
     def is_satisfied_by(self, entity: Combat) -> bool:
         return entity.state != CombatState.ACTIVE or entity.current_actor is not None
     
     def get_error_message(self) -> str:
-        return "活跃的战斗必须有当前行动者"
\ No newline at end of file
+        return "活跃的战斗必须有当前行动者"
+
+
+# 战斗的业务规则，只读共享
+_COMBAT_BUSINESS_RULES: Tuple[BusinessRule, ...] = (
+    CombatMustHaveParticipants(),
+    ActiveCombatMustHaveCurrentActor(),
+)
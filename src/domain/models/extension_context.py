@@ -5,18 +5,34 @@
 特别是单一职责原则(SRP)，专门负责扩展运行时上下文的管理。
 """
 
+import asyncio
 import os
 import json
-import yaml
+import time
 from typing import Dict, Any, Optional, List, Callable
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from ...core.interfaces import ExtensionContext as BaseExtensionContext
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 仅在缺少可选依赖时触发
+    orjson = None
 
-@dataclass
+
+_MISSING = object()
+
+
+@lru_cache(maxsize=256)
+def _split_key(key: str) -> tuple:
+    """拆分并缓存点号分隔的配置键"""
+    return tuple(key.split('.'))
+
+
+@dataclass(slots=True)
 class ExtensionConfig:
     """扩展配置
     
@@ -26,6 +42,8 @@ class ExtensionConfig:
     config_data: Dict[str, Any] = field(default_factory=dict)
     config_file: Optional[str] = None
     auto_save: bool = True
+    # 按键缓存的查找结果（含不存在），经由set/remove/update/clear/load_from_file修改时清空
+    _lookup_cache: Dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
     
     def get(self, key: str, default: Any = None) -> Any:
         """获取配置值
@@ -37,15 +55,38 @@ class ExtensionConfig:
         Returns:
             Any: 配置值
         """
-        keys = key.split('.')
-        value = self.config_data
+        value = self._lookup(key)
+        return default if value is _MISSING else value
+    
+    def _lookup(self, key: str) -> Any:
+        """沿嵌套键查找配置值
         
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
+        配置读多写少，查找结果按键缓存。绕过本类方法直接修改config_data
+        或get返回的嵌套字典不会使缓存失效。
         
+        Args:
+            key: 配置键，支持点号分隔的嵌套键
+            
+        Returns:
+            Any: 配置值，不存在时返回_MISSING
+        """
+        cache = self._lookup_cache
+        value = cache.get(key, _MISSING)
+        if value is _MISSING and key not in cache:
+            value = self._walk(key)
+            cache[key] = value
+        return value
+    
+    def _walk(self, key: str) -> Any:
+        """沿嵌套键遍历配置字典，不存在时返回_MISSING"""
+        value = self.config_data
+        for k in _split_key(key):
+            if isinstance(value, dict):
+                value = value.get(k, _MISSING)
+                if value is _MISSING:
+                    return _MISSING
+            else:
+                return _MISSING
         return value
     
     def set(self, key: str, value: Any) -> None:
@@ -55,7 +96,7 @@ class ExtensionConfig:
             key: 配置键，支持点号分隔的嵌套键
             value: 配置值
         """
-        keys = key.split('.')
+        keys = _split_key(key)
         config = self.config_data
         
         # 导航到父级字典
@@ -66,6 +107,7 @@ class ExtensionConfig:
         
         # 设置值
         config[keys[-1]] = value
+        self._lookup_cache.clear()
         
         # 自动保存
         if self.auto_save and self.config_file:
@@ -78,9 +120,9 @@ class ExtensionConfig:
             key: 配置键
             
         Returns:
-            bool: 是否存在
+            bool: 是否存在，值为None的配置也视为存在
         """
-        return self.get(key) is not None
+        return self._lookup(key) is not _MISSING
     
     def remove(self, key: str) -> bool:
         """移除配置
@@ -91,7 +133,7 @@ class ExtensionConfig:
         Returns:
             bool: 是否成功移除
         """
-        keys = key.split('.')
+        keys = _split_key(key)
         config = self.config_data
         
         # 导航到父级字典
@@ -104,6 +146,7 @@ class ExtensionConfig:
         # 移除键
         if keys[-1] in config:
             del config[keys[-1]]
+            self._lookup_cache.clear()
             
             # 自动保存
             if self.auto_save and self.config_file:
@@ -120,6 +163,7 @@ class ExtensionConfig:
             data: 配置数据
         """
         self.config_data.update(data)
+        self._lookup_cache.clear()
         
         # 自动保存
         if self.auto_save and self.config_file:
@@ -128,6 +172,7 @@ class ExtensionConfig:
     def clear(self) -> None:
         """清空配置"""
         self.config_data.clear()
+        self._lookup_cache.clear()
         
         # 自动保存
         if self.auto_save and self.config_file:
@@ -150,16 +195,23 @@ class ExtensionConfig:
         if not os.path.exists(file_path):
             return
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            if file_path.endswith('.json'):
-                data = json.load(f)
-            elif file_path.endswith(('.yaml', '.yml')):
-                data = yaml.safe_load(f)
-            else:
-                raise ValueError(f"不支持的配置文件格式: {file_path}")
+        if file_path.endswith('.json'):
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        elif file_path.endswith(('.yaml', '.yml')):
+            # 仅YAML配置需要，延迟导入以减少模块加载开销
+            import yaml
+            # 优先使用libyaml的C实现
+            loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = yaml.load(f, Loader=loader)
+        else:
+            raise ValueError(f"不支持的配置文件格式: {file_path}")
         
         self.config_data = data
         self.config_file = file_path
+        self._lookup_cache.clear()
     
     def save(self) -> None:
         """保存配置到文件"""
@@ -169,16 +221,25 @@ class ExtensionConfig:
         # 确保目录存在
         os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
         
-        with open(self.config_file, 'w', encoding='utf-8') as f:
-            if self.config_file.endswith('.json'):
-                json.dump(self.config_data, f, ensure_ascii=False, indent=2)
-            elif self.config_file.endswith(('.yaml', '.yml')):
-                yaml.dump(self.config_data, f, default_flow_style=False, allow_unicode=True)
+        if self.config_file.endswith('.json'):
+            if orjson is not None:
+                with open(self.config_file, 'wb') as f:
+                    f.write(orjson.dumps(
+                        self.config_data,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    ))
             else:
-                raise ValueError(f"不支持的配置文件格式: {self.config_file}")
+                with open(self.config_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.config_data, f, ensure_ascii=False, indent=2)
+        elif self.config_file.endswith(('.yaml', '.yml')):
+            import yaml
+            with open(self.config_file, 'w', encoding='utf-8') as f:
+                yaml.dump(self.config_data, f, default_flow_style=False, allow_unicode=True)
+        else:
+            raise ValueError(f"不支持的配置文件格式: {self.config_file}")
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtensionResources:
     """扩展资源管理
     
@@ -267,8 +328,8 @@ class ExtensionResources:
                         elif item.is_dir():
                             item.rmdir()
                     file_path.rmdir()
-            except Exception:
-                # 忽略清理错误
+            except OSError:
+                # 忽略文件占用、权限不足等清理错误
                 pass
     
     def get_disk_usage(self) -> Dict[str, int]:
@@ -278,14 +339,25 @@ class ExtensionResources:
             Dict[str, int]: 各目录的磁盘使用情况（字节）
         """
         def get_dir_size(path: str) -> int:
+            # scandir的目录项自带文件类型，POSIX上判断类型无需额外stat；
+            # 与os.walk一致，不进入符号链接指向的目录，并跳过无法读取的目录
             total = 0
-            try:
-                for dirpath, dirnames, filenames in os.walk(path):
-                    for filename in filenames:
-                        filepath = os.path.join(dirpath, filename)
-                        total += os.path.getsize(filepath)
-            except Exception:
-                pass
+            stack = [path]
+            while stack:
+                try:
+                    with os.scandir(stack.pop()) as entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif entry.is_file():
+                                try:
+                                    total += entry.stat().st_size
+                                except OSError:
+                                    # 遍历期间被删除或无权访问的文件不计入
+                                    pass
+                except OSError:
+                    # 单个目录不可读时只跳过该目录，继续统计其余目录
+                    continue
             return total
         
         usage = {
@@ -304,26 +376,34 @@ class ExtensionResources:
         return usage
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtensionEventBus:
     """扩展事件总线
     
     为扩展提供事件发布和订阅功能，遵循单一职责原则。
     """
     
-    event_handlers: Dict[str, List[Callable]] = field(default_factory=dict)
+    # 订阅时按是否为协程函数分类，发布时无需逐个检查。每个事件类型的处理器
+    # 存放在以处理器自身为键的字典中，作为保持订阅顺序的集合，取消订阅为O(1)
+    sync_handlers: Dict[str, Dict[Callable, None]] = field(default_factory=dict)
+    async_handlers: Dict[str, Dict[Callable, None]] = field(default_factory=dict)
+    # 为True时隔离处理器异常，继续执行其他处理器；为False时异常直接抛出
+    safe_mode: bool = True
+    
+    def _handlers_for(self, handler: Callable) -> Dict[str, Dict[Callable, None]]:
+        """获取处理器所属的分类字典"""
+        if asyncio.iscoroutinefunction(handler):
+            return self.async_handlers
+        return self.sync_handlers
     
     def subscribe(self, event_type: str, handler: Callable) -> None:
         """订阅事件
         
         Args:
             event_type: 事件类型
-            handler: 事件处理器
+            handler: 事件处理器，可为普通函数或协程函数；同一处理器重复订阅只保留一份
         """
-        if event_type not in self.event_handlers:
-            self.event_handlers[event_type] = []
-        
-        self.event_handlers[event_type].append(handler)
+        self._handlers_for(handler).setdefault(event_type, {})[handler] = None
     
     def unsubscribe(self, event_type: str, handler: Callable) -> bool:
         """取消订阅事件
@@ -335,37 +415,39 @@ class ExtensionEventBus:
         Returns:
             bool: 是否成功取消订阅
         """
-        if event_type not in self.event_handlers:
+        handlers = self._handlers_for(handler).get(event_type)
+        if handlers is None or handler not in handlers:
             return False
         
-        try:
-            self.event_handlers[event_type].remove(handler)
-            return True
-        except ValueError:
-            return False
+        del handlers[handler]
+        return True
     
     async def publish(self, event_type: str, data: Any = None) -> None:
         """发布事件
         
+        先依次调用同步处理器，再依次等待异步处理器。
+        
         Args:
             event_type: 事件类型
             data: 事件数据
+            
+        Raises:
+            Exception: safe_mode为False时，处理器抛出的异常
         """
-        if event_type not in self.event_handlers:
-            return
+        # 复制为元组后遍历，处理器在执行中取消订阅不会影响本次发布
+        for handler in tuple(self.sync_handlers.get(event_type, ())):
+            try:
+                handler(event_type, data)
+            except Exception:
+                if not self.safe_mode:
+                    raise
         
-        for handler in self.event_handlers[event_type]:
+        for handler in tuple(self.async_handlers.get(event_type, ())):
             try:
-                if hasattr(handler, '__call__'):
-                    # 检查是否是异步函数
-                    import asyncio
-                    if asyncio.iscoroutinefunction(handler):
-                        await handler(event_type, data)
-                    else:
-                        handler(event_type, data)
+                await handler(event_type, data)
             except Exception:
-                # 忽略处理器错误，继续执行其他处理器
-                pass
+                if not self.safe_mode:
+                    raise
     
     def get_subscribed_events(self) -> List[str]:
         """获取已订阅的事件类型
@@ -373,7 +455,7 @@ class ExtensionEventBus:
         Returns:
             List[str]: 事件类型列表
         """
-        return list(self.event_handlers.keys())
+        return list({**self.sync_handlers, **self.async_handlers})
     
     def get_handler_count(self, event_type: str) -> int:
         """获取事件类型的处理器数量
@@ -384,7 +466,13 @@ class ExtensionEventBus:
         Returns:
             int: 处理器数量
         """
-        return len(self.event_handlers.get(event_type, []))
+        return (len(self.sync_handlers.get(event_type, ()))
+                + len(self.async_handlers.get(event_type, ())))
+    
+    def clear(self) -> None:
+        """移除全部事件处理器"""
+        self.sync_handlers.clear()
+        self.async_handlers.clear()
 
 
 class ExtensionContextImpl(BaseExtensionContext):
@@ -446,10 +534,11 @@ class ExtensionContextImpl(BaseExtensionContext):
         # 扩展事件总线
         self.extension_event_bus = ExtensionEventBus()
         
-        # 上下文元数据
+        # 上下文元数据；访问时间以单调时钟纳秒记录，读取元数据时再换算为时间
+        self._created_ns = time.monotonic_ns()
         self.context_metadata = {
             "created_at": datetime.now(),
-            "last_accessed": datetime.now(),
+            "last_accessed_ns": self._created_ns,
             "access_count": 0
         }
     
@@ -516,8 +605,10 @@ class ExtensionContextImpl(BaseExtensionContext):
         """
         self._update_access_time()
         metadata = self.context_metadata.copy()
-        metadata["created_at"] = metadata["created_at"].isoformat()
-        metadata["last_accessed"] = metadata["last_accessed"].isoformat()
+        created_at = metadata["created_at"]
+        elapsed_ns = metadata.pop("last_accessed_ns") - self._created_ns
+        metadata["created_at"] = created_at.isoformat()
+        metadata["last_accessed"] = (created_at + timedelta(microseconds=elapsed_ns // 1000)).isoformat()
         return metadata
     
     def save_config(self) -> None:
@@ -536,9 +627,10 @@ class ExtensionContextImpl(BaseExtensionContext):
         self.resources.cleanup_temp_files()
         
         # 清理事件处理器
-        self.extension_event_bus.event_handlers.clear()
+        self.extension_event_bus.clear()
     
     def _update_access_time(self) -> None:
         """更新访问时间"""
-        self.context_metadata["last_accessed"] = datetime.now()
-        self.context_metadata["access_count"] += 1
\ No newline at end of file
+        metadata = self.context_metadata
+        metadata["last_accessed_ns"] = time.monotonic_ns()
+        metadata["access_count"] += 1
\ No newline at end of file
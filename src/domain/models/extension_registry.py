@@ -5,15 +5,67 @@
 特别是单一职责原则(SRP)，专门负责扩展注册信息的管理。
 """
 
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
+from collections import Counter, deque
+from operator import itemgetter
+import heapq
 from datetime import datetime
 import json
+import sys
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 仅在缺少可选依赖时触发
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - 仅在缺少可选依赖时触发
+    ijson = None
 
 from ..responses.api_response import ApiResponse
 
 
-@dataclass
+_fromiso = datetime.fromisoformat
+
+
+def _orjson_default(obj: Any) -> Any:
+    """序列化orjson无法原生处理的对象
+    
+    Args:
+        obj: 待序列化对象
+        
+    Returns:
+        Any: 可序列化的表示
+        
+    Raises:
+        TypeError: 对象类型不受支持时抛出
+    """
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _iter_json_section(f, prefix: str, pairs: bool = False) -> Iterator[Any]:
+    """流式迭代JSON文件中的一个分段
+    
+    生成器在首次取值时才回到文件开头，因此多个分段可按顺序复用同一文件句柄。
+    
+    Args:
+        f: 以二进制模式打开的文件
+        prefix: ijson前缀路径
+        pairs: 为True时产出(键, 值)对
+        
+    Returns:
+        Iterator[Any]: 分段元素迭代器
+    """
+    f.seek(0)
+    parse = ijson.kvitems if pairs else ijson.items
+    yield from parse(f, prefix, use_float=True)
+
+
+@dataclass(slots=True)
 class ExtensionInfo:
     """扩展信息
     
@@ -29,7 +81,7 @@ class ExtensionInfo:
     status: str
     dependencies: List[str] = field(default_factory=list)
     optional_dependencies: List[str] = field(default_factory=list)
-    tags: List[str] = field(default_factory=list)
+    tags: Set[str] = field(default_factory=set)
     homepage: Optional[str] = None
     license: Optional[str] = None
     load_time: Optional[datetime] = None
@@ -37,6 +89,16 @@ class ExtensionInfo:
     error_message: Optional[str] = None
     config: Dict[str, Any] = field(default_factory=dict)
     
+    def __post_init__(self):
+        """驻留状态、类型与标签字符串
+        
+        这些短字符串在注册表中大量重复，驻留后过滤时的相等比较退化为指针判断。
+        """
+        self.id = sys.intern(self.id)
+        self.status = sys.intern(self.status)
+        self.extension_type = sys.intern(self.extension_type)
+        self.tags = {sys.intern(tag) for tag in self.tags}
+    
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典格式
         
@@ -53,7 +115,7 @@ class ExtensionInfo:
             "status": self.status,
             "dependencies": self.dependencies,
             "optional_dependencies": self.optional_dependencies,
-            "tags": self.tags,
+            "tags": sorted(self.tags),
             "homepage": self.homepage,
             "license": self.license,
             "load_time": self.load_time.isoformat() if self.load_time else None,
@@ -72,13 +134,8 @@ class ExtensionInfo:
         Returns:
             ExtensionInfo: 扩展信息实例
         """
-        load_time = None
-        if data.get("load_time"):
-            load_time = datetime.fromisoformat(data["load_time"])
-        
-        activate_time = None
-        if data.get("activate_time"):
-            activate_time = datetime.fromisoformat(data["activate_time"])
+        load_time = _fromiso(lt) if (lt := data.get("load_time")) else None
+        activate_time = _fromiso(at) if (at := data.get("activate_time")) else None
         
         return cls(
             id=data["id"],
@@ -90,7 +147,7 @@ class ExtensionInfo:
             status=data["status"],
             dependencies=data.get("dependencies", []),
             optional_dependencies=data.get("optional_dependencies", []),
-            tags=data.get("tags", []),
+            tags=set(data.get("tags", ())),
             homepage=data.get("homepage"),
             license=data.get("license"),
             load_time=load_time,
@@ -100,7 +157,7 @@ class ExtensionInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtensionDependency:
     """扩展依赖关系
     
@@ -146,7 +203,7 @@ class ExtensionDependency:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtensionRegistry:
     """扩展注册表
     
@@ -154,9 +211,36 @@ class ExtensionRegistry:
     """
     
     extensions: Dict[str, ExtensionInfo] = field(default_factory=dict)
-    dependencies: List[ExtensionDependency] = field(default_factory=list)
     categories: Dict[str, List[str]] = field(default_factory=dict)
     tags_index: Dict[str, Set[str]] = field(default_factory=dict)
+    # 标签使用次数，与tags_index同步增量维护
+    _tag_counts: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    # 依赖邻接索引：扩展ID -> {依赖ID: 依赖关系}，以及其反向索引
+    _by_ext: Dict[str, Dict[str, ExtensionDependency]] = field(default_factory=dict, init=False, repr=False)
+    _by_dep: Dict[str, Dict[str, ExtensionDependency]] = field(default_factory=dict, init=False, repr=False)
+    # 注册序号：扩展ID -> 单调递增的序号，按标签过滤时据此恢复注册顺序
+    _reg_seq: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _next_seq: int = field(default=0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """为构造时传入的扩展按字典顺序编号"""
+        self._renumber()
+    
+    def _renumber(self) -> None:
+        """按extensions的当前顺序重新编号"""
+        self._reg_seq = {ext_id: seq for seq, ext_id in enumerate(self.extensions)}
+        self._next_seq = len(self._reg_seq)
+    
+    @property
+    def dependencies(self) -> List[ExtensionDependency]:
+        """全部依赖关系
+        
+        由邻接索引派生的只读列表视图，修改请使用add_dependency/remove_dependency。
+        
+        Returns:
+            List[ExtensionDependency]: 依赖关系列表
+        """
+        return [dep for bucket in self._by_ext.values() for dep in bucket.values()]
     
     def register_extension(self, extension_info: ExtensionInfo) -> bool:
         """注册扩展
@@ -171,12 +255,15 @@ class ExtensionRegistry:
             return False
         
         self.extensions[extension_info.id] = extension_info
+        self._reg_seq[extension_info.id] = self._next_seq
+        self._next_seq += 1
         
         # 更新标签索引
         for tag in extension_info.tags:
             if tag not in self.tags_index:
                 self.tags_index[tag] = set()
             self.tags_index[tag].add(extension_info.id)
+            self._tag_counts[tag] = len(self.tags_index[tag])
         
         return True
     
@@ -200,15 +287,19 @@ class ExtensionRegistry:
                 self.tags_index[tag].discard(extension_id)
                 if not self.tags_index[tag]:
                     del self.tags_index[tag]
+                    self._tag_counts.pop(tag, None)
+                else:
+                    self._tag_counts[tag] = len(self.tags_index[tag])
         
         # 移除扩展
         del self.extensions[extension_id]
+        del self._reg_seq[extension_id]
         
-        # 移除相关依赖关系
-        self.dependencies = [
-            dep for dep in self.dependencies
-            if dep.extension_id != extension_id and dep.dependency_id != extension_id
-        ]
+        # 移除相关依赖关系：弹出的桶已脱离索引，可直接遍历，只触及该扩展的边
+        for dep_id in self._by_ext.pop(extension_id, ()):
+            self._discard_edge(self._by_dep, dep_id, extension_id)
+        for ext_id in self._by_dep.pop(extension_id, ()):
+            self._discard_edge(self._by_ext, ext_id, extension_id)
         
         return True
     
@@ -229,6 +320,9 @@ class ExtensionRegistry:
                        tags: Optional[List[str]] = None) -> List[ExtensionInfo]:
         """列出扩展
         
+        结果按注册顺序排列。指定标签时只遍历标签索引交集中的候选扩展，
+        过滤后按注册序号排序恢复顺序。
+        
         Args:
             status: 状态过滤
             extension_type: 类型过滤
@@ -237,24 +331,34 @@ class ExtensionRegistry:
         Returns:
             List[ExtensionInfo]: 扩展列表
         """
-        extensions = list(self.extensions.values())
-        
-        # 状态过滤
-        if status:
-            extensions = [ext for ext in extensions if ext.status == status]
-        
-        # 类型过滤
-        if extension_type:
-            extensions = [ext for ext in extensions if ext.extension_type == extension_type]
+        # 标签过滤：从最小的标签集合开始求交集
+        if tags:
+            tag_sets = sorted((self.tags_index.get(tag, set()) for tag in tags), key=len)
+            if not tag_sets[0]:
+                return []
+            candidate_ids = tag_sets[0].intersection(*tag_sets[1:])
+        else:
+            candidate_ids = self.extensions.keys()
+        
+        # 状态与类型过滤
+        extensions = self.extensions
+        result = []
+        for ext_id in candidate_ids:
+            ext = extensions.get(ext_id)
+            if ext is None:
+                continue
+            if status and ext.status != status:
+                continue
+            if extension_type and ext.extension_type != extension_type:
+                continue
+            result.append(ext)
         
-        # 标签过滤
         if tags:
-            extensions = [
-                ext for ext in extensions
-                if all(tag in ext.tags for tag in tags)
-            ]
+            # 标签集合无序，按注册序号恢复注册顺序
+            reg_seq = self._reg_seq
+            result.sort(key=lambda ext: reg_seq[ext.id])
         
-        return extensions
+        return result
     
     def find_extensions_by_tag(self, tag: str) -> List[ExtensionInfo]:
         """根据标签查找扩展
@@ -283,13 +387,7 @@ class ExtensionRegistry:
         Returns:
             List[tuple]: 标签和使用次数的列表
         """
-        tag_counts = [
-            (tag, len(ext_ids)) 
-            for tag, ext_ids in self.tags_index.items()
-        ]
-        
-        tag_counts.sort(key=lambda x: x[1], reverse=True)
-        return tag_counts[:limit]
+        return heapq.nlargest(limit, self._tag_counts.items(), key=itemgetter(1))
     
     def add_dependency(self, dependency: ExtensionDependency) -> None:
         """添加依赖关系
@@ -297,13 +395,16 @@ class ExtensionRegistry:
         Args:
             dependency: 依赖关系
         """
+        ext_id = dependency.extension_id
+        dep_id = dependency.dependency_id
+        bucket = self._by_ext.setdefault(ext_id, {})
+        
         # 检查是否已存在
-        for existing in self.dependencies:
-            if (existing.extension_id == dependency.extension_id and
-                existing.dependency_id == dependency.dependency_id):
-                return
+        if dep_id in bucket:
+            return
         
-        self.dependencies.append(dependency)
+        bucket[dep_id] = dependency
+        self._by_dep.setdefault(dep_id, {})[ext_id] = dependency
     
     def remove_dependency(self, extension_id: str, dependency_id: str) -> bool:
         """移除依赖关系
@@ -315,13 +416,31 @@ class ExtensionRegistry:
         Returns:
             bool: 是否成功移除
         """
-        original_length = len(self.dependencies)
-        self.dependencies = [
-            dep for dep in self.dependencies
-            if not (dep.extension_id == extension_id and dep.dependency_id == dependency_id)
-        ]
+        if not self._discard_edge(self._by_ext, extension_id, dependency_id):
+            return False
         
-        return len(self.dependencies) < original_length
+        self._discard_edge(self._by_dep, dependency_id, extension_id)
+        return True
+    
+    @staticmethod
+    def _discard_edge(index: Dict[str, Dict[str, ExtensionDependency]],
+                      key: str, other: str) -> bool:
+        """从邻接索引中移除一条边，桶为空时一并删除
+        
+        Args:
+            index: 正向或反向邻接索引
+            key: 桶所属的扩展ID
+            other: 边另一端的扩展ID
+            
+        Returns:
+            bool: 边是否存在并被移除
+        """
+        bucket = index.get(key)
+        if bucket is None or bucket.pop(other, None) is None:
+            return False
+        if not bucket:
+            del index[key]
+        return True
     
     def get_dependencies(self, extension_id: str) -> List[ExtensionDependency]:
         """获取扩展的依赖
@@ -332,10 +451,7 @@ class ExtensionRegistry:
         Returns:
             List[ExtensionDependency]: 依赖列表
         """
-        return [
-            dep for dep in self.dependencies
-            if dep.extension_id == extension_id
-        ]
+        return list(self._by_ext.get(extension_id, {}).values())
     
     def get_dependents(self, extension_id: str) -> List[ExtensionDependency]:
         """获取依赖此扩展的其他扩展
@@ -346,10 +462,7 @@ class ExtensionRegistry:
         Returns:
             List[ExtensionDependency]: 依赖此扩展的列表
         """
-        return [
-            dep for dep in self.dependencies
-            if dep.dependency_id == extension_id
-        ]
+        return list(self._by_dep.get(extension_id, {}).values())
     
     def resolve_load_order(self, extension_ids: List[str]) -> List[str]:
         """解析扩展加载顺序
@@ -371,19 +484,22 @@ class ExtensionRegistry:
             in_degree[ext_id] = 0
         
         # 添加依赖边
+        by_ext = self._by_ext
         for ext_id in extension_ids:
-            dependencies = self.get_dependencies(ext_id)
-            for dep in dependencies:
-                if dep.dependency_id in graph:
-                    graph[dep.dependency_id].append(ext_id)
+            bucket = by_ext.get(ext_id)
+            if not bucket:
+                continue
+            for dep_id in bucket:
+                if dep_id in graph:
+                    graph[dep_id].append(ext_id)
                     in_degree[ext_id] += 1
         
         # 拓扑排序
-        queue = [ext_id for ext_id in extension_ids if in_degree[ext_id] == 0]
+        queue = deque(ext_id for ext_id in extension_ids if in_degree[ext_id] == 0)
         result = []
         
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             result.append(current)
             
             for neighbor in graph[current]:
@@ -397,6 +513,24 @@ class ExtensionRegistry:
         
         return result
     
+    def iter_missing_dependencies(self, extension_id: str) -> Iterator[str]:
+        """逐个产出扩展缺失的必需依赖
+        
+        只需判断是否有效的调用方可用next(..., None)在首个缺失依赖处短路。
+        
+        Args:
+            extension_id: 扩展ID
+            
+        Returns:
+            Iterator[str]: 缺失的依赖ID迭代器
+        """
+        extensions = self.extensions
+        return (
+            dep.dependency_id
+            for dep in self._by_ext.get(extension_id, {}).values()
+            if dep.dependency_type == "required" and dep.dependency_id not in extensions
+        )
+    
     def validate_dependencies(self, extension_id: str) -> List[str]:
         """验证扩展依赖
         
@@ -406,14 +540,7 @@ class ExtensionRegistry:
         Returns:
             List[str]: 缺失的依赖列表
         """
-        missing_deps = []
-        dependencies = self.get_dependencies(extension_id)
-        
-        for dep in dependencies:
-            if dep.dependency_type == "required" and dep.dependency_id not in self.extensions:
-                missing_deps.append(dep.dependency_id)
-        
-        return missing_deps
+        return list(self.iter_missing_dependencies(extension_id))
     
     def get_statistics(self) -> Dict[str, Any]:
         """获取统计信息
@@ -421,18 +548,14 @@ class ExtensionRegistry:
         Returns:
             Dict[str, Any]: 统计信息
         """
-        status_counts = {}
-        type_counts = {}
-        
-        for ext in self.extensions.values():
-            # 状态统计
-            status_counts[ext.status] = status_counts.get(ext.status, 0) + 1
-            # 类型统计
-            type_counts[ext.extension_type] = type_counts.get(ext.extension_type, 0) + 1
+        extensions = self.extensions.values()
+        # 状态与类型统计，由Counter在C层完成计数
+        status_counts = dict(Counter(ext.status for ext in extensions))
+        type_counts = dict(Counter(ext.extension_type for ext in extensions))
         
         return {
             "total_extensions": len(self.extensions),
-            "total_dependencies": len(self.dependencies),
+            "total_dependencies": sum(len(bucket) for bucket in self._by_ext.values()),
             "status_counts": status_counts,
             "type_counts": type_counts,
             "total_tags": len(self.tags_index),
@@ -464,47 +587,109 @@ class ExtensionRegistry:
         Args:
             data: 注册表数据
         """
+        self._import_sections(
+            data.get("extensions", {}).values(),
+            data.get("dependencies", []),
+            data.get("categories", {}).items(),
+            data.get("tags_index", {}).items()
+        )
+    
+    def _import_sections(self,
+                         extensions_data: Iterable[Dict[str, Any]],
+                         dependencies_data: Iterable[Dict[str, Any]],
+                         categories_items: Iterable[Tuple[str, List[str]]],
+                         tags_items: Iterable[Tuple[str, List[str]]]) -> None:
+        """按分段导入注册表数据
+        
+        各分段以迭代器传入，既可来自内存中的字典，也可来自流式解析。
+        
+        Args:
+            extensions_data: 扩展数据迭代器
+            dependencies_data: 依赖关系数据迭代器
+            categories_items: 分类键值对迭代器
+            tags_items: 标签索引键值对迭代器
+        """
         # 清空现有数据
         self.extensions.clear()
-        self.dependencies.clear()
+        self._by_ext.clear()
+        self._by_dep.clear()
         self.categories.clear()
         self.tags_index.clear()
+        self._tag_counts.clear()
         
-        # 导入扩展
-        for ext_id, ext_data in data.get("extensions", {}).items():
+        # 导入扩展：直接写入，标签索引在全部导入后一次性重建
+        extensions = self.extensions
+        for ext_data in extensions_data:
             extension_info = ExtensionInfo.from_dict(ext_data)
-            self.register_extension(extension_info)
+            if extension_info.id not in extensions:
+                extensions[extension_info.id] = extension_info
+        self._renumber()
+        
+        tags_index = self.tags_index
+        for extension_info in extensions.values():
+            for tag in extension_info.tags:
+                tags_index.setdefault(tag, set()).add(extension_info.id)
         
         # 导入依赖关系
-        for dep_data in data.get("dependencies", []):
+        for dep_data in dependencies_data:
             dependency = ExtensionDependency.from_dict(dep_data)
             self.add_dependency(dependency)
         
         # 导入分类
-        self.categories.update(data.get("categories", {}))
+        self.categories.update(categories_items)
         
         # 导入标签索引
-        for tag, ext_ids in data.get("tags_index", {}).items():
+        for tag, ext_ids in tags_items:
             self.tags_index[tag] = set(ext_ids)
+        self._tag_counts = {tag: len(ext_ids) for tag, ext_ids in self.tags_index.items()}
     
     def save_to_file(self, file_path: str) -> None:
         """保存到文件
         
+        安装了orjson时直接序列化扩展与依赖的dataclass实例，不经过
+        export_registry构建的中间字典；集合由_orjson_default转换。
+        
         Args:
             file_path: 文件路径
         """
-        data = self.export_registry()
-        
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            payload = orjson.dumps(
+                {
+                    "extensions": self.extensions,
+                    "dependencies": self.dependencies,
+                    "categories": self.categories,
+                    "tags_index": self.tags_index
+                },
+                default=_orjson_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+            with open(file_path, 'wb') as f:
+                f.write(payload)
+        else:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(self.export_registry(), f, ensure_ascii=False, indent=2)
     
     def load_from_file(self, file_path: str) -> None:
         """从文件加载
         
+        安装了ijson时逐条流式解析各分段并立即导入，不在内存中构建完整的
+        注册表字典；否则整体解析后导入。
+        
         Args:
             file_path: 文件路径
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if ijson is not None:
+            with open(file_path, 'rb') as f:
+                self._import_sections(
+                    (ext_data for _, ext_data in _iter_json_section(f, 'extensions', pairs=True)),
+                    _iter_json_section(f, 'dependencies.item'),
+                    _iter_json_section(f, 'categories', pairs=True),
+                    _iter_json_section(f, 'tags_index', pairs=True)
+                )
+            return
+        
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         
         self.import_registry(data)
\ No newline at end of file
@@ -2,9 +2,13 @@
 物品领域模型
 包含物品的属性、状态和行为规则
 """
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Union
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Union
 from enum import Enum
+import sys
 
 from .base import Entity, ValueObject, AggregateRoot
 
@@ -19,6 +23,12 @@ class ItemType(Enum):
     MISC = "misc"
 
 
+# 常用枚举成员的模块级别名，热路径上以is比较，省去属性查找与__eq__分派
+_WEAPON = ItemType.WEAPON
+_ARMOR = ItemType.ARMOR
+_CONSUMABLE = ItemType.CONSUMABLE
+
+
 class ItemRarity(Enum):
     """物品稀有度枚举"""
     COMMON = "common"
@@ -61,7 +71,7 @@ class ArmorType(Enum):
     SHIELD = "shield"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ItemStats(ValueObject):
     """物品属性值对象"""
     weight: float = 0.0
@@ -73,7 +83,7 @@ class ItemStats(ValueObject):
     stealth_disadvantage: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ItemProperties(ValueObject):
     """物品属性值对象"""
     magical: bool = False
@@ -83,15 +93,44 @@ class ItemProperties(ValueObject):
     description: str = ""
 
 
-@dataclass
+@lru_cache(maxsize=4096)
+def make_item_stats(**kwargs) -> ItemStats:
+    """获取共享的物品属性实例
+    
+    ItemStats不可变且按值哈希，相同参数返回同一实例（享元），
+    大量同类物品共用一份属性。
+    
+    Args:
+        **kwargs: ItemStats字段
+        
+    Returns:
+        ItemStats: 共享的物品属性实例
+    """
+    return ItemStats(**kwargs)
+
+
+@lru_cache(maxsize=4096)
+def make_item_properties(**kwargs) -> ItemProperties:
+    """获取共享的物品特性实例
+    
+    Args:
+        **kwargs: ItemProperties字段
+        
+    Returns:
+        ItemProperties: 共享的物品特性实例
+    """
+    return ItemProperties(**kwargs)
+
+
+@dataclass(slots=True)
 class Item(Entity):
     """物品实体"""
     name: str
     item_type: ItemType
     rarity: ItemRarity = ItemRarity.COMMON
-    stats: ItemStats = field(default_factory=ItemStats)
-    properties: ItemProperties = field(default_factory=ItemProperties)
-    usable_by: List[str] = field(default_factory=list)
+    stats: ItemStats = field(default_factory=make_item_stats)
+    properties: ItemProperties = field(default_factory=make_item_properties)
+    usable_by: FrozenSet[str] = frozenset()
     tags: Set[str] = field(default_factory=set)
 
     def __post_init__(self):
@@ -99,30 +138,35 @@ class Item(Entity):
         if not self.name:
             raise ValueError("物品名称不能为空")
         
+        # 规范为不可变集合，接受任意可迭代对象，成员判断为O(1)
+        self.usable_by = frozenset(sys.intern(name) for name in self.usable_by)
+        
+        item_type = self.item_type
+        
         # 武器特定验证
-        if self.item_type == ItemType.WEAPON:
+        if item_type is _WEAPON:
             if not self.stats.damage_dice:
                 raise ValueError("武器必须有伤害骰子")
         
         # 护甲特定验证
-        if self.item_type == ItemType.ARMOR:
+        elif item_type is _ARMOR:
             if self.stats.armor_class <= 0:
                 raise ValueError("护甲必须有护甲等级")
 
     @property
     def is_weapon(self) -> bool:
         """是否为武器"""
-        return self.item_type == ItemType.WEAPON
+        return self.item_type is _WEAPON
 
     @property
     def is_armor(self) -> bool:
         """是否为护甲"""
-        return self.item_type == ItemType.ARMOR
+        return self.item_type is _ARMOR
 
     @property
     def is_consumable(self) -> bool:
         """是否为消耗品"""
-        return self.item_type == ItemType.CONSUMABLE
+        return self.item_type is _CONSUMABLE
 
     @property
     def is_magical(self) -> bool:
@@ -137,7 +181,7 @@ class Item(Entity):
     def can_be_used_by(self, character_name: str) -> bool:
         """检查是否可以被指定角色使用"""
         if not self.usable_by:
-            return True  # 空列表表示所有人都可以使用
+            return True  # 空集合表示所有人都可以使用
         return character_name in self.usable_by
 
     def has_tag(self, tag: str) -> bool:
@@ -174,6 +218,8 @@ class Item(Entity):
 class Inventory:
     """物品栏值对象"""
     
+    __slots__ = ('_capacity', '_items', '_total')
+    
     def __init__(self, capacity: int = 20):
         """初始化物品栏
         
@@ -181,7 +227,9 @@ class Inventory:
             capacity: 物品栏容量（槽位数）
         """
         self._capacity = capacity
-        self._items: Dict[str, int] = {}
+        self._items: Counter = Counter()
+        # 物品总数量，随增删增量维护
+        self._total = 0
     
     @property
     def capacity(self) -> int:
@@ -191,7 +239,7 @@ class Inventory:
     @property
     def items(self) -> Dict[str, int]:
         """获取物品字典的副本"""
-        return self._items.copy()
+        return dict(self._items)
     
     @property
     def is_full(self) -> bool:
@@ -206,7 +254,7 @@ class Inventory:
     @property
     def total_quantity(self) -> int:
         """获取物品总数量"""
-        return sum(self._items.values())
+        return self._total
     
     def add_item(self, item_name: str, quantity: int = 1) -> bool:
         """添加物品
@@ -224,7 +272,8 @@ class Inventory:
         if item_name not in self._items and self.is_full:
             return False
         
-        self._items[item_name] = self._items.get(item_name, 0) + quantity
+        self._items[item_name] += quantity
+        self._total += quantity
         return True
     
     def remove_item(self, item_name: str, quantity: int = 1) -> bool:
@@ -244,11 +293,11 @@ class Inventory:
         if current_quantity < quantity:
             return False
         
-        new_quantity = current_quantity - quantity
-        if new_quantity == 0:
+        if current_quantity == quantity:
             del self._items[item_name]
         else:
-            self._items[item_name] = new_quantity
+            self._items[item_name] = current_quantity - quantity
+        self._total -= quantity
         
         return True
     
@@ -263,6 +312,7 @@ class Inventory:
     def clear(self) -> None:
         """清空物品栏"""
         self._items.clear()
+        self._total = 0
     
     def transfer_to(self, other: 'Inventory', item_name: str, quantity: int = 1) -> bool:
         """转移物品到另一个物品栏
@@ -307,7 +357,7 @@ class ItemMustHaveValidValue:
 
 
 # 预定义的一些常用物品
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WeaponTemplate(ValueObject):
     """武器模板值对象"""
     name: str
@@ -316,9 +366,14 @@ class WeaponTemplate(ValueObject):
     weight: float
     value: int
     weapon_type: WeaponType
-    properties: List[str] = field(default_factory=list)
+    properties: Tuple[str, ...] = ()
     magical: bool = False
     
+    def __post_init__(self):
+        """将属性列表规范为元组，保证模板可哈希"""
+        if type(self.properties) is not tuple:
+            object.__setattr__(self, 'properties', tuple(self.properties))
+    
     def _get_equality_components(self) -> tuple:
         """获取相等性比较的组件"""
         return (
@@ -328,12 +383,12 @@ class WeaponTemplate(ValueObject):
             self.weight,
             self.value,
             self.weapon_type,
-            tuple(sorted(self.properties)),
+            self.properties,
             self.magical
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ArmorTemplate(ValueObject):
     """护甲模板值对象"""
     name: str
@@ -360,7 +415,7 @@ class ArmorTemplate(ValueObject):
 
 
 # 常用武器模板
-COMMON_WEAPONS = {
+COMMON_WEAPONS = MappingProxyType({
     "dagger": WeaponTemplate(
         name="匕首",
         damage_dice="1d4",
@@ -368,7 +423,7 @@ COMMON_WEAPONS = {
         weight=1.0,
         value=2,
         weapon_type=WeaponType.MELEE,
-        properties=["finesse", "light", "thrown"]
+        properties=("finesse", "light", "thrown")
     ),
     "longsword": WeaponTemplate(
         name="长剑",
@@ -377,7 +432,7 @@ COMMON_WEAPONS = {
         weight=3.0,
         value=15,
         weapon_type=WeaponType.MELEE,
-        properties=["versatile"]
+        properties=("versatile",)
     ),
     "shortbow": WeaponTemplate(
         name="短弓",
@@ -386,12 +441,12 @@ COMMON_WEAPONS = {
         weight=2.0,
         value=25,
         weapon_type=WeaponType.RANGED,
-        properties=["ammunition", "two_handed"]
+        properties=("ammunition", "two_handed")
     ),
-}
+})
 
 # 常用护甲模板
-COMMON_ARMOR = {
+COMMON_ARMOR = MappingProxyType({
     "leather": ArmorTemplate(
         name="皮甲",
         armor_class=11,
@@ -414,4 +469,4 @@ COMMON_ARMOR = {
         weight=6.0,
         value=10
     ),
-}
\ No newline at end of file
+})
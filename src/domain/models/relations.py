@@ -229,7 +229,7 @@ class RelationshipNetwork(AggregateRoot):
         self.characters.add(relation.source)
         self.characters.add(relation.target)
         
-        self.add_domain_event("relation_added", {
+        self.raise_event("relation_added", {
             "source": relation.source,
             "target": relation.target,
             "type": relation.relation_type.value,
@@ -268,7 +268,7 @@ class RelationshipNetwork(AggregateRoot):
         if not target_still_has_relations:
             self.characters.discard(target)
         
-        self.add_domain_event("relation_removed", {
+        self.raise_event("relation_removed", {
             "source": source,
             "target": target,
             "type": relation.relation_type.value,
@@ -302,7 +302,7 @@ class RelationshipNetwork(AggregateRoot):
         
         self.relations[key] = new_relation
         
-        self.add_domain_event("relation_strength_changed", {
+        self.raise_event("relation_strength_changed", {
             "source": source,
             "target": target,
             "old_strength": old_relation.strength,
@@ -283,8 +283,8 @@ class World(AggregateRoot):
         self._created_at = datetime.now()
         self._updated_at = datetime.now()
         self._version = 1
-        self._domain_events = []
-        self._child_entities = set()
+        self._domain_events = None
+        self._child_entities = {}
         
         if not self.name:
             raise ValueError("世界名称不能为空")
@@ -327,7 +327,7 @@ class World(AggregateRoot):
         # 处理到期的事件
         self._process_due_events()
         
-        self.add_domain_event("time_advanced", {
+        self.raise_event("time_advanced", {
             "old_time": old_time.time_string,
             "new_time": self.current_time.time_string,
             "minutes_advanced": minutes
@@ -346,7 +346,7 @@ class World(AggregateRoot):
         if scene.location.name not in self.locations:
             self.locations[scene.location.name] = scene.location
         
-        self.add_domain_event("scene_changed", {
+        self.raise_event("scene_changed", {
             "old_location": old_scene.location_name if old_scene else "无",
             "new_location": scene.location_name,
             "weather": scene.weather.value,
@@ -361,7 +361,7 @@ class World(AggregateRoot):
         """
         self.locations[location.name] = location
         
-        self.add_domain_event("location_added", {
+        self.raise_event("location_added", {
             "location_name": location.name,
             "location_type": location.location_type.value
         })
@@ -391,7 +391,7 @@ class World(AggregateRoot):
         
         del self.locations[location_name]
         
-        self.add_domain_event("location_removed", {
+        self.raise_event("location_removed", {
             "location_name": location_name
         })
         
@@ -408,7 +408,7 @@ class World(AggregateRoot):
         # 更新关系网络
         self.relationship_network.characters.add(character.name)
         
-        self.add_domain_event("character_added", {
+        self.raise_event("character_added", {
             "character_name": character.name,
             "is_alive": character.is_alive
         })
@@ -435,7 +435,7 @@ class World(AggregateRoot):
         # 从关系网络中移除
         self.relationship_network.characters.discard(character_name)
         
-        self.add_domain_event("character_removed", {
+        self.raise_event("character_removed", {
             "character_name": character_name
         })
         
@@ -449,7 +449,7 @@ class World(AggregateRoot):
         """
         self.items[str(item.id)] = item
         
-        self.add_domain_event("item_added", {
+        self.raise_event("item_added", {
             "item_id": str(item.id),
             "item_name": item.name,
             "item_type": item.item_type.value
@@ -470,7 +470,7 @@ class World(AggregateRoot):
         item = self.items[item_id]
         del self.items[item_id]
         
-        self.add_domain_event("item_removed", {
+        self.raise_event("item_removed", {
             "item_id": item_id,
             "item_name": item.name
         })
@@ -495,7 +495,7 @@ class World(AggregateRoot):
         self.combat = Combat(location=location)
         self.combat.start_combat(participants)
         
-        self.add_domain_event("combat_started", {
+        self.raise_event("combat_started", {
             "location": location,
             "participants": participants
         })
@@ -508,7 +508,7 @@ class World(AggregateRoot):
         self.combat.end_combat()
         self.combat = None
         
-        self.add_domain_event("combat_ended", {})
+        self.raise_event("combat_ended", {})
 
     def add_global_event(self, event_data: Dict[str, Any], trigger_time: Optional[int] = None) -> None:
         """添加全局事件
@@ -545,7 +545,7 @@ class World(AggregateRoot):
                 self._execute_event_effects(event["data"])
         
         if triggered_events:
-            self.add_domain_event("global_events_triggered", {
+            self.raise_event("global_events_triggered", {
                 "events": [event["data"] for event in triggered_events]
             })
 
@@ -482,24 +482,8 @@ class CharacterService:
         if character.name not in combat.participants:
             return False
         
-        # 从参与者列表中移除
-        combat.participants.remove(character.name)
-        
-        # 从先攻顺序中移除
-        if character.name in combat.initiative_order:
-            combat.initiative_order.remove(character.name)
-        
-        # 从先攻分数中移除
-        if character.name in combat.initiative_scores:
-            del combat.initiative_scores[character.name]
-        
-        # 从回合状态中移除
-        if character.name in combat.turn_states:
-            del combat.turn_states[character.name]
-        
-        # 如果移除的是当前行动者，推进到下一个回合
-        if combat.current_actor == character.name:
-            combat.next_turn()
+        # 由战斗聚合根同步维护参与者、先攻顺序、回合索引与当前行动者
+        combat.remove_participant(character.name)
         
         return True
     
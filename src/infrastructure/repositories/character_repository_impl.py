@@ -122,9 +122,9 @@ class CharacterRepositoryImpl(ICharacterRepository):
                 'x': character.position.x,
                 'y': character.position.y,
             } if character.position else None,
-            'proficient_skills': character.proficient_skills,
-            'proficient_saves': character.proficient_saves,
-            'conditions': [c.value for c in character.conditions],
+            'proficient_skills': list(character.proficient_skills),
+            'proficient_saves': list(character.proficient_saves),
+            'conditions': character.condition_names,
             'inventory': character.inventory,
             'created_at': character.created_at.isoformat() if character.created_at else None,
             'updated_at': character.updated_at.isoformat() if character.updated_at else None,
@@ -136,11 +136,11 @@ class CharacterRepositoryImpl(ICharacterRepository):
                 'card_info': {
                     'description': character.card_info.description,
                     'first_message': character.card_info.first_message,
-                    'example_messages': character.card_info.example_messages,
+                    'example_messages': list(character.card_info.example_messages),
                     'scenario': character.card_info.scenario,
                     'personality_summary': character.card_info.personality_summary,
                     'creator_notes': character.card_info.creator_notes,
-                    'tags': character.card_info.tags,
+                    'tags': list(character.card_info.tags),
                 },
                 'png_metadata': {
                     'name': character.png_metadata.name,
@@ -468,13 +468,12 @@ class CharacterRepositoryImpl(ICharacterRepository):
     
     def get_characters_in_range(self, center: Position, range_steps: int) -> List[Character]:
         """获取指定范围内的角色"""
-        result = []
-        for character in self._characters.values():
-            if character.position:
-                distance = character.position.distance_to(center)
-                if distance <= range_steps:
-                    result.append(character)
-        return result
+        placed = [c for c in self._characters.values() if c.position]
+        distances = center.distance_to_many(
+            [c.position.x for c in placed],
+            [c.position.y for c in placed]
+        )
+        return [c for c, distance in zip(placed, distances) if distance <= range_steps]
     
     def backup_character(self, character_id: str) -> Dict[str, Any]:
         """备份角色数据"""
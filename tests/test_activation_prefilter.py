@@ -0,0 +1,103 @@
+"""
+传说书激活预筛选测试
+
+预筛选只能排除一定不会激活的条目：凡是领域规则should_activate判定为激活的
+条目，都必须出现在prefilter_entries的候选结果中。
+"""
+
+import pytest
+
+from src.domain.dtos.activation_utils import prefilter_entries
+from src.domain.dtos.lorebook_dtos import ActivationRuleDto, KeywordPatternDto, LorebookEntryDto
+from src.domain.models.lorebook import ActivationRule, ActivationType, KeywordPattern, KeywordType
+
+
+KEYWORDS = [
+    ("dragon", "exact", False),
+    ("Dragon", "exact", True),
+    ("drag", "partial", False),
+    ("GON", "partial", True),
+    ("dra*", "wildcard", False),
+    ("*gon", "wildcard", True),
+    ("dra.on*", "wildcard", False),
+    ("cat|*dragon*", "wildcard", False),
+    ("d[rR]agon*", "wildcard", False),
+    ("dra?gon", "wildcard", False),
+    ("*", "wildcard", False),
+    ("dr.g", "regex", False),
+]
+
+TEXTS = [
+    "dragon",
+    "Dragon",
+    "DRAGON",
+    "cat",
+    "the dragon sleeps",
+    "draon",
+    "dragonfly",
+    "",
+]
+
+
+def _entry_dto(index, pattern, keyword_type, case_sensitive):
+    keyword = KeywordPatternDto(pattern=pattern, type=keyword_type, case_sensitive=case_sensitive)
+    return LorebookEntryDto(
+        id=f"entry-{index}",
+        title=pattern,
+        content="",
+        keywords=[keyword],
+        activation_rule=ActivationRuleDto(
+            type="regex" if keyword_type == "regex" else "keyword",
+            keywords=[keyword]
+        )
+    )
+
+
+def _domain_rule(pattern, keyword_type, case_sensitive):
+    return ActivationRule(
+        type=ActivationType.REGEX if keyword_type == "regex" else ActivationType.KEYWORD,
+        keywords=[KeywordPattern(
+            pattern=pattern,
+            type=KeywordType(keyword_type),
+            case_sensitive=case_sensitive
+        )]
+    )
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_prefilter_has_no_false_negatives(text):
+    entries = [_entry_dto(i, *keyword) for i, keyword in enumerate(KEYWORDS)]
+    candidates = {entry.id for entry in prefilter_entries(text, entries)}
+
+    for entry, keyword in zip(entries, KEYWORDS):
+        if _domain_rule(*keyword).should_activate(text):
+            assert entry.id in candidates, (keyword, text)
+
+
+def test_wildcard_with_regex_metacharacters_passes_through():
+    entry = _entry_dto(0, "dra.on*", "wildcard", False)
+
+    assert _domain_rule("dra.on*", "wildcard", False).should_activate("dragon")
+    assert prefilter_entries("dragon", [entry]) == [entry]
+
+
+def test_plain_wildcard_is_still_filtered():
+    entry = _entry_dto(0, "dra*gon", "wildcard", False)
+
+    assert prefilter_entries("a cat", [entry]) == []
+    assert prefilter_entries("DRAGON", [entry]) == [entry]
+
+
+def test_multi_keyword_entries():
+    keywords = [KeywordPatternDto(pattern=p, type="partial") for p in ("elf", "orc")]
+    entry = LorebookEntryDto(
+        id="multi",
+        title="multi",
+        content="",
+        keywords=keywords,
+        activation_rule=ActivationRuleDto(type="keyword", keywords=keywords)
+    )
+
+    assert prefilter_entries("an ORC camp", [entry]) == [entry]
+    assert prefilter_entries("an elf hut", [entry]) == [entry]
+    assert prefilter_entries("humans", [entry]) == []
@@ -0,0 +1,172 @@
+"""
+角色领域模型测试
+
+覆盖生成的构造函数（聚合根ID与领域事件）、以__class__切换实现的只读值对象、
+状态条件位掩码，以及角色卡导出与导入的往返一致性。
+"""
+
+import copy
+import dataclasses
+import pickle
+from dataclasses import FrozenInstanceError
+from datetime import datetime
+
+import pytest
+
+from src.domain.models.characters import (
+    Abilities,
+    Character,
+    CharacterCard,
+    CharacterCardInfo,
+    CharacterStats,
+    Condition,
+    LazyDomainEvent,
+    Position,
+)
+
+
+def _character(**overrides):
+    values = dict(name="艾琳", abilities=Abilities(dexterity=14), stats=CharacterStats(), hp=10, max_hp=10)
+    values.update(overrides)
+    return Character(**values)
+
+
+def _card(**overrides):
+    values = dict(
+        name="艾琳",
+        card_info=CharacterCardInfo(description="游侠", tags=["elf"]),
+        abilities=Abilities(dexterity=14, wisdom=12),
+        position=Position(2, 3),
+        proficient_skills=["Stealth"],
+        proficient_saves=["DEX"],
+        conditions=[Condition.PRONE, "hidden"],
+        inventory={"arrow": 20}
+    )
+    values.update(overrides)
+    return CharacterCard(**values)
+
+
+def test_new_character_has_identity_and_records_events():
+    first = _character()
+    second = _character()
+
+    assert first.id is not None
+    assert first.id != second.id
+    assert first.created_at is not None
+    assert first.domain_events == ()
+
+    first.take_damage(3)
+
+    assert [e.get_event_type() for e in first.domain_events] == []
+    first.take_damage(10)
+    assert [e.get_event_type() for e in first.domain_events] == ["character_knocked_out"]
+
+
+def test_character_init_clamps_hp_and_rejects_empty_name():
+    assert _character(hp=15).hp == 10
+    assert _character(hp=-5).hp == 0
+    with pytest.raises(ValueError):
+        _character(name="")
+
+
+def test_new_card_has_identity_and_creation_event():
+    card = _card()
+
+    assert card.id is not None
+    assert [e.get_event_type() for e in card.domain_events] == ["character_card_created"]
+    assert card.domain_events[0].data["character_name"] == "艾琳"
+
+
+def test_lazy_event_builds_payload_once_with_values_at_event_time():
+    character = _character(position=Position(0, 0))
+    character.move_to(Position(1, 1))
+    character.move_to(Position(2, 2))
+
+    event = character.domain_events[0]
+    assert isinstance(event, LazyDomainEvent)
+    assert event.data["new_position"] == Position(1, 1)
+    assert event.data is event.data
+
+
+@pytest.mark.parametrize("value", [Position(1, 2), Abilities(strength=16), CharacterStats(level=3)])
+def test_value_objects_reject_assignment(value):
+    name = dataclasses.fields(value)[0].name
+
+    with pytest.raises(FrozenInstanceError):
+        setattr(value, name, 1)
+    with pytest.raises(FrozenInstanceError):
+        delattr(value, name)
+
+
+def test_value_object_replace_returns_new_frozen_instance():
+    position = Position(1, 2)
+
+    moved = dataclasses.replace(position, x=5)
+
+    assert moved == Position(5, 2)
+    assert position == Position(1, 2)
+    with pytest.raises(FrozenInstanceError):
+        moved.x = 0
+
+
+@pytest.mark.parametrize("clone", [copy.copy, copy.deepcopy, lambda v: pickle.loads(pickle.dumps(v))])
+@pytest.mark.parametrize("value", [Position(1, 2), Abilities(strength=16), CharacterStats(level=3)])
+def test_value_objects_survive_copy_and_pickle(clone, value):
+    cloned = clone(value)
+
+    assert cloned == value
+    assert hash(cloned) == hash(value)
+    assert type(cloned) is type(value)
+    with pytest.raises(FrozenInstanceError):
+        setattr(cloned, dataclasses.fields(value)[0].name, 1)
+
+
+def test_condition_accepts_string_values():
+    assert Condition("prone") is Condition.PRONE
+    assert Condition("GRAPPLED") is Condition.GRAPPLED
+    assert Condition.PRONE.name_value == "prone"
+    with pytest.raises(ValueError):
+        Condition("flying")
+
+
+def test_condition_mask_operations():
+    character = _character(conditions=["prone"])
+
+    character.add_condition(Condition.DODGE)
+    character.remove_condition(Condition.PRONE)
+
+    assert character.conditions == frozenset({Condition.DODGE})
+    assert character.has_condition(Condition.DODGE)
+    assert not character.has_condition(Condition.PRONE)
+    assert character.condition_names == ["dodge"]
+
+
+def test_card_round_trip_through_export():
+    card = _card()
+
+    exported = card.export_to_dict()
+    restored = CharacterCard.from_dict(exported)
+
+    assert restored.conditions == frozenset({Condition.PRONE, Condition.HIDDEN})
+    assert restored.condition_names == ["hidden", "prone"]
+    assert restored.proficient_skills == ("Stealth",)
+    assert restored.is_proficient_in_skill("stealth")
+    assert restored.position == Position(2, 3)
+    assert restored.created_at == card.created_at
+
+    reexported = restored.export_to_dict()
+    exported.pop("id")
+    reexported.pop("id")
+    assert reexported == exported
+
+
+def test_card_round_trip_with_epoch_timestamps():
+    card = _card()
+    card._created_at = datetime(2024, 1, 2, 3, 4, 5, 678000)
+
+    exported = card.export_to_dict(epoch_timestamps=True)
+    restored = CharacterCard.from_dict(exported)
+
+    assert isinstance(exported["created_at"], int)
+    assert restored.created_at == datetime(2024, 1, 2, 3, 4, 5, 678000)
+    assert isinstance(card.export_to_dict()["created_at"], str)
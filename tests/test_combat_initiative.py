@@ -0,0 +1,179 @@
+"""
+战斗先攻顺序测试
+
+覆盖roll_initiative的同分排序与重掷时的当前行动者，add_participant_mid_combat
+的二分插入、回合索引调整、重名校验与索引补建，以及remove_participant的回合交接。
+"""
+
+import pytest
+
+from src.domain.models import combat as combat_module
+from src.domain.models.combat import Combat, CombatState
+
+
+def _fixed_rolls(monkeypatch, *rolls):
+    """让roll_initiative按给定顺序返回掷骰结果"""
+    monkeypatch.setattr(combat_module.random, "choices", lambda population, k: list(rolls[:k]))
+
+
+def _started_combat(monkeypatch, participants, rolls):
+    _fixed_rolls(monkeypatch, *rolls)
+    combat = Combat(location="arena")
+    combat.start_combat(participants)
+    return combat
+
+
+def test_roll_initiative_orders_by_score_then_name(monkeypatch):
+    combat = _started_combat(monkeypatch, ["zed", "amy", "bob"], (10, 10, 15))
+
+    assert combat.initiative_order == ["bob", "amy", "zed"]
+    assert combat.initiative_scores == {"zed": 10, "amy": 10, "bob": 15}
+    assert combat.current_actor == "bob"
+
+
+def test_roll_initiative_ties_ignore_participant_order(monkeypatch):
+    first = _started_combat(monkeypatch, ["cid", "ann", "ben"], (12, 12, 12))
+    second = _started_combat(monkeypatch, ["ben", "cid", "ann"], (12, 12, 12))
+
+    assert first.initiative_order == ["ann", "ben", "cid"]
+    assert second.initiative_order == first.initiative_order
+
+
+@pytest.fixture
+def combat(monkeypatch):
+    # 先攻顺序 [a(18), b(12), c(6)]，推进到b的回合
+    combat = _started_combat(monkeypatch, ["a", "b", "c"], (18, 12, 6))
+    combat.next_turn()
+    assert combat.current_actor == "b"
+    assert combat.turn_idx == 1
+    return combat
+
+
+def test_insert_before_current_actor_shifts_turn_index(combat):
+    combat.add_participant_mid_combat("d", 15)
+
+    assert combat.initiative_order == ["a", "d", "b", "c"]
+    assert combat.turn_idx == 2
+    assert combat.current_actor == "b"
+    assert combat.initiative_order[combat.turn_idx] == "b"
+    assert "d" in combat.participants
+    assert combat.initiative_scores["d"] == 15
+
+
+def test_insert_at_current_actor_position_keeps_actor(combat):
+    # 同分同敏捷时名称"ab"排在"b"之前，插入位置恰为当前行动者的位置
+    combat.add_participant_mid_combat("ab", 12)
+
+    assert combat.initiative_order == ["a", "ab", "b", "c"]
+    assert combat.turn_idx == 2
+    assert combat.initiative_order[combat.turn_idx] == combat.current_actor == "b"
+
+
+def test_insert_with_higher_dexterity_wins_tie(combat):
+    combat.add_participant_mid_combat("z", 12, dexterity_modifier=3)
+
+    assert combat.initiative_order == ["a", "z", "b", "c"]
+    assert combat.initiative_order[combat.turn_idx] == "b"
+
+
+def test_insert_after_current_actor_keeps_turn_index(combat):
+    combat.add_participant_mid_combat("d", 8)
+
+    assert combat.initiative_order == ["a", "b", "d", "c"]
+    assert combat.turn_idx == 1
+    assert combat.current_actor == "b"
+    assert combat.next_turn() == "d"
+
+
+def test_insert_duplicate_name_raises(combat):
+    with pytest.raises(ValueError):
+        combat.add_participant_mid_combat("a", 20)
+
+    assert combat.initiative_order == ["a", "b", "c"]
+
+
+def test_insert_rebuilds_index_for_manual_initiative_order():
+    combat = Combat(
+        location="arena",
+        participants=["x", "y", "z"],
+        initiative_order=["y", "x", "z"],
+        initiative_scores={"x": 15, "y": 10, "z": 5},
+        turn_idx=0
+    )
+    assert combat.state == CombatState.ACTIVE
+    assert combat.current_actor == "y"
+
+    combat.add_participant_mid_combat("w", 12)
+
+    # 补建索引后先攻顺序按先攻值排列，当前行动者与回合索引保持一致
+    assert combat.initiative_order == ["x", "w", "y", "z"]
+    assert combat.current_actor == "y"
+    assert combat.initiative_order[combat.turn_idx] == "y"
+
+
+def test_insert_before_combat_starts_does_not_move_turn_index():
+    combat = Combat(location="arena")
+
+    combat.add_participant_mid_combat("solo", 10)
+
+    assert combat.initiative_order == ["solo"]
+    assert combat.turn_idx == 0
+    assert combat.current_actor is None
+
+
+def test_reroll_keeps_current_actor(monkeypatch, combat):
+    # 重掷后b排到最前，回合仍属于b
+    _fixed_rolls(monkeypatch, 5, 20, 10)
+    combat.roll_initiative()
+
+    assert combat.initiative_order == ["b", "c", "a"]
+    assert combat.current_actor == "b"
+    assert combat.turn_idx == 0
+
+
+def test_remove_participant_before_current_actor(combat):
+    combat.remove_participant("a")
+
+    assert combat.initiative_order == ["b", "c"]
+    assert combat.turn_idx == 0
+    assert combat.current_actor == "b"
+    assert "a" not in combat.participants
+    assert "a" not in combat.initiative_scores
+
+
+def test_remove_current_actor_passes_turn_to_next(monkeypatch):
+    combat = _started_combat(monkeypatch, ["a", "b", "c", "d"], (18, 12, 9, 6))
+    combat.next_turn()
+    combat.next_turn()
+    assert combat.current_actor == "c"
+
+    combat.remove_participant("c")
+
+    assert combat.initiative_order == ["a", "b", "d"]
+    assert combat.current_actor == "d"
+    assert combat.turn_idx == 2
+    assert combat.round == 1
+
+
+def test_remove_last_current_actor_wraps_to_next_round(monkeypatch, combat):
+    combat.next_turn()
+    assert combat.current_actor == "c"
+
+    combat.remove_participant("c")
+
+    assert combat.current_actor == "a"
+    assert combat.turn_idx == 0
+    assert combat.round == 2
+
+
+def test_remove_participant_keeps_index_for_later_inserts(combat):
+    combat.remove_participant("a")
+    combat.add_participant_mid_combat("d", 15)
+
+    assert combat.initiative_order == ["d", "b", "c"]
+    assert combat.initiative_order[combat.turn_idx] == combat.current_actor == "b"
+
+
+def test_remove_unknown_participant_raises(combat):
+    with pytest.raises(ValueError):
+        combat.remove_participant("nobody")
@@ -0,0 +1,92 @@
+"""
+战斗快照测试
+
+距离带与掩体只能经由Combat的方法修改，快照缓存随之失效；
+快照缓存不进入pickle与deepcopy的状态。
+"""
+
+import copy
+import pickle
+
+import pytest
+
+from src.domain.models.combat import Combat, CoverLevel, RangeBand
+
+
+@pytest.fixture
+def combat():
+    return Combat(
+        location="arena",
+        range_bands={("a", "b"): RangeBand.FAR},
+        cover={"a": CoverLevel.HALF}
+    )
+
+
+def test_constructor_arguments_are_stored(combat):
+    assert combat.get_range_band("b", "a") == RangeBand.FAR
+    assert combat.get_cover("a") == CoverLevel.HALF
+    assert dict(combat.range_bands) == {("a", "b"): RangeBand.FAR}
+
+
+def test_range_bands_and_cover_are_read_only(combat):
+    with pytest.raises(TypeError):
+        combat.range_bands[("a", "c")] = RangeBand.NEAR
+    with pytest.raises(TypeError):
+        combat.cover["a"] = CoverLevel.TOTAL
+    with pytest.raises(AttributeError):
+        combat.cover = {}
+
+
+def test_snapshot_reflects_overwritten_values(combat):
+    assert combat.snapshot()["cover"] == {"a": "half"}
+
+    combat.set_cover("a", CoverLevel.TOTAL)
+    combat.set_range_band("b", "a", RangeBand.ENGAGED)
+
+    snapshot = combat.snapshot()
+    assert snapshot["cover"] == {"a": "total"}
+    assert snapshot["range_bands"] == {"a&b": "engaged"}
+
+
+def test_clear_positioning_invalidates_snapshot(combat):
+    combat.set_range_band("b", "c", RangeBand.NEAR)
+    combat.snapshot()
+
+    combat.clear_positioning("a")
+
+    snapshot = combat.snapshot()
+    assert snapshot["range_bands"] == {"b&c": "near"}
+    assert snapshot["cover"] == {}
+
+
+def test_deep_snapshot_is_independent(combat):
+    snapshot = combat.snapshot(deep=True)
+    snapshot["cover"]["b"] = "total"
+
+    assert combat.snapshot()["cover"] == {"a": "half"}
+
+
+@pytest.mark.parametrize("clone", [copy.deepcopy, lambda c: pickle.loads(pickle.dumps(c))])
+def test_copies_after_snapshot(combat, clone):
+    combat.snapshot()
+
+    cloned = clone(combat)
+    cloned.set_cover("a", CoverLevel.NONE)
+
+    assert cloned.snapshot()["cover"] == {"a": "none"}
+    assert combat.snapshot()["cover"] == {"a": "half"}
+
+
+def test_remove_participant_clears_positioning():
+    combat = Combat(
+        location="arena",
+        participants=["a", "b"],
+        initiative_order=["a", "b"],
+        range_bands={("a", "b"): RangeBand.NEAR},
+        cover={"a": CoverLevel.HALF, "b": CoverLevel.TOTAL}
+    )
+
+    combat.remove_participant("a")
+
+    assert combat.snapshot()["range_bands"] == {}
+    assert combat.snapshot()["cover"] == {"b": "total"}
@@ -0,0 +1,64 @@
+"""
+扩展列表查询测试
+
+list_extensions按标签过滤时只遍历标签索引的交集，结果仍按注册顺序排列。
+"""
+
+import pytest
+
+from src.domain.models.extension_registry import ExtensionInfo, ExtensionRegistry
+
+
+def _info(ext_id, tags, status="active", extension_type="plugin"):
+    return ExtensionInfo(
+        id=ext_id,
+        name=ext_id,
+        version="1.0.0",
+        description="",
+        author="tester",
+        extension_type=extension_type,
+        status=status,
+        tags=tags
+    )
+
+
+@pytest.fixture
+def registry():
+    registry = ExtensionRegistry()
+    for ext_id in ("zeta", "alpha", "mid", "beta", "omega"):
+        registry.register_extension(_info(ext_id, ["ui", "core"] if ext_id != "mid" else ["ui"]))
+    return registry
+
+
+def _ids(extensions):
+    return [ext.id for ext in extensions]
+
+
+def test_tag_filter_keeps_registration_order(registry):
+    assert _ids(registry.list_extensions(tags=["ui"])) == ["zeta", "alpha", "mid", "beta", "omega"]
+    assert _ids(registry.list_extensions(tags=["core", "ui"])) == ["zeta", "alpha", "beta", "omega"]
+
+
+def test_tag_filter_matches_unfiltered_order(registry):
+    assert registry.list_extensions(tags=["ui"]) == registry.list_extensions()
+
+
+def test_order_after_unregister_and_reregister(registry):
+    registry.unregister_extension("alpha")
+    registry.register_extension(_info("alpha", ["ui", "core"]))
+
+    assert _ids(registry.list_extensions(tags=["core"])) == ["zeta", "beta", "omega", "alpha"]
+
+
+def test_order_after_import(registry):
+    imported = ExtensionRegistry()
+    imported.import_registry(registry.export_registry())
+
+    assert _ids(imported.list_extensions(tags=["core"])) == ["zeta", "alpha", "beta", "omega"]
+
+
+def test_constructor_extensions_are_ordered():
+    extensions = {ext_id: _info(ext_id, ["ui"]) for ext_id in ("c", "a", "b")}
+    registry = ExtensionRegistry(extensions=extensions, tags_index={"ui": {"a", "b", "c"}})
+
+    assert _ids(registry.list_extensions(tags=["ui"])) == ["c", "a", "b"]
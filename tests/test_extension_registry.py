@@ -0,0 +1,129 @@
+"""
+扩展注册表持久化测试
+
+验证save_to_file/load_from_file的往返一致性，包括ijson流式加载路径：
+各分段生成器复用同一文件句柄，首次取值时回到文件开头。
+"""
+
+import json
+import types
+from datetime import datetime
+
+import pytest
+
+from src.domain.models import extension_registry as registry_module
+from src.domain.models.extension_registry import (
+    ExtensionDependency,
+    ExtensionInfo,
+    ExtensionRegistry,
+)
+
+
+def _stub_ijson():
+    """最小的ijson替身：从文件句柄的当前位置解析剩余内容
+
+    句柄未回到开头时读到的是空内容，json解析失败，从而暴露漏掉的seek。
+    """
+    def _section(f, prefix):
+        data = json.loads(f.read())
+        for key in prefix.split('.'):
+            if key != 'item':
+                data = data[key]
+        return data
+
+    def items(f, prefix, use_float=False):
+        yield from _section(f, prefix)
+
+    def kvitems(f, prefix, use_float=False):
+        yield from _section(f, prefix).items()
+
+    return types.SimpleNamespace(items=items, kvitems=kvitems)
+
+
+def _make_registry() -> ExtensionRegistry:
+    registry = ExtensionRegistry()
+    registry.register_extension(ExtensionInfo(
+        id="core",
+        name="核心",
+        version="1.0.0",
+        description="core extension",
+        author="tester",
+        extension_type="plugin",
+        status="active",
+        tags=["base", "stable"],
+        load_time=datetime(2024, 1, 2, 3, 4, 5),
+        config={"ratio": 1.5, "nested": {"items": [1, 2]}}
+    ))
+    registry.register_extension(ExtensionInfo(
+        id="addon",
+        name="addon",
+        version="0.1.0",
+        description="",
+        author="tester",
+        extension_type="theme",
+        status="inactive",
+        tags=["stable"]
+    ))
+    registry.add_dependency(ExtensionDependency("addon", "core", "required", min_version="1.0.0"))
+    registry.add_dependency(ExtensionDependency("addon", "missing", "optional"))
+    registry.categories["ui"] = ["addon"]
+    return registry
+
+
+def _normalized(registry: ExtensionRegistry) -> dict:
+    data = registry.export_registry()
+    data["tags_index"] = {tag: sorted(ids) for tag, ids in data["tags_index"].items()}
+    return data
+
+
+def _assert_round_trip(tmp_path, registry):
+    path = tmp_path / "registry.json"
+    registry.save_to_file(str(path))
+
+    loaded = ExtensionRegistry()
+    loaded.load_from_file(str(path))
+
+    assert _normalized(loaded) == _normalized(registry)
+    assert loaded.get_dependents("core")[0].extension_id == "addon"
+    assert loaded.get_popular_tags(1) == [("stable", 2)]
+    return loaded
+
+
+def test_round_trip_without_ijson(tmp_path, monkeypatch):
+    monkeypatch.setattr(registry_module, "ijson", None)
+
+    _assert_round_trip(tmp_path, _make_registry())
+
+
+def test_round_trip_streams_sections_with_ijson(tmp_path, monkeypatch):
+    monkeypatch.setattr(registry_module, "ijson", _stub_ijson())
+
+    loaded = _assert_round_trip(tmp_path, _make_registry())
+
+    assert loaded.extensions["core"].config["ratio"] == 1.5
+    assert loaded.validate_dependencies("addon") == []
+
+
+def test_round_trip_with_real_ijson(tmp_path, monkeypatch):
+    ijson = pytest.importorskip("ijson")
+    monkeypatch.setattr(registry_module, "ijson", ijson)
+
+    loaded = _assert_round_trip(tmp_path, _make_registry())
+
+    assert isinstance(loaded.extensions["core"].config["ratio"], float)
+
+
+def test_streaming_load_replaces_existing_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr(registry_module, "ijson", _stub_ijson())
+    path = tmp_path / "registry.json"
+    _make_registry().save_to_file(str(path))
+
+    registry = ExtensionRegistry()
+    registry.register_extension(ExtensionInfo(
+        id="stale", name="stale", version="1", description="", author="x",
+        extension_type="plugin", status="active", tags=["old"]
+    ))
+    registry.load_from_file(str(path))
+
+    assert "stale" not in registry.extensions
+    assert "old" not in registry.tags_index
@@ -0,0 +1,88 @@
+"""
+DTO的JSON编解码测试
+
+验证to_json_bytes解析后与to_dict一致，包括值为None时省略的时间字段，
+并分别覆盖orjson与标准库json两条路径。
+"""
+
+from datetime import datetime
+
+import pytest
+
+from src.domain.dtos import json_codec
+from src.domain.dtos.json_codec import loads
+from src.domain.dtos.lorebook_dtos import (
+    ActivationRuleDto,
+    KeywordPatternDto,
+    LorebookActivationResultDto,
+    LorebookDto,
+    LorebookEntryDto,
+    LorebookExportDto,
+    LorebookListDto,
+    LorebookStatisticsDto,
+)
+
+
+@pytest.fixture(params=["orjson", "json"])
+def codec(request, monkeypatch):
+    if request.param == "orjson":
+        if json_codec.orjson is None:
+            pytest.skip("未安装orjson")
+    else:
+        monkeypatch.setattr(json_codec, "orjson", None)
+    return request.param
+
+
+def _entries():
+    keyword = KeywordPatternDto(pattern="dragon", type="partial", weight=2.5)
+    dated = LorebookEntryDto(
+        id="e1",
+        title="巨龙",
+        content="远古的红龙",
+        keywords=[keyword],
+        activation_rule=ActivationRuleDto(type="keyword", keywords=[keyword], max_activations=3),
+        tags=["monster"],
+        last_activated_at=datetime(2024, 1, 2, 3, 4, 5, 678),
+        metadata={"level": 20},
+        created_at=datetime(2024, 1, 1),
+        updated_at=datetime(2024, 1, 2)
+    )
+    # 未设置任何时间字段，激活规则为共享的默认规则
+    undated = LorebookEntryDto(id="e2", title="t", content="c")
+    return [dated, undated]
+
+
+def _lorebook(**overrides):
+    values = dict(id="b1", name="图鉴", tags=["monsters"], entries=_entries())
+    values.update(overrides)
+    return LorebookDto(**values)
+
+
+def _response_dtos():
+    entries = _entries()
+    return [
+        entries[0].keywords[0],
+        entries[0].activation_rule,
+        entries[1].activation_rule,
+        *entries,
+        _lorebook(created_at=datetime(2024, 1, 1)),
+        _lorebook(),
+        LorebookListDto(lorebooks=[_lorebook(), _lorebook(updated_at=datetime(2024, 5, 6))], total_count=2),
+        LorebookExportDto(data={"name": "图鉴"}),
+        LorebookActivationResultDto(activated_entries=entries, total_candidates=5, activation_text="dragon"),
+        LorebookStatisticsDto.from_entries(entries, tags=["monsters"], version="1.2.0"),
+    ]
+
+
+@pytest.mark.parametrize("dto", _response_dtos(), ids=lambda dto: type(dto).__name__)
+def test_json_bytes_match_to_dict(codec, dto):
+    assert loads(dto.to_json_bytes()) == dto.to_dict()
+
+
+def test_none_timestamps_are_omitted(codec):
+    decoded = loads(_lorebook().to_json_bytes())
+
+    assert "created_at" not in decoded
+    assert "updated_at" not in decoded
+    assert "last_activated_at" not in decoded["entries"][1]
+    assert decoded["entries"][0]["last_activated_at"] == "2024-01-02T03:04:05.000678"
@@ -0,0 +1,60 @@
+"""
+传说书请求DTO测试
+
+未指定激活规则的创建请求共享默认规则，首次读取时复制为独立的可变实例。
+"""
+
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from src.domain.dtos.lorebook_dtos import (
+    ActivationRuleDto,
+    KeywordPatternDto,
+    LorebookEntryCreateDto,
+    LorebookEntryDto,
+)
+
+
+def test_default_rule_can_be_mutated_in_place():
+    dto = LorebookEntryCreateDto(title="巨龙", content="远古的红龙")
+
+    dto.activation_rule.keywords.append(KeywordPatternDto(pattern="dragon"))
+    dto.activation_rule.priority = 5
+
+    assert [k.pattern for k in dto.activation_rule.keywords] == ["dragon"]
+    assert dto.activation_rule.priority == 5
+    assert dto.validate() == []
+
+
+def test_default_rule_copies_are_not_shared():
+    first = LorebookEntryCreateDto(title="a", content="a")
+    second = LorebookEntryCreateDto(title="b", content="b")
+
+    first.activation_rule.keywords.append(KeywordPatternDto(pattern="x"))
+
+    assert second.activation_rule.keywords == []
+    assert first.activation_rule is not second.activation_rule
+
+
+def test_validation_reports_missing_keywords_for_default_rule():
+    dto = LorebookEntryCreateDto(title="a", content="a")
+
+    assert dto.validate() == ["关键词或正则激活类型必须指定关键词"]
+    assert not dto.is_valid()
+
+
+def test_explicit_rule_is_kept():
+    rule = ActivationRuleDto(type="always")
+    dto = LorebookEntryCreateDto(title="a", content="a", activation_rule=rule)
+
+    assert dto.activation_rule is rule
+    assert dto == LorebookEntryCreateDto(title="a", content="a", activation_rule=ActivationRuleDto(type="always"))
+
+
+def test_entry_dto_default_rule_stays_frozen():
+    entry = LorebookEntryDto(id="e", title="t", content="c")
+
+    with pytest.raises(FrozenInstanceError):
+        entry.activation_rule.priority = 1
+    assert entry.activation_rule == ActivationRuleDto()
@@ -0,0 +1,76 @@
+"""
+传说书msgspec结构体测试
+
+验证DTO → 结构体 → JSON字节 → DTO的往返一致性。
+"""
+
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("msgspec")
+
+from src.domain.dtos.lorebook_dtos import (
+    ActivationRuleDto,
+    KeywordPatternDto,
+    LorebookDto,
+    LorebookEntryDto,
+)
+from src.domain.dtos.lorebook_structs import decode_lorebook, encode_lorebook, from_dto, to_dto
+
+
+def _make_lorebook() -> LorebookDto:
+    keyword = KeywordPatternDto(pattern="dragon", type="partial", case_sensitive=True, weight=2.0)
+    entry = LorebookEntryDto(
+        id="entry-1",
+        title="巨龙",
+        content="远古的红龙",
+        keywords=[keyword],
+        activation_rule=ActivationRuleDto(
+            type="keyword",
+            keywords=[keyword],
+            priority=3,
+            max_activations=5,
+            cooldown_seconds=30
+        ),
+        tags=["monster", "boss"],
+        activation_count=2,
+        last_activated_at=datetime(2024, 1, 2, 3, 4, 5),
+        metadata={"source": "test", "level": 20},
+        created_at=datetime(2024, 1, 1, 0, 0, 0),
+        updated_at=datetime(2024, 1, 2, 0, 0, 0)
+    )
+    return LorebookDto(
+        id="book-1",
+        name="怪物图鉴",
+        description="测试用传说书",
+        version="1.2.0",
+        tags=["monsters"],
+        metadata={"author": "tester"},
+        entries=[entry],
+        created_at=datetime(2024, 1, 1, 0, 0, 0),
+        updated_at=datetime(2024, 1, 2, 0, 0, 0)
+    )
+
+
+def test_struct_round_trip():
+    lorebook = _make_lorebook()
+
+    assert to_dto(from_dto(lorebook)) == lorebook
+
+
+def test_bytes_round_trip():
+    lorebook = _make_lorebook()
+
+    raw = encode_lorebook(lorebook)
+
+    assert isinstance(raw, bytes)
+    assert decode_lorebook(raw) == lorebook
+
+
+def test_decode_applies_defaults():
+    decoded = decode_lorebook(b'{"id": "b", "name": "n", "entries": [{"id": "e", "title": "t", "content": "c"}]}')
+
+    assert decoded.version == "1.0.0"
+    assert decoded.entries[0].activation_rule.type == "keyword"
+    assert decoded.entries[0].is_active is True
@@ -0,0 +1,123 @@
+"""
+提示响应DTO的JSON序列化测试
+
+每个提示响应DTO的to_json_bytes解析后都应与to_dict一致，分别覆盖
+orjson与标准库json两条路径。
+"""
+
+from datetime import datetime
+
+import pytest
+
+from src.domain.dtos import json_codec
+from src.domain.dtos.json_codec import loads
+from src.domain.dtos.prompt_dtos import (
+    PromptContextDto,
+    PromptExportDto,
+    PromptFormat,
+    PromptPreviewDto,
+    PromptSectionDto,
+    PromptStatisticsDto,
+    PromptTemplateDto,
+    PromptTemplateListDto,
+    PromptTokenCountResponseDto,
+)
+from src.domain.models.prompt import LLMProvider, PromptSectionType
+
+
+@pytest.fixture(params=["orjson", "json"])
+def codec(request, monkeypatch):
+    if request.param == "orjson":
+        if json_codec.orjson is None:
+            pytest.skip("未安装orjson")
+    else:
+        monkeypatch.setattr(json_codec, "orjson", None)
+    return request.param
+
+
+def _template(**overrides):
+    values = dict(
+        id="t1",
+        name="默认模板",
+        description="测试模板",
+        sections=[{"content": "你是{{name}}", "section_type": "system", "priority": 1}],
+        variables=["name"],
+        metadata={"author": "tester"}
+    )
+    values.update(overrides)
+    return PromptTemplateDto(**values)
+
+
+def _sections():
+    return [
+        PromptSectionDto(content="系统指令", section_type=PromptSectionType.SYSTEM, priority=2, token_count=4),
+        PromptSectionDto(content="自定义段落", metadata={"source": "lorebook"}),
+    ]
+
+
+def _response_dtos():
+    return [
+        _template(),
+        _template(created_at=datetime(2024, 1, 1), updated_at=None),
+        _template(created_at=datetime(2024, 1, 1), updated_at=datetime(2024, 1, 2, 3, 4, 5, 6)),
+        PromptTemplateListDto(templates=[_template(), _template(created_at=datetime(2024, 1, 1))], total_count=2),
+        *_sections(),
+        PromptContextDto(
+            character_name="艾琳",
+            chat_history=[{"role": "user", "content": "你好"}],
+            variables={"mood": "happy"}
+        ),
+        PromptPreviewDto(
+            prompt="系统指令\n自定义段落",
+            token_count=8,
+            sections=_sections(),
+            variables_used={"name": "艾琳"},
+            missing_variables=["mood"],
+            truncation_applied=True,
+            build_time_ms=3
+        ),
+        PromptStatisticsDto(
+            template_id="t1",
+            template_name="默认模板",
+            total_sections=2,
+            total_tokens=8,
+            sections_by_type={"system": 1, "custom": 1},
+            tokens_by_type={"system": 4, "custom": 4},
+            variable_count=1,
+            average_section_tokens=4.0,
+            largest_section={"content": "系统指令", "token_count": 4}
+        ),
+        PromptStatisticsDto(
+            template_id="t1",
+            template_name="默认模板",
+            total_sections=0,
+            total_tokens=0,
+            sections_by_type={},
+            tokens_by_type={},
+            variable_count=0,
+            average_section_tokens=0.0,
+            largest_section={},
+            created_at=datetime(2024, 1, 1),
+            last_used=datetime(2024, 2, 1)
+        ),
+        PromptTokenCountResponseDto(
+            token_count=8,
+            character_count=12,
+            provider=LLMProvider.ANTHROPIC,
+            model_name="test-model",
+            calculation_time_ms=1
+        ),
+        PromptExportDto(data={"name": "默认模板"}, format=PromptFormat.TEXT, filename="template.txt"),
+    ]
+
+
+@pytest.mark.parametrize("dto", _response_dtos(), ids=lambda dto: type(dto).__name__)
+def test_json_bytes_match_to_dict(codec, dto):
+    assert loads(dto.to_json_bytes()) == dto.to_dict()
+
+
+def test_template_without_timestamps_has_no_null_keys(codec):
+    decoded = loads(_template().to_json_bytes())
+
+    assert "created_at" not in decoded
+    assert "updated_at" not in decoded